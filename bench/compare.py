@@ -0,0 +1,120 @@
+"""Diff two ``bench.store`` result files, typically from two commits.
+
+Run from the repository root::
+
+    git checkout main && python -m bench.store --json base.json
+    git checkout my-branch && python -m bench.store --json head.json
+    python -m bench.compare base.json head.json --threshold 10 --fail-on-regression
+
+Every (rows, operation) pair found in both files gets one line. The line shows
+the cold and warm throughput change and the change in net allocations per
+operation. A throughput drop, or an allocation increase, larger than
+``--threshold`` percent is marked as a regression. Allocation changes under
+``--min-alloc-bytes`` are treated as noise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bench.store import FORMAT_VERSION
+
+Key = Tuple[int, str]
+
+
+def load(path: Path) -> Dict[str, Any]:
+    report = json.loads(path.read_text())
+    if report.get("format") != FORMAT_VERSION:
+        raise SystemExit(f"{path} is not a bench.store result file of format {FORMAT_VERSION}")
+    return report
+
+
+def _change(before: float, after: float) -> Optional[float]:
+    if not before:
+        return None
+    return (after - before) / before * 100
+
+
+def _format_change(change: Optional[float]) -> str:
+    return "     n/a" if change is None else f"{change:+7.1f}%"
+
+
+def compare(
+    base: Dict[str, Any], head: Dict[str, Any], *, threshold: float, min_alloc_bytes: float
+) -> Tuple[List[str], List[str]]:
+    """Return the report lines and a description of every regression."""
+
+    base_results: Dict[Key, Dict[str, Any]] = {(entry["rows"], entry["operation"]): entry for entry in base["results"]}
+    lines = [
+        f"base {base.get('commit') or 'unknown'} -> head {head.get('commit') or 'unknown'}",
+        "",
+        f"{'rows':>10} {'operation':<24}{'cold ops/s':>22}{'warm ops/s':>22}{'net B/op':>20}",
+    ]
+    regressions: List[str] = []
+    for entry in head["results"]:
+        key = (entry["rows"], entry["operation"])
+        before = base_results.get(key)
+        if before is None:
+            continue
+        columns = []
+        for phase in ("cold", "warm"):
+            change = _change(before[phase]["ops_per_sec"], entry[phase]["ops_per_sec"])
+            columns.append(f"{entry[phase]['ops_per_sec']:>12.1f} {_format_change(change)}")
+            if change is not None and change < -threshold:
+                regressions.append(f"{key[1]} at {key[0]} rows: {phase} throughput {change:+.1f}%")
+        alloc_before = before["allocations"]["net_bytes_per_op"]
+        alloc_after = entry["allocations"]["net_bytes_per_op"]
+        alloc_change = _change(alloc_before, alloc_after)
+        columns.append(f"{alloc_after:>10.1f} {_format_change(alloc_change)}")
+        if (
+            alloc_change is not None
+            and alloc_change > threshold
+            and alloc_after - alloc_before > min_alloc_bytes
+        ):
+            regressions.append(f"{key[1]} at {key[0]} rows: net allocations {alloc_change:+.1f}%")
+        lines.append(f"{key[0]:>10} {key[1]:<24}{''.join(f'{column:>22}' for column in columns[:2])}{columns[2]:>20}")
+
+    if base.get("parameters") != head.get("parameters"):
+        lines.append("")
+        lines.append(f"warning: parameters differ: {base.get('parameters')} vs {head.get('parameters')}")
+    if base.get("environment") != head.get("environment"):
+        lines.append(f"warning: environments differ: {base.get('environment')} vs {head.get('environment')}")
+    return lines, regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base", type=Path, help="results of the baseline commit")
+    parser.add_argument("head", type=Path, help="results of the commit under test")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="percent change counted as a regression (default: 10)"
+    )
+    parser.add_argument(
+        "--min-alloc-bytes",
+        type=float,
+        default=64.0,
+        help="ignore allocation increases below this many bytes per operation (default: 64)",
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="exit with status 1 when a regression is found"
+    )
+    args = parser.parse_args(argv)
+
+    lines, regressions = compare(
+        load(args.base), load(args.head), threshold=args.threshold, min_alloc_bytes=args.min_alloc_bytes
+    )
+    print("\n".join(lines))
+    if regressions:
+        print()
+        print(f"{len(regressions)} regression(s) beyond {args.threshold}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,401 @@
+"""End-to-end load generator that simulates plugin traffic against the API.
+
+Run from the repository root::
+
+    python -m bench.load --operations 5000 --concurrency 32 --mix post=40,get=40,list=15,approve=5
+
+The app from :func:`bot.server.create_app` is served by uvicorn on a free
+local port. It runs against a fresh database, seeded with ``--preload``
+pending requests. A :class:`~bot.wallet.DummyWalletClient` handles payouts,
+with no latency unless ``--wallet-latency`` is given. Discord is replaced by
+a stub listener that attaches a fake message id to every delivered batch, as
+the bot does after posting. The API has no approve route, so approvals call
+:meth:`~bot.manager.WithdrawalManager.enqueue_approval` directly. That is the
+same call the Discord approve button makes.
+
+``--seed`` fixes the operation schedule, the payloads and the ids that are
+polled and approved. Polls and approvals target preloaded rows, so the
+schedule does not depend on the order in which requests complete. Two runs
+with the same flags issue identical traffic. Only the timings differ.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import os
+import random
+import socket
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from bot.manager import WithdrawalManager
+from bot.models import WithdrawalRequest
+from bot.server import WithdrawalServer, create_app
+from bot.storage import WithdrawalStore
+from bot.wallet import DummyWalletClient
+
+OPERATIONS = ("post", "get", "list", "approve")
+PERCENTILES = (50, 95, 99)
+_PRELOAD_CHUNK = 1000
+
+Operation = Tuple[str, Any]
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """Latencies in seconds and the error count of one operation kind."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+        result: Dict[str, Any] = {
+            "count": len(ordered),
+            "errors": self.errors,
+            "ops_per_sec": round(len(ordered) / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        for percentile in PERCENTILES:
+            result[f"p{percentile}_ms"] = round(_percentile(ordered, percentile) * 1000, 3)
+        result["mean_ms"] = round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0
+        return result
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix: Dict[str, int] = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        try:
+            mix[name] = int(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"weight of {name!r} must be an integer") from None
+        if mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"weight of {name!r} must not be negative")
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("at least one operation needs a positive weight")
+    return mix
+
+
+def make_payload(rng: random.Random) -> Dict[str, Any]:
+    """A withdrawal shaped like what the Minecraft plugin submits."""
+
+    return {
+        "player_name": f"player{rng.randrange(100_000)}",
+        "player_uuid": f"{rng.getrandbits(128):032x}",
+        "wallet_address": f"0x{rng.getrandbits(160):040x}",
+        "amount": str(Decimal(rng.randrange(1, 10_000_000)) / Decimal(1000)),
+        "currency": rng.choice(["PLS", "BTC", "ETH"]),
+        "metadata": {"server": rng.choice(["survival", "skyblock"]), "reason": "payout"},
+    }
+
+
+def build_schedule(mix: Dict[str, int], operations: int, preloaded: int, seed: int) -> List[Operation]:
+    """Draw the full sequence of operations and their arguments up front."""
+
+    rng = random.Random(seed)
+    names = [name for name in OPERATIONS if mix.get(name)]
+    kinds = rng.choices(names, weights=[mix[name] for name in names], k=operations)
+    approvable = list(range(1, preloaded + 1))
+    rng.shuffle(approvable)
+    if kinds.count("approve") > len(approvable):
+        raise SystemExit(
+            f"{kinds.count('approve')} approvals scheduled but only {len(approvable)} "
+            "requests preloaded; raise --preload"
+        )
+    if preloaded == 0 and "get" in kinds:
+        raise SystemExit("GET polling needs preloaded requests; raise --preload")
+
+    schedule: List[Operation] = []
+    for kind in kinds:
+        if kind == "post":
+            schedule.append((kind, make_payload(rng)))
+        elif kind == "get":
+            schedule.append((kind, rng.randint(1, preloaded)))
+        elif kind == "list":
+            params = {"limit": "50"}
+            status = rng.choice([None, "pending", "processing", "approved"])
+            if status is not None:
+                params["status"] = status
+            schedule.append((kind, params))
+        else:
+            schedule.append((kind, approvable.pop()))
+    return schedule
+
+
+class StubDiscordListener:
+    """Stand-in for the Discord bot: "posts" each batch by attaching a message id."""
+
+    def __init__(self, manager: WithdrawalManager) -> None:
+        self._manager = manager
+        self._next_message_id = 1
+        self.delivered = 0
+
+    async def __call__(self, requests: List[WithdrawalRequest]) -> None:
+        message_id = self._next_message_id
+        self._next_message_id += 1
+        await self._manager.attach_digest([request.id for request in requests if request.id is not None], message_id)
+        self.delivered += len(requests)
+
+
+async def preload(store: WithdrawalStore, count: int, seed: int) -> None:
+    """Insert ``count`` pending requests and clear their notification outbox."""
+
+    rng = random.Random(f"{seed}-preload")
+    for start in range(0, count, _PRELOAD_CHUNK):
+        items = [make_payload(rng) for _ in range(min(_PRELOAD_CHUNK, count - start))]
+        for item in items:
+            item["amount"] = Decimal(item["amount"])
+        await store.create_requests_bulk(items)
+    while True:
+        entries = await store.pending_notifications(limit=_PRELOAD_CHUNK)
+        if not entries:
+            break
+        await store.complete_notifications([entry.id for entry in entries])
+
+
+def database_size(path: Path) -> int:
+    """Bytes on disk of the database including its WAL and shared-memory files."""
+
+    return sum(
+        candidate.stat().st_size
+        for candidate in (path, Path(f"{path}-wal"), Path(f"{path}-shm"))
+        if candidate.exists()
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_until_ready(session: aiohttp.ClientSession, base_url: str, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with session.get(f"{base_url}/health") as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientConnectionError:
+            pass
+        if time.monotonic() > deadline:
+            raise SystemExit("The API did not start in time")
+        await asyncio.sleep(0.05)
+
+
+async def run_operation(
+    session: aiohttp.ClientSession, base_url: str, manager: WithdrawalManager, operation: Operation
+) -> bool:
+    """Issue one operation and return whether it succeeded."""
+
+    kind, argument = operation
+    if kind == "approve":
+        try:
+            await manager.enqueue_approval(argument, admin_name="bench", admin_id=0)
+        except Exception:
+            return False
+        return True
+    if kind == "post":
+        request = session.post(f"{base_url}/withdrawals", json=argument)
+    elif kind == "get":
+        request = session.get(f"{base_url}/withdrawals/{argument}")
+    else:
+        request = session.get(f"{base_url}/withdrawals", params=argument)
+    async with request as response:
+        await response.read()
+        return response.status < 400
+
+
+async def drive(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    manager: WithdrawalManager,
+    schedule: List[Operation],
+    concurrency: int,
+) -> Tuple[Dict[str, OperationStats], float]:
+    stats = {name: OperationStats() for name in OPERATIONS}
+    pending: Iterator[Operation] = iter(schedule)
+
+    async def worker() -> None:
+        for operation in pending:
+            started = time.perf_counter()
+            try:
+                ok = await run_operation(session, base_url, manager, operation)
+            except aiohttp.ClientError:
+                ok = False
+            elapsed = time.perf_counter() - started
+            entry = stats[operation[0]]
+            entry.latencies.append(elapsed)
+            if not ok:
+                entry.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    workdir = Path(args.database_dir or tempfile.mkdtemp(prefix="withdrawal-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    database = workdir / "bench.db"
+    for suffix in ("", "-wal", "-shm"):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(f"{database}{suffix}")
+
+    schedule = build_schedule(args.mix, args.operations, args.preload, args.seed)
+    store = WithdrawalStore(str(database), reader_pool_size=args.readers)
+    wallet = DummyWalletClient(latency=args.wallet_latency)
+    manager = WithdrawalManager(store=store, wallet=wallet, payout_workers=args.payout_workers)
+    listener = StubDiscordListener(manager)
+    manager.add_batch_listener(listener)
+
+    await preload(store, args.preload, args.seed)
+    size_before = database_size(database)
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = WithdrawalServer(create_app(manager), host="127.0.0.1", port=port)
+    for name in ("uvicorn", "uvicorn.access", "uvicorn.error"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    await wallet.start()
+    await manager.start()
+    server_task = asyncio.create_task(server.serve(), name="bench-api")
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await _wait_until_ready(session, base_url)
+            stats, elapsed = await drive(session, base_url, manager, schedule, args.concurrency)
+    finally:
+        await server.shutdown()
+        with contextlib.suppress(asyncio.CancelledError):
+            await server_task
+        await manager.stop()
+        await wallet.close()
+        await store.cleanup()
+
+    size_after = database_size(database)
+    created = len(stats["post"].latencies) - stats["post"].errors
+    completed = sum(len(entry.latencies) for entry in stats.values())
+    return {
+        "parameters": {
+            "operations": args.operations,
+            "concurrency": args.concurrency,
+            "mix": args.mix,
+            "seed": args.seed,
+            "preload": args.preload,
+            "wallet_latency": args.wallet_latency,
+            "readers": args.readers,
+            "payout_workers": args.payout_workers,
+        },
+        "environment": {
+            "python": sys.version.split()[0],
+            "sqlite": sqlite3.sqlite_version,
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "ops_per_sec": round(completed / elapsed, 1) if elapsed > 0 else 0.0,
+        "operations": {name: entry.summary(elapsed) for name, entry in stats.items() if entry.latencies},
+        "notifications_delivered": listener.delivered,
+        "database": {
+            "bytes_before": size_before,
+            "bytes_after": size_after,
+            "growth_bytes": size_after - size_before,
+            "growth_bytes_per_created_row": round((size_after - size_before) / created, 1) if created else None,
+        },
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    parameters = result["parameters"]
+    print(
+        f"{parameters['operations']} operations, concurrency {parameters['concurrency']}, "
+        f"seed {parameters['seed']}, {parameters['preload']} preloaded rows"
+    )
+    print(f"elapsed {result['elapsed_seconds']:.2f}s, {result['ops_per_sec']:.1f} ops/s overall")
+    print()
+    print(f"{'operation':<10}{'count':>8}{'errors':>8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, summary in result["operations"].items():
+        print(
+            f"{name:<10}{summary['count']:>8}{summary['errors']:>8}{summary['ops_per_sec']:>10.1f}"
+            f"{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}"
+        )
+    database = result["database"]
+    print()
+    print(
+        f"database {database['bytes_before'] / 1024:.0f} KiB -> {database['bytes_after'] / 1024:.0f} KiB "
+        f"(+{database['growth_bytes'] / 1024:.0f} KiB"
+        + (
+            f", {database['growth_bytes_per_created_row']:.0f} B per created row)"
+            if database["growth_bytes_per_created_row"] is not None
+            else ")"
+        )
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=5000, help="total operations to issue (default: 5000)")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent clients (default: 32)")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix("post=40,get=40,list=15,approve=5"),
+        help="operation weights (default: post=40,get=40,list=15,approve=5)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="seed for the schedule and payloads (default: 1)")
+    parser.add_argument("--preload", type=int, default=10_000, help="pending requests created up front (default: 10000)")
+    parser.add_argument(
+        "--wallet-latency", type=float, default=0.0, help="simulated seconds per wallet transfer (default: 0)"
+    )
+    parser.add_argument("--readers", type=int, default=4, help="store reader connections (default: 4)")
+    parser.add_argument("--payout-workers", type=int, default=4, help="payout worker tasks (default: 4)")
+    parser.add_argument("--database-dir", help="directory for the benchmark database (default: a new temp dir)")
+    parser.add_argument("--json", type=Path, help="also write the results to this JSON file")
+    parser.add_argument(
+        "--max-p99-ms", type=float, help="exit with status 1 if any operation's p99 latency exceeds this"
+    )
+    args = parser.parse_args(argv)
+    if args.operations < 1 or args.concurrency < 1 or args.preload < 0:
+        parser.error("--operations and --concurrency must be positive and --preload not negative")
+
+    logging.basicConfig(level=logging.WARNING)
+    result = asyncio.run(run(args))
+    print_report(result)
+    if args.json is not None:
+        args.json.write_text(json.dumps(result, indent=2) + "\n")
+
+    if args.max_p99_ms is not None:
+        slow = [name for name, summary in result["operations"].items() if summary["p99_ms"] > args.max_p99_ms]
+        if slow:
+            print(f"p99 above {args.max_p99_ms} ms for: {', '.join(slow)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
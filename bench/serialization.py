@@ -0,0 +1,106 @@
+"""Compare the per-row cost of the pydantic and the direct JSON response paths.
+
+Run from the repository root::
+
+    python -m bench.serialization --rows 200 --repeat 200
+
+The pydantic path reproduces what FastAPI did before: ``to_api_dict`` into
+``WithdrawalResponse``, the list model, response-model validation,
+``jsonable_encoder`` and ``json.dumps``. The direct path is what the API now
+returns through :class:`bot.serialization.FastJSONResponse`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from bot.models import WithdrawalRequest, WithdrawalStatus
+from bot.serialization import dumps_request_list
+from bot.server import WithdrawalListResponse, WithdrawalResponse
+
+# FastAPI builds this once per route, so it is kept out of the timed path.
+_LIST_FIELD = create_response_field(name="list_response", type_=WithdrawalListResponse)
+
+
+def make_requests(count: int, seed: int) -> List[WithdrawalRequest]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    requests = []
+    for index in range(count):
+        created = start + timedelta(seconds=rng.randrange(10_000_000))
+        status = rng.choice(list(WithdrawalStatus))
+        requests.append(
+            WithdrawalRequest(
+                id=index + 1,
+                player_name=f"player{rng.randrange(100_000)}",
+                player_uuid=f"{rng.getrandbits(128):032x}",
+                wallet_address=f"0x{rng.getrandbits(160):040x}",
+                amount=Decimal(rng.randrange(1, 10_000_000)) / Decimal(1000),
+                currency=rng.choice(["PLS", "BTC", "ETH"]),
+                status=status,
+                created_at=created,
+                updated_at=created,
+                metadata={"server": rng.choice(["survival", "skyblock"]), "reason": "payout"},
+                transaction_id=f"0x{rng.getrandbits(256):064x}" if status is WithdrawalStatus.APPROVED else None,
+                failure_reason="wallet offline" if status is WithdrawalStatus.FAILED else None,
+            )
+        )
+    return requests
+
+
+async def pydantic_path(requests: List[WithdrawalRequest]) -> bytes:
+    model = WithdrawalListResponse(
+        withdrawals=[WithdrawalResponse.from_request(request) for request in requests],
+        next_cursor=None,
+    )
+    content = await serialize_response(field=_LIST_FIELD, response_content=model)
+    return JSONResponse(content).body
+
+
+async def direct_path(requests: List[WithdrawalRequest]) -> bytes:
+    return dumps_request_list(requests, None)
+
+
+async def measure(path: Callable, requests: List[WithdrawalRequest], repeat: int) -> float:
+    """Return the best per-row time in microseconds over ``repeat`` runs."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await path(requests)
+        best = min(best, time.perf_counter() - started)
+    return best / len(requests) * 1_000_000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200, help="rows per response (default: 200)")
+    parser.add_argument("--repeat", type=int, default=200, help="timed runs per path (default: 200)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the generated rows")
+    args = parser.parse_args()
+
+    requests = make_requests(args.rows, args.seed)
+    if json.loads(await pydantic_path(requests)) != json.loads(await direct_path(requests)):
+        raise SystemExit("The two paths produce different JSON")
+
+    before = await measure(pydantic_path, requests, args.repeat)
+    after = await measure(direct_path, requests, args.repeat)
+    print(f"rows per response: {args.rows}")
+    print(f"pydantic path:     {before:8.2f} us/row")
+    print(f"direct path:       {after:8.2f} us/row")
+    print(f"speed-up:          {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,479 @@
+"""Micro-benchmarks of WithdrawalStore operations at realistic table sizes.
+
+Run from the repository root::
+
+    python -m bench.store --rows 10000,100000,1000000 --ops 1000 --json results.json
+    python -m bench.compare base.json results.json
+
+For each size a database is bulk-seeded once, straight through sqlite3. The
+seeder drops the indexes, inserts the rows in a single transaction with the
+journal off, and then rebuilds the indexes. The seeded database is cached in
+``--cache-dir`` and copied for every run, so repeated runs start from
+identical files. About a quarter of the seeded rows are pending. Their ids
+are shuffled with ``--seed`` and handed out to the transitions, so no two
+operations touch the same row.
+
+Every operation is timed in two phases, one after the other:
+
+* ``cold``: the store is reopened with fresh connections, after the database
+  files are dropped from the OS page cache with ``posix_fadvise``. On
+  platforms without it only SQLite's own page cache starts empty.
+* ``warm``: the same reads are repeated, or the next batch of writes is run,
+  on the now warm store.
+
+The request cache is disabled, so ``get_request`` measures the SQL path. The
+commit window defaults to zero, so sequential writes do not wait for a group
+commit. A third, untimed pass runs under ``tracemalloc``. It records the peak
+and the net memory allocated per operation, which makes growing allocations
+or leaks visible between commits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bot.models import WithdrawalStatus
+from bot.storage import WithdrawalStore
+
+FORMAT_VERSION = 1
+LIST_PAGE_SIZE = 50
+_SEED_BATCH = 50_000
+# Status mix of the seeded rows; weights sum to 100.
+_STATUS_WEIGHTS = (
+    (WithdrawalStatus.PENDING, 25),
+    (WithdrawalStatus.PROCESSING, 1),
+    (WithdrawalStatus.APPROVED, 60),
+    (WithdrawalStatus.REJECTED, 10),
+    (WithdrawalStatus.FAILED, 4),
+)
+_COLUMNS = (
+    "player_name, player_uuid, wallet_address, amount, currency, status, created_at, updated_at, "
+    "metadata, discord_message_id, approved_by, approved_by_id, transaction_id, failure_reason"
+)
+
+StoreOperation = Callable[[WithdrawalStore], Awaitable[object]]
+
+
+# Seeding -------------------------------------------------------------------
+
+
+def _generate_rows(count: int, seed: int) -> Iterator[Tuple[Any, ...]]:
+    rng = random.Random(seed)
+    statuses = [status for status, weight in _STATUS_WEIGHTS for _ in range(weight)]
+    started = datetime(2023, 1, 1)
+    # Spread the rows over roughly two years, oldest first like real traffic.
+    step = max(63_072_000 // max(count, 1), 1)
+    for index in range(count):
+        status = statuses[rng.randrange(100)]
+        created = (started + timedelta(seconds=index * step)).isoformat()
+        decided = status not in (WithdrawalStatus.PENDING, WithdrawalStatus.PROCESSING)
+        yield (
+            f"player{rng.randrange(100_000)}",
+            f"{rng.getrandbits(128):032x}",
+            f"0x{rng.getrandbits(160):040x}",
+            str(Decimal(rng.randrange(1, 10_000_000)) / Decimal(1000)),
+            ("PLS", "BTC", "ETH")[rng.randrange(3)],
+            status.value,
+            created,
+            created,
+            '{"server": "survival", "reason": "payout"}',
+            index // 10 + 1 if status is not WithdrawalStatus.PENDING else None,
+            "admin" if decided else None,
+            1 if decided else None,
+            f"0x{rng.getrandbits(256):064x}" if status is WithdrawalStatus.APPROVED else None,
+            "wallet offline" if status is WithdrawalStatus.FAILED else None,
+        )
+
+
+def seed_database(path: Path, rows: int, seed: int) -> None:
+    """Create the schema through the store, then bulk-insert ``rows`` rows."""
+
+    store = WithdrawalStore(str(path), reader_pool_size=0, slow_query_threshold=0)
+    asyncio.run(store.cleanup())
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'withdrawals' AND sql IS NOT NULL"
+        ).fetchall()
+        conn.execute("BEGIN")
+        for name, _ in indexes:
+            conn.execute(f"DROP INDEX {name}")
+        generated = _generate_rows(rows, seed)
+        placeholders = ", ".join("?" * len(_COLUMNS.split(", ")))
+        while True:
+            batch = [row for _, row in zip(range(_SEED_BATCH), generated)]
+            if not batch:
+                break
+            conn.executemany(f"INSERT INTO withdrawals ({_COLUMNS}) VALUES ({placeholders})", batch)
+        for _, sql in indexes:
+            conn.execute(sql)
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
+def seeded_copy(cache_dir: Path, workdir: Path, rows: int, seed: int) -> Tuple[Path, float]:
+    """Return a fresh copy of the seeded database and the seconds spent seeding."""
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached = cache_dir / f"withdrawals-{rows}-seed{seed}.db"
+    seconds = 0.0
+    if not cached.exists():
+        partial = cached.with_suffix(".partial")
+        partial.unlink(missing_ok=True)
+        started = time.perf_counter()
+        seed_database(partial, rows, seed)
+        seconds = time.perf_counter() - started
+        partial.rename(cached)
+    target = workdir / f"withdrawals-{rows}.db"
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{target}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(cached, target)
+    return target, seconds
+
+
+def evict_page_cache(path: Path) -> bool:
+    """Ask the OS to drop cached pages of the database files; ``False`` if unsupported."""
+
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for candidate in (path, Path(f"{path}-wal")):
+        if not candidate.exists():
+            continue
+        fd = os.open(candidate, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+# Workloads -----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class Workload:
+    """Operations of one benchmark: a cold batch, a warm batch and an allocation batch."""
+
+    name: str
+    cold: List[StoreOperation]
+    warm: List[StoreOperation]
+    allocations: List[StoreOperation]
+
+
+def _payload(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "player_name": f"player{rng.randrange(100_000)}",
+        "player_uuid": f"{rng.getrandbits(128):032x}",
+        "wallet_address": f"0x{rng.getrandbits(160):040x}",
+        "amount": Decimal(rng.randrange(1, 10_000_000)) / Decimal(1000),
+        "currency": rng.choice(["PLS", "BTC", "ETH"]),
+        "metadata": {"server": "survival", "reason": "payout"},
+    }
+
+
+def _list_cursors(path: Path, status: Optional[WithdrawalStatus], pages: int) -> List[Optional[str]]:
+    """Cursors of consecutive pages, wrapping around at the end of the table."""
+
+    async def collect() -> List[Optional[str]]:
+        store = WithdrawalStore(str(path), reader_pool_size=0, request_cache_size=0, slow_query_threshold=0)
+        cursors: List[Optional[str]] = []
+        cursor: Optional[str] = None
+        try:
+            for _ in range(pages):
+                cursors.append(cursor)
+                page = await store.list_page(status=status, limit=LIST_PAGE_SIZE, cursor=cursor)
+                cursor = page.next_cursor
+        finally:
+            await store.cleanup()
+        return cursors
+
+    return asyncio.run(collect())
+
+
+def build_workloads(path: Path, rows: int, ops: int, seed: int) -> Tuple[List[Workload], int]:
+    """Prepare every workload for one database; returns them and the ops per phase.
+
+    Transitions each need distinct rows in the right state, so ``ops`` is
+    reduced when the table has too few pending rows. Rows for
+    ``mark_approved`` and ``mark_failed`` are moved to ``processing`` here,
+    before anything is timed.
+    """
+
+    rng = random.Random(f"{seed}-{rows}")
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        pending = [row[0] for row in conn.execute("SELECT id FROM withdrawals WHERE status = 'pending' ORDER BY id")]
+        rng.shuffle(pending)
+        # Four transitions, each needing 2 * ops + ops // 10 rows.
+        ops = max(min(ops, int(len(pending) / (4 * 2.1))), 1)
+        alloc_ops = max(ops // 10, 1)
+        per_transition = 2 * ops + alloc_ops
+        if len(pending) < 4 * per_transition:
+            raise SystemExit(f"{rows} rows leave too few pending requests to benchmark transitions")
+        pools = [pending[index * per_transition : (index + 1) * per_transition] for index in range(4)]
+        to_processing = pools[1] + pools[3]
+        conn.execute("BEGIN")
+        conn.executemany("UPDATE withdrawals SET status = 'processing' WHERE id = ?", [(id_,) for id_ in to_processing])
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+    def split(operations: List[StoreOperation]) -> Tuple[List[StoreOperation], List[StoreOperation], List[StoreOperation]]:
+        return operations[:ops], operations[ops : 2 * ops], operations[2 * ops : 2 * ops + alloc_ops]
+
+    def repeat(operations: List[StoreOperation]) -> Tuple[List[StoreOperation], List[StoreOperation], List[StoreOperation]]:
+        # Reads repeat the cold batch so the warm phase hits the same pages.
+        return operations, list(operations), operations[:alloc_ops]
+
+    def get_request(request_id: int) -> StoreOperation:
+        return lambda store: store.get_request(request_id)
+
+    def list_page(status: Optional[WithdrawalStatus], cursor: Optional[str]) -> StoreOperation:
+        return lambda store: store.list_page(status=status, limit=LIST_PAGE_SIZE, cursor=cursor)
+
+    def create_request(payload: Dict[str, Any]) -> StoreOperation:
+        return lambda store: store.create_request(**payload)
+
+    def mark_processing(request_id: int) -> StoreOperation:
+        return lambda store: store.mark_processing(request_id)
+
+    def mark_approved(request_id: int) -> StoreOperation:
+        return lambda store: store.mark_approved(
+            request_id, admin_name="bench", admin_id=1, transaction_id=f"bench-{request_id}"
+        )
+
+    def mark_rejected(request_id: int) -> StoreOperation:
+        return lambda store: store.mark_rejected(request_id, admin_name="bench", admin_id=1, reason="bench")
+
+    def mark_failed(request_id: int) -> StoreOperation:
+        return lambda store: store.mark_failed(request_id, "bench")
+
+    lookups = [rng.randint(1, rows) for _ in range(ops)]
+    workloads = [
+        Workload("get_request", *repeat([get_request(request_id) for request_id in lookups])),
+        Workload(
+            "list_requests",
+            *repeat([list_page(None, cursor) for cursor in _list_cursors(path, None, ops)]),
+        ),
+        Workload(
+            "list_requests[pending]",
+            *repeat(
+                [
+                    list_page(WithdrawalStatus.PENDING, cursor)
+                    for cursor in _list_cursors(path, WithdrawalStatus.PENDING, ops)
+                ]
+            ),
+        ),
+        Workload("create_request", *split([create_request(_payload(rng)) for _ in range(2 * ops + alloc_ops)])),
+        Workload("mark_processing", *split([mark_processing(request_id) for request_id in pools[0]])),
+        Workload("mark_approved", *split([mark_approved(request_id) for request_id in pools[1]])),
+        Workload("mark_rejected", *split([mark_rejected(request_id) for request_id in pools[2]])),
+        Workload("mark_failed", *split([mark_failed(request_id) for request_id in pools[3]])),
+    ]
+    return workloads, ops
+
+
+# Measurement ---------------------------------------------------------------
+
+
+def _percentile(ordered: Sequence[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(percentile / 100 * len(ordered)), 1) - 1]
+
+
+async def _timed(store: WithdrawalStore, operations: List[StoreOperation]) -> Dict[str, float]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for operation in operations:
+        began = time.perf_counter()
+        await operation(store)
+        latencies.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "ops": len(operations),
+        "ops_per_sec": round(len(operations) / elapsed, 1),
+        "mean_us": round(elapsed / len(operations) * 1_000_000, 2),
+        "p50_us": round(_percentile(latencies, 50) * 1_000_000, 2),
+        "p99_us": round(_percentile(latencies, 99) * 1_000_000, 2),
+    }
+
+
+async def _allocations(store: WithdrawalStore, operations: List[StoreOperation]) -> Dict[str, float]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for operation in operations:
+            await operation(store)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "ops": len(operations),
+        "net_bytes_per_op": round((current - baseline) / len(operations), 1),
+        "net_blocks_per_op": round(blocks / len(operations), 2),
+        "peak_bytes": peak - baseline,
+    }
+
+
+def _open_store(path: Path, args: argparse.Namespace) -> WithdrawalStore:
+    return WithdrawalStore(
+        str(path),
+        reader_pool_size=args.readers,
+        commit_window=args.commit_window_ms / 1000,
+        request_cache_size=0,
+        slow_query_threshold=0,
+    )
+
+
+async def run_workload(path: Path, workload: Workload, args: argparse.Namespace) -> Tuple[Dict[str, Dict[str, float]], Dict[str, float], bool]:
+    evicted = evict_page_cache(path)
+    store = _open_store(path, args)
+    try:
+        phases = {
+            "cold": await _timed(store, workload.cold),
+            "warm": await _timed(store, workload.warm),
+        }
+        allocations = await _allocations(store, workload.allocations)
+    finally:
+        await store.cleanup()
+    return phases, allocations, evicted
+
+
+def benchmark_size(rows: int, args: argparse.Namespace, workdir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    path, seed_seconds = seeded_copy(args.cache_dir, workdir, rows, args.seed)
+    workloads, ops = build_workloads(path, rows, args.ops, args.seed)
+    size = {
+        "rows": rows,
+        "ops": ops,
+        "database_bytes": path.stat().st_size,
+        "seed_seconds": round(seed_seconds, 2) if seed_seconds else None,
+    }
+    results: List[Dict[str, Any]] = []
+    for workload in workloads:
+        phases, allocations, evicted = asyncio.run(run_workload(path, workload, args))
+        size["page_cache_evicted"] = evicted
+        results.append({"rows": rows, "operation": workload.name, **phases, "allocations": allocations})
+        print(
+            f"{rows:>10} {workload.name:<24} cold {phases['cold']['ops_per_sec']:>10.1f} ops/s"
+            f"  warm {phases['warm']['ops_per_sec']:>10.1f} ops/s"
+            f"  {allocations['net_bytes_per_op']:>9.1f} B/op net",
+            flush=True,
+        )
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+    return size, results
+
+
+def git_revision() -> Optional[str]:
+    """Short commit hash of the working tree, suffixed with ``-dirty`` if modified."""
+
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def _parse_rows(text: str) -> List[int]:
+    try:
+        rows = [int(part.replace("_", "")) for part in text.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("--rows takes comma-separated integers") from None
+    if not rows or min(rows) < 100:
+        raise argparse.ArgumentTypeError("every size must be at least 100 rows")
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=_parse_rows,
+        default=_parse_rows("10000,100000,1000000"),
+        help="comma-separated table sizes (default: 10000,100000,1000000; add 10000000 for the largest)",
+    )
+    parser.add_argument("--ops", type=int, default=1000, help="operations per phase (default: 1000)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the data and the chosen rows (default: 1)")
+    parser.add_argument("--readers", type=int, default=4, help="store reader connections (default: 4)")
+    parser.add_argument(
+        "--commit-window-ms", type=float, default=0.0, help="store group-commit window (default: 0)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "withdrawal-bench",
+        help="where seeded databases are kept between runs",
+    )
+    parser.add_argument("--json", type=Path, help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+    if args.ops < 1:
+        parser.error("--ops must be positive")
+
+    sizes: List[Dict[str, Any]] = []
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="withdrawal-bench-", dir=args.cache_dir.parent) as workdir:
+        for rows in args.rows:
+            size, size_results = benchmark_size(rows, args, Path(workdir))
+            sizes.append(size)
+            results.extend(size_results)
+
+    report = {
+        "format": FORMAT_VERSION,
+        "commit": git_revision(),
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "environment": {
+            "python": sys.version.split()[0],
+            "sqlite": sqlite3.sqlite_version,
+            "platform": sys.platform,
+        },
+        "parameters": {
+            "ops": args.ops,
+            "seed": args.seed,
+            "readers": args.readers,
+            "commit_window_ms": args.commit_window_ms,
+        },
+        "sizes": sizes,
+        "results": results,
+    }
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,15 @@ def _parse_int(value: str | None, *, default: Optional[int] = None) -> Optional[
         raise ValueError(f"Expected integer but received {value!r}") from exc
 
 
+def _parse_float(value: str | None, *, default: Optional[float] = None) -> Optional[float]:
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:  # pragma: no cover - defensive
+        raise ValueError(f"Expected number but received {value!r}") from exc
+
+
 def _parse_int_list(values: str | None) -> List[int]:
     if not values:
         return []
@@ -40,13 +49,33 @@ class Settings:
     withdrawal_channel_id: int
     admin_role_ids: List[int] = field(default_factory=list)
     guild_id: Optional[int] = None
+    discord_channel_rate_limit: int = 5
+    discord_channel_rate_window: float = 5.0
+    digest_window_seconds: float = 0.0
+    digest_threshold: int = 10
     api_host: str = "0.0.0.0"
     api_port: int = 8080
     database_path: str = "withdrawals.db"
+    database_readers: int = 4
+    database_commit_window_ms: float = 2.0
+    database_commit_batch: int = 64
+    idempotency_ttl_hours: float = 24.0
+    idempotency_cache_size: int = 1024
+    request_cache_size: int = 10000
+    database_slow_query_ms: float = 100.0
     log_level: str = "INFO"
+    payout_workers: int = 4
+    payout_queue_size: int = 1000
+    payout_batch_size: int = 50
+    transition_buffer_size: int = 10000
     wallet_provider: str = "auto"
     wallet_endpoint: Optional[str] = None
     wallet_api_key: Optional[str] = None
+    wallet_batch_endpoint: Optional[str] = None
+    wallet_pool_limit: int = 100
+    wallet_pool_limit_per_host: int = 20
+    wallet_keepalive_seconds: float = 30.0
+    wallet_dns_cache_ttl: int = 300
     piteas_api_url: Optional[str] = None
     piteas_api_key: Optional[str] = None
     piteas_project_id: Optional[str] = None
@@ -69,13 +98,73 @@ class Settings:
 
         admin_role_ids = _parse_int_list(os.getenv("ADMIN_ROLE_IDS"))
         guild_id = _parse_int(os.getenv("HOME_GUILD_ID"))
+        discord_channel_rate_limit = _parse_int(os.getenv("DISCORD_CHANNEL_RATE_LIMIT"), default=5)
+        if discord_channel_rate_limit is None or discord_channel_rate_limit < 1:
+            raise ValueError("DISCORD_CHANNEL_RATE_LIMIT must be a positive integer")
+        discord_channel_rate_window = _parse_float(os.getenv("DISCORD_CHANNEL_RATE_WINDOW"), default=5.0)
+        if discord_channel_rate_window is None or discord_channel_rate_window <= 0:
+            raise ValueError("DISCORD_CHANNEL_RATE_WINDOW must be a positive number")
+        digest_window_seconds = _parse_float(os.getenv("DIGEST_WINDOW_SECONDS"), default=0.0)
+        if digest_window_seconds is None or digest_window_seconds < 0:
+            raise ValueError("DIGEST_WINDOW_SECONDS must be zero or a positive number")
+        digest_threshold = _parse_int(os.getenv("DIGEST_THRESHOLD"), default=10)
+        if digest_threshold is None or digest_threshold < 2:
+            raise ValueError("DIGEST_THRESHOLD must be an integer of at least 2")
         api_host = os.getenv("API_HOST", "0.0.0.0")
         api_port = _parse_int(os.getenv("API_PORT"), default=8080) or 8080
         database_path = os.getenv("DATABASE_PATH", "withdrawals.db")
+        database_readers = _parse_int(os.getenv("DATABASE_READERS"), default=4)
+        if database_readers is None or database_readers < 0:
+            raise ValueError("DATABASE_READERS must be zero or a positive integer")
+        database_commit_window_ms = _parse_float(
+            os.getenv("DATABASE_COMMIT_WINDOW_MS"), default=2.0
+        )
+        if database_commit_window_ms is None or database_commit_window_ms < 0:
+            raise ValueError("DATABASE_COMMIT_WINDOW_MS must be zero or a positive number")
+        database_commit_batch = _parse_int(os.getenv("DATABASE_COMMIT_BATCH"), default=64)
+        if database_commit_batch is None or database_commit_batch < 1:
+            raise ValueError("DATABASE_COMMIT_BATCH must be a positive integer")
+        idempotency_ttl_hours = _parse_float(os.getenv("IDEMPOTENCY_TTL_HOURS"), default=24.0)
+        if idempotency_ttl_hours is None or idempotency_ttl_hours <= 0:
+            raise ValueError("IDEMPOTENCY_TTL_HOURS must be a positive number")
+        idempotency_cache_size = _parse_int(os.getenv("IDEMPOTENCY_CACHE_SIZE"), default=1024)
+        if idempotency_cache_size is None or idempotency_cache_size < 0:
+            raise ValueError("IDEMPOTENCY_CACHE_SIZE must be zero or a positive integer")
+        request_cache_size = _parse_int(os.getenv("REQUEST_CACHE_SIZE"), default=10000)
+        if request_cache_size is None or request_cache_size < 0:
+            raise ValueError("REQUEST_CACHE_SIZE must be zero or a positive integer")
+        database_slow_query_ms = _parse_float(os.getenv("DATABASE_SLOW_QUERY_MS"), default=100.0)
+        if database_slow_query_ms is None or database_slow_query_ms < 0:
+            raise ValueError("DATABASE_SLOW_QUERY_MS must be zero or a positive number")
         log_level = os.getenv("LOG_LEVEL", "INFO")
+        payout_workers = _parse_int(os.getenv("PAYOUT_WORKERS"), default=4)
+        if payout_workers is None or payout_workers < 1:
+            raise ValueError("PAYOUT_WORKERS must be a positive integer")
+        payout_queue_size = _parse_int(os.getenv("PAYOUT_QUEUE_SIZE"), default=1000)
+        if payout_queue_size is None or payout_queue_size < 1:
+            raise ValueError("PAYOUT_QUEUE_SIZE must be a positive integer")
+        payout_batch_size = _parse_int(os.getenv("PAYOUT_BATCH_SIZE"), default=50)
+        if payout_batch_size is None or payout_batch_size < 1:
+            raise ValueError("PAYOUT_BATCH_SIZE must be a positive integer")
+        transition_buffer_size = _parse_int(os.getenv("TRANSITION_BUFFER_SIZE"), default=10000)
+        if transition_buffer_size is None or transition_buffer_size < 1:
+            raise ValueError("TRANSITION_BUFFER_SIZE must be a positive integer")
         wallet_provider = os.getenv("WALLET_PROVIDER", "auto").strip().lower()
         wallet_endpoint = os.getenv("WALLET_ENDPOINT")
         wallet_api_key = os.getenv("WALLET_API_KEY")
+        wallet_batch_endpoint = os.getenv("WALLET_BATCH_ENDPOINT")
+        wallet_pool_limit = _parse_int(os.getenv("WALLET_POOL_LIMIT"), default=100)
+        if wallet_pool_limit is None or wallet_pool_limit < 1:
+            raise ValueError("WALLET_POOL_LIMIT must be a positive integer")
+        wallet_pool_limit_per_host = _parse_int(os.getenv("WALLET_POOL_LIMIT_PER_HOST"), default=20)
+        if wallet_pool_limit_per_host is None or wallet_pool_limit_per_host < 1:
+            raise ValueError("WALLET_POOL_LIMIT_PER_HOST must be a positive integer")
+        wallet_keepalive_seconds = _parse_float(os.getenv("WALLET_KEEPALIVE_SECONDS"), default=30.0)
+        if wallet_keepalive_seconds is None or wallet_keepalive_seconds <= 0:
+            raise ValueError("WALLET_KEEPALIVE_SECONDS must be a positive number")
+        wallet_dns_cache_ttl = _parse_int(os.getenv("WALLET_DNS_CACHE_TTL"), default=300)
+        if wallet_dns_cache_ttl is None or wallet_dns_cache_ttl < 1:
+            raise ValueError("WALLET_DNS_CACHE_TTL must be a positive integer")
         piteas_api_url = os.getenv("PITEAS_API_URL")
         piteas_api_key = os.getenv("PITEAS_API_KEY")
         piteas_project_id = os.getenv("PITEAS_PROJECT_ID")
@@ -113,13 +202,33 @@ class Settings:
             withdrawal_channel_id=withdrawal_channel_id,
             admin_role_ids=admin_role_ids,
             guild_id=guild_id,
+            discord_channel_rate_limit=discord_channel_rate_limit,
+            discord_channel_rate_window=discord_channel_rate_window,
+            digest_window_seconds=digest_window_seconds,
+            digest_threshold=digest_threshold,
             api_host=api_host,
             api_port=api_port,
             database_path=database_path,
+            database_readers=database_readers,
+            database_commit_window_ms=database_commit_window_ms,
+            database_commit_batch=database_commit_batch,
+            idempotency_ttl_hours=idempotency_ttl_hours,
+            idempotency_cache_size=idempotency_cache_size,
+            request_cache_size=request_cache_size,
+            database_slow_query_ms=database_slow_query_ms,
             log_level=log_level,
+            payout_workers=payout_workers,
+            payout_queue_size=payout_queue_size,
+            payout_batch_size=payout_batch_size,
+            transition_buffer_size=transition_buffer_size,
             wallet_provider=wallet_provider,
             wallet_endpoint=wallet_endpoint,
             wallet_api_key=wallet_api_key,
+            wallet_batch_endpoint=wallet_batch_endpoint,
+            wallet_pool_limit=wallet_pool_limit,
+            wallet_pool_limit_per_host=wallet_pool_limit_per_host,
+            wallet_keepalive_seconds=wallet_keepalive_seconds,
+            wallet_dns_cache_ttl=wallet_dns_cache_ttl,
             piteas_api_url=piteas_api_url,
             piteas_api_key=piteas_api_key,
             piteas_project_id=piteas_project_id,
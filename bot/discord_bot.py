@@ -2,18 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Sequence, Set
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
 from .config import Settings
-from .manager import WithdrawalManager, WithdrawalNotFoundError, WithdrawalStateError
-from .models import WithdrawalRequest, WithdrawalStatus
-from .wallet import WalletError
+from .manager import (
+    PayoutQueueFull,
+    WithdrawalManager,
+    WithdrawalNotFoundError,
+    WithdrawalStateError,
+)
+from .metrics import REGISTRY
+from .models import WithdrawalFilter, WithdrawalRequest, WithdrawalStatus
 
 _LOGGER = logging.getLogger(__name__)
 
+_DISCORD_SECONDS = REGISTRY.histogram(
+    "discord_api_seconds", "Latency of Discord message sends and edits", ("operation", "outcome")
+)
+_DISCORD_BACKLOG = REGISTRY.gauge("discord_outbound_backlog", "Discord sends and edits waiting for rate-limit capacity")
+_DISCORD_CHILDREN = {
+    (operation, outcome): _DISCORD_SECONDS.labels(operation, outcome)
+    for operation in ("send", "edit")
+    for outcome in ("ok", "rate_limited", "error")
+}
+
+
+def _observe_discord(operation: str, error: Optional[BaseException], started: float) -> None:
+    if error is None:
+        outcome = "ok"
+    elif isinstance(error, discord.HTTPException) and error.status == 429:
+        outcome = "rate_limited"
+    else:
+        outcome = "error"
+    _DISCORD_CHILDREN[operation, outcome].observe(time.perf_counter() - started)
+
 
 def build_request_embed(request: WithdrawalRequest) -> discord.Embed:
     """Render an embed describing a withdrawal request."""
@@ -50,91 +85,600 @@ def build_request_embed(request: WithdrawalRequest) -> discord.Embed:
     return embed
 
 
-class WithdrawalRequestView(discord.ui.View):
-    """Interactive controls for pending withdrawals."""
+class _ChannelBucket:
+    """Token bucket approximating Discord's per-channel message rate limit."""
+
+    def __init__(self, capacity: int, per: float) -> None:
+        self._capacity = float(capacity)
+        self._rate = capacity / per
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def delay(self) -> float:
+        """Seconds until a request may be made on this channel."""
+
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def consume(self) -> None:
+        self._tokens -= 1
+
+    def block(self, seconds: float) -> None:
+        self._tokens = 0.0
+        self._blocked_until = time.monotonic() + seconds
+
+
+class DispatcherStopped(RuntimeError):
+    """Raised for sends and edits that the stopped dispatcher will never deliver."""
+
+
+@dataclass(slots=True)
+class _PendingSend:
+    channel: discord.abc.Messageable
+    channel_id: int
+    kwargs: Dict[str, Any]
+    future: asyncio.Future[discord.Message]
+
+
+@dataclass(slots=True)
+class _PendingEdit:
+    message: discord.Message | discord.PartialMessage
+    kwargs: Dict[str, Any]
+    futures: List[asyncio.Future[None]] = field(default_factory=list)
+
+
+class MessageDispatcher:
+    """Serialise outbound channel sends and edits within the rate limit.
+
+    Edits to a message that is already queued are merged into the pending
+    edit, so only its latest state is sent. Edits (admin-visible state
+    changes) are always sent before new-request posts.
+    """
 
     def __init__(
         self,
         *,
-        manager: WithdrawalManager,
-        settings: Settings,
-        request_id: int,
+        rate_limit: int = 5,
+        rate_window: float = 5.0,
+        logger: Optional[logging.Logger] = None,
     ) -> None:
-        super().__init__(timeout=None)
-        self.manager = manager
-        self.settings = settings
-        self.request_id = request_id
+        self._rate_limit = rate_limit
+        self._rate_window = rate_window
+        self._buckets: Dict[int, _ChannelBucket] = {}
+        self._edits: "OrderedDict[int, _PendingEdit]" = OrderedDict()
+        self._sends: Deque[_PendingSend] = deque()
+        self._editing: set[int] = set()
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopped = False
+        self._logger = logger or _LOGGER
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user is None:
-            return False
-        if self._is_authorised(interaction.user):
+    @property
+    def backlog(self) -> int:
+        return len(self._edits) + len(self._sends)
+
+    def start(self) -> None:
+        if self._task is None:
+            _DISCORD_BACKLOG.set_function(lambda: self.backlog)
+            self._task = asyncio.create_task(self._run(), name="discord-dispatcher")
+
+    async def stop(self) -> None:
+        """Stop sending; queued and in-flight operations fail with :class:`DispatcherStopped`."""
+
+        self._stopped = True
+        task, self._task = self._task, None
+        operations = list(self._in_flight)
+        if task is not None:
+            operations.append(task)
+        for operation in operations:
+            operation.cancel()
+        await asyncio.gather(*operations, return_exceptions=True)
+        error = DispatcherStopped("The Discord dispatcher has been stopped")
+        for pending in self._edits.values():
+            self._finish(pending.futures, error)
+        self._edits.clear()
+        while self._sends:
+            future = self._sends.popleft().future
+            if not future.done():
+                future.set_exception(error)
+
+    def send(self, channel: discord.TextChannel | discord.Thread, **kwargs: Any) -> asyncio.Future[discord.Message]:
+        """Queue a new message; the future resolves to the sent message."""
+
+        future: asyncio.Future[discord.Message] = asyncio.get_running_loop().create_future()
+        if self._stopped:
+            future.set_exception(DispatcherStopped("The Discord dispatcher has been stopped"))
+            return future
+        self._sends.append(_PendingSend(channel, channel.id, kwargs, future))
+        self._wakeup.set()
+        return future
+
+    def edit(self, message: discord.Message | discord.PartialMessage, **kwargs: Any) -> asyncio.Future[None]:
+        """Queue an edit, merging it with any edit still waiting for ``message``."""
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if self._stopped:
+            future.set_exception(DispatcherStopped("The Discord dispatcher has been stopped"))
+            return future
+        pending = self._edits.get(message.id)
+        if pending is None:
+            pending = self._edits[message.id] = _PendingEdit(message, {})
+        pending.kwargs.update(kwargs)
+        pending.futures.append(future)
+        self._wakeup.set()
+        return future
+
+    def _bucket(self, channel_id: int) -> _ChannelBucket:
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._buckets[channel_id] = _ChannelBucket(self._rate_limit, self._rate_window)
+        return bucket
+
+    async def _run(self) -> None:
+        while True:
+            if not self.backlog:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            wait = self._dispatch_next()
+            if wait == 0:
+                continue
+            self._wakeup.clear()
+            if wait is None:
+                # Only edits to messages still being edited are queued; the
+                # in-flight edit sets the wakeup event when it finishes.
+                await self._wakeup.wait()
+                continue
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), wait)
+
+    def _dispatch_next(self) -> Optional[float]:
+        """Start the highest-priority operation whose channel has capacity.
+
+        Returns ``0`` once an operation was started, how long to wait for a
+        rate limit, or ``None`` when nothing can start until an in-flight
+        edit finishes.
+        """
+
+        wait: Optional[float] = None
+        for message_id, pending in list(self._edits.items()):
+            if message_id in self._editing:
+                # Keep edits to one message in order; retried when it finishes.
+                continue
+            bucket = self._bucket(pending.message.channel.id)
+            delay = bucket.delay()
+            if delay <= 0:
+                bucket.consume()
+                del self._edits[message_id]
+                self._editing.add(message_id)
+                self._spawn(self._apply_edit(pending))
+                return 0.0
+            wait = delay if wait is None else min(wait, delay)
+        for pending_send in list(self._sends):
+            bucket = self._bucket(pending_send.channel_id)
+            delay = bucket.delay()
+            if delay <= 0:
+                bucket.consume()
+                self._sends.remove(pending_send)
+                self._spawn(self._apply_send(pending_send))
+                return 0.0
+            wait = delay if wait is None else min(wait, delay)
+        return wait
+
+    def _spawn(self, operation: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(operation)
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _apply_edit(self, pending: _PendingEdit) -> None:
+        bucket = self._bucket(pending.message.channel.id)
+        started = time.perf_counter()
+        try:
+            await pending.message.edit(**pending.kwargs)
+        except asyncio.CancelledError:
+            self._finish(pending.futures, DispatcherStopped("The Discord dispatcher has been stopped"))
+            raise
+        except discord.HTTPException as exc:
+            _observe_discord("edit", exc, started)
+            if exc.status == 429:
+                bucket.block(self._rate_window)
+                merged = self._edits.setdefault(pending.message.id, _PendingEdit(pending.message, {}))
+                merged.kwargs = {**pending.kwargs, **merged.kwargs}
+                merged.futures[:0] = pending.futures
+                self._edits.move_to_end(pending.message.id, last=False)
+                self._wakeup.set()
+                return
+            self._finish(pending.futures, exc)
+        except Exception as exc:
+            _observe_discord("edit", exc, started)
+            self._finish(pending.futures, exc)
+        else:
+            _observe_discord("edit", None, started)
+            self._finish(pending.futures, None)
+        finally:
+            self._editing.discard(pending.message.id)
+            self._wakeup.set()
+
+    async def _apply_send(self, pending: _PendingSend) -> None:
+        bucket = self._bucket(pending.channel_id)
+        started = time.perf_counter()
+        try:
+            message = await pending.channel.send(**pending.kwargs)
+        except asyncio.CancelledError:
+            if not pending.future.done():
+                pending.future.set_exception(DispatcherStopped("The Discord dispatcher has been stopped"))
+            raise
+        except discord.HTTPException as exc:
+            _observe_discord("send", exc, started)
+            if exc.status == 429:
+                bucket.block(self._rate_window)
+                self._sends.appendleft(pending)
+                self._wakeup.set()
+                return
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+        except Exception as exc:
+            _observe_discord("send", exc, started)
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+        else:
+            _observe_discord("send", None, started)
+            if not pending.future.done():
+                pending.future.set_result(message)
+
+    @staticmethod
+    def _finish(futures: List[asyncio.Future[None]], error: Optional[BaseException]) -> None:
+        for future in futures:
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+
+def _is_authorised(settings: Settings, user: discord.abc.User) -> bool:
+    if isinstance(user, discord.Member):
+        if user.guild_permissions.administrator:
             return True
-        await interaction.response.send_message(
-            "You are not authorized to manage withdrawals.", ephemeral=True
-        )
-        return False
+        allowed_roles = set(settings.admin_role_ids)
+        if not allowed_roles:
+            return True
+        return any(role.id in allowed_roles for role in getattr(user, "roles", []))
+    return False
+
 
-    def _is_authorised(self, user: discord.abc.User) -> bool:
-        if isinstance(user, discord.Member):
-            if user.guild_permissions.administrator:
-                return True
-            allowed_roles = set(self.settings.admin_role_ids)
-            if not allowed_roles:
-                return True
-            return any(role.id in allowed_roles for role in getattr(user, "roles", []))
+async def _check_admin(interaction: discord.Interaction) -> bool:
+    bot = interaction.client
+    if interaction.user is None or not isinstance(bot, WithdrawalBot):
         return False
+    if _is_authorised(bot.settings, interaction.user):
+        return True
+    await interaction.response.send_message(
+        "You are not authorized to manage withdrawals.", ephemeral=True
+    )
+    return False
+
+
+class ApproveButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"withdrawal:approve:(?P<id>[0-9]+)",
+):
+    """Approve button whose custom id carries the request id.
+
+    Registered once with :meth:`discord.Client.add_dynamic_items`, it handles
+    clicks on every withdrawal message, including ones posted before a restart.
+    """
+
+    def __init__(self, request_id: int, *, disabled: bool = False) -> None:
+        super().__init__(
+            discord.ui.Button(
+                label="Approve",
+                style=discord.ButtonStyle.success,
+                custom_id=f"withdrawal:approve:{request_id}",
+                disabled=disabled,
+            )
+        )
+        self.request_id = request_id
+
+    @classmethod
+    async def from_custom_id(  # type: ignore[override]
+        cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str], /
+    ) -> "ApproveButton":
+        return cls(int(match["id"]))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await _check_admin(interaction)
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        bot = interaction.client
+        assert isinstance(bot, WithdrawalBot) and interaction.user is not None
+        # Acknowledge right away; the payout itself runs on the worker pool.
+        await interaction.response.defer()
+        message = interaction.message
+        shown = asyncio.Event()
+        handled = WithdrawalRequestView(request_id=self.request_id, disabled=True)
+
+        async def _on_complete(request: WithdrawalRequest) -> None:
+            await shown.wait()
+            if message is not None:
+                await bot.outbound.edit(message, embed=build_request_embed(request), view=handled)
 
-    @discord.ui.button(label="Approve", style=discord.ButtonStyle.success)
-    async def approve(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:  # type: ignore[override]
-        assert interaction.user is not None
-        self._disable_buttons()
         try:
-            request = await self.manager.approve_request(
+            request = await bot.manager.enqueue_approval(
                 self.request_id,
                 admin_name=str(interaction.user),
                 admin_id=getattr(interaction.user, "id", 0),
+                on_complete=_on_complete,
             )
-        except WithdrawalStateError as exc:
-            self._enable_buttons()
-            await interaction.response.send_message(str(exc), ephemeral=True)
-            return
-        except WalletError as exc:
-            self._enable_buttons()
-            await interaction.response.send_message(str(exc), ephemeral=True)
+        except (WithdrawalStateError, PayoutQueueFull) as exc:
+            await interaction.followup.send(str(exc), ephemeral=True)
             return
-        embed = build_request_embed(request)
-        await interaction.response.edit_message(embed=embed, view=self)
-        self.stop()
+        try:
+            await interaction.edit_original_response(embed=build_request_embed(request), view=handled)
+        finally:
+            shown.set()
 
-    @discord.ui.button(label="Reject", style=discord.ButtonStyle.danger)
-    async def reject(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:  # type: ignore[override]
-        assert interaction.user is not None
-        self._disable_buttons()
+
+class RejectButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"withdrawal:reject:(?P<id>[0-9]+)",
+):
+    """Reject button whose custom id carries the request id."""
+
+    def __init__(self, request_id: int, *, disabled: bool = False) -> None:
+        super().__init__(
+            discord.ui.Button(
+                label="Reject",
+                style=discord.ButtonStyle.danger,
+                custom_id=f"withdrawal:reject:{request_id}",
+                disabled=disabled,
+            )
+        )
+        self.request_id = request_id
+
+    @classmethod
+    async def from_custom_id(  # type: ignore[override]
+        cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str], /
+    ) -> "RejectButton":
+        return cls(int(match["id"]))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await _check_admin(interaction)
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        bot = interaction.client
+        assert isinstance(bot, WithdrawalBot) and interaction.user is not None
         try:
-            request = await self.manager.reject_request(
+            request = await bot.manager.reject_request(
                 self.request_id,
                 admin_name=str(interaction.user),
                 admin_id=getattr(interaction.user, "id", 0),
                 reason="Rejected by administrator",
             )
         except WithdrawalStateError as exc:
-            self._enable_buttons()
             await interaction.response.send_message(str(exc), ephemeral=True)
             return
         embed = build_request_embed(request)
-        await interaction.response.edit_message(embed=embed, view=self)
-        self.stop()
+        await interaction.response.edit_message(
+            embed=embed, view=WithdrawalRequestView(request_id=self.request_id, disabled=True)
+        )
+
+
+class WithdrawalRequestView(discord.ui.View):
+    """Approve/reject controls attached to a withdrawal message.
+
+    The view is only used to render the buttons; clicks are routed by the
+    dynamic items registered on the bot, so no per-request state is kept.
+    """
+
+    def __init__(self, *, request_id: int, disabled: bool = False) -> None:
+        super().__init__(timeout=None)
+        self.request_id = request_id
+        self.add_item(ApproveButton(request_id, disabled=disabled))
+        self.add_item(RejectButton(request_id, disabled=disabled))
+
+
+DIGEST_PAGE_SIZE = 10
+
+
+def build_digest_embed(requests: Sequence[WithdrawalRequest], page: int) -> discord.Embed:
+    """Render one page of a digest covering several withdrawal requests."""
+
+    page = _clamp_page(requests, page)
+    open_count = sum(
+        request.status in {WithdrawalStatus.PENDING, WithdrawalStatus.PROCESSING} for request in requests
+    )
+    embed = discord.Embed(
+        title=f"Withdrawal Digest ({len(requests)} requests)",
+        description=f"{open_count} awaiting a decision",
+        color=discord.Color.yellow() if open_count else discord.Color.green(),
+    )
+    start = page * DIGEST_PAGE_SIZE
+    for request in requests[start : start + DIGEST_PAGE_SIZE]:
+        value = f"{request.amount} {request.currency} to `{request.wallet_address}`\nStatus: {request.status.value.title()}"
+        if request.transaction_id:
+            value += f"\nTransaction: {request.transaction_id}"
+        if request.failure_reason:
+            value += f"\nReason: {request.failure_reason}"
+        embed.add_field(name=f"#{request.id} {request.player_name}", value=value, inline=False)
+    embed.set_footer(text=f"Page {page + 1}/{_page_count(requests)}")
+    return embed
+
+
+def _page_count(requests: Sequence[WithdrawalRequest]) -> int:
+    return max(1, -(-len(requests) // DIGEST_PAGE_SIZE))
+
+
+def _clamp_page(requests: Sequence[WithdrawalRequest], page: int) -> int:
+    return min(max(page, 0), _page_count(requests) - 1)
+
+
+class DigestPageButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"withdrawal:digest:page:(?P<page>[0-9]+):(?P<direction>prev|next)",
+):
+    """Previous/next controls of a digest message."""
+
+    def __init__(self, page: int, direction: str, *, disabled: bool = False) -> None:
+        super().__init__(
+            discord.ui.Button(
+                label="Previous" if direction == "prev" else "Next",
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"withdrawal:digest:page:{page}:{direction}",
+                disabled=disabled,
+            )
+        )
+        self.page = page
+
+    @classmethod
+    async def from_custom_id(  # type: ignore[override]
+        cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str], /
+    ) -> "DigestPageButton":
+        return cls(int(match["page"]), match["direction"])
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await _check_admin(interaction)
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        bot = interaction.client
+        assert isinstance(bot, WithdrawalBot) and interaction.message is not None
+        requests = await bot.manager.list_by_message(interaction.message.id)
+        await interaction.response.edit_message(
+            embed=build_digest_embed(requests, self.page),
+            view=DigestView(requests, page=self.page),
+        )
+
+
+class DigestSelect(
+    discord.ui.DynamicItem[discord.ui.Select],
+    template=r"withdrawal:digest:select:(?P<page>[0-9]+)",
+):
+    """Select menu approving or rejecting entries on one digest page."""
+
+    def __init__(self, page: int, requests: Sequence[WithdrawalRequest] = ()) -> None:
+        options = []
+        for request in requests:
+            if request.status is not WithdrawalStatus.PENDING:
+                continue
+            summary = f"{request.player_name} - {request.amount} {request.currency}"[:100]
+            options.append(
+                discord.SelectOption(label=f"Approve #{request.id}", value=f"approve:{request.id}", description=summary)
+            )
+            options.append(
+                discord.SelectOption(label=f"Reject #{request.id}", value=f"reject:{request.id}", description=summary)
+            )
+        disabled = not options
+        if disabled:
+            options = [discord.SelectOption(label="Nothing left to decide on this page", value="none")]
+        super().__init__(
+            discord.ui.Select(
+                custom_id=f"withdrawal:digest:select:{page}",
+                placeholder="Approve or reject requests on this page",
+                min_values=1,
+                max_values=len(options),
+                options=options,
+                disabled=disabled,
+            )
+        )
+        self.page = page
+
+    @classmethod
+    async def from_custom_id(  # type: ignore[override]
+        cls, interaction: discord.Interaction, item: discord.ui.Select, match: re.Match[str], /
+    ) -> "DigestSelect":
+        return cls(int(match["page"]))
 
-    def _disable_buttons(self) -> None:
-        for item in self.children:
-            if isinstance(item, discord.ui.Button):
-                item.disabled = True
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await _check_admin(interaction)
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        bot = interaction.client
+        assert isinstance(bot, WithdrawalBot) and interaction.user is not None
+        message = interaction.message
+        assert message is not None
+        await interaction.response.defer()
+
+        async def _refresh(_: Optional[WithdrawalRequest] = None) -> None:
+            requests = await bot.manager.list_by_message(message.id)
+            await bot.outbound.edit(
+                message,
+                embed=build_digest_embed(requests, self.page),
+                view=DigestView(requests, page=self.page),
+            )
+
+        decisions: Dict[int, str] = {}
+        conflicts: set[int] = set()
+        for value in self.item.values:
+            action, _, raw_id = value.partition(":")
+            if not raw_id.isdigit():
+                continue
+            request_id = int(raw_id)
+            if decisions.setdefault(request_id, action) != action:
+                conflicts.add(request_id)
+
+        # Never act on a request picked for both approval and rejection.
+        errors: List[str] = [
+            f"#{request_id}: selected for both approval and rejection, skipped" for request_id in sorted(conflicts)
+        ]
+        for request_id, action in decisions.items():
+            if request_id in conflicts:
+                continue
+            try:
+                if action == "approve":
+                    await bot.manager.enqueue_approval(
+                        request_id,
+                        admin_name=str(interaction.user),
+                        admin_id=getattr(interaction.user, "id", 0),
+                        on_complete=_refresh,
+                    )
+                else:
+                    await bot.manager.reject_request(
+                        request_id,
+                        admin_name=str(interaction.user),
+                        admin_id=getattr(interaction.user, "id", 0),
+                        reason="Rejected by administrator",
+                    )
+            except (WithdrawalStateError, WithdrawalNotFoundError, PayoutQueueFull) as exc:
+                errors.append(f"#{request_id}: {exc}")
+        await _refresh()
+        if errors:
+            await interaction.followup.send("\n".join(errors), ephemeral=True)
+
+
+class DigestView(discord.ui.View):
+    """Pagination and decision controls attached to a digest message."""
+
+    def __init__(self, requests: Sequence[WithdrawalRequest], *, page: int = 0) -> None:
+        super().__init__(timeout=None)
+        page = _clamp_page(requests, page)
+        last = _page_count(requests) - 1
+        start = page * DIGEST_PAGE_SIZE
+        self.add_item(DigestSelect(page, requests[start : start + DIGEST_PAGE_SIZE]))
+        self.add_item(DigestPageButton(max(page - 1, 0), "prev", disabled=page == 0))
+        self.add_item(DigestPageButton(min(page + 1, last), "next", disabled=page == last))
 
-    def _enable_buttons(self) -> None:
-        for item in self.children:
-            if isinstance(item, discord.ui.Button):
-                item.disabled = False
+
+_BULK_FILTER_DESCRIPTIONS = {
+    "currency": "Only withdrawals in this currency, e.g. BTC",
+    "max_amount": "Only withdrawals up to this amount",
+    "player": "Only withdrawals from this player name or UUID",
+    "older_than_minutes": "Only withdrawals created at least this many minutes ago",
+    "limit": "Maximum number of withdrawals to process",
+}
+
+
+def _log_failed_edit(future: asyncio.Future[None]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        _LOGGER.warning("Failed to update a Discord message", exc_info=future.exception())
 
 
 class WithdrawalBot(commands.Bot):
@@ -148,7 +692,11 @@ class WithdrawalBot(commands.Bot):
         super().__init__(command_prefix=commands.when_mentioned_or("!"), intents=intents)
         self.settings = settings
         self.manager = manager
-        self.manager.add_listener(self._handle_new_request)
+        self.outbound = MessageDispatcher(
+            rate_limit=settings.discord_channel_rate_limit,
+            rate_window=settings.discord_channel_rate_window,
+        )
+        self.manager.add_batch_listener(self._handle_new_requests)
 
         @self.tree.command(name="withdrawal_status", description="Check the status of a withdrawal request.")
         async def _withdrawal_status(interaction: discord.Interaction, request_id: int) -> None:
@@ -162,12 +710,179 @@ class WithdrawalBot(commands.Bot):
             embed = build_request_embed(request)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
+        @self.tree.command(
+            name="withdrawal_approve_bulk",
+            description="Approve and pay out every pending withdrawal matching the filters.",
+        )
+        @app_commands.describe(**_BULK_FILTER_DESCRIPTIONS)
+        async def _approve_bulk(
+            interaction: discord.Interaction,
+            currency: Optional[str] = None,
+            max_amount: Optional[str] = None,
+            player: Optional[str] = None,
+            older_than_minutes: Optional[app_commands.Range[int, 1]] = None,
+            limit: app_commands.Range[int, 1, 1000] = 100,
+        ) -> None:
+            filters = await self._bulk_filters(
+                interaction, currency, max_amount, player, older_than_minutes, limit
+            )
+            if filters is None:
+                return
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            status_message = await interaction.followup.send(
+                "Claiming matching withdrawals...", ephemeral=True, wait=True
+            )
+
+            def _progress(completed: int, total: int) -> None:
+                self._report(status_message, f"Paid out {completed}/{total} withdrawals...")
+
+            results = await self.manager.approve_many(
+                filters,
+                admin_name=str(interaction.user),
+                admin_id=getattr(interaction.user, "id", 0),
+                progress=_progress,
+            )
+            approved = sum(request.status is WithdrawalStatus.APPROVED for request in results)
+            failed = len(results) - approved
+            self._report(
+                status_message,
+                f"Bulk approval finished: {approved} approved, {failed} failed.",
+            )
+            await self._refresh_messages(results)
+
+        @self.tree.command(
+            name="withdrawal_reject_bulk",
+            description="Reject every pending withdrawal matching the filters.",
+        )
+        @app_commands.describe(**_BULK_FILTER_DESCRIPTIONS, reason="Reason shown to the player")
+        async def _reject_bulk(
+            interaction: discord.Interaction,
+            currency: Optional[str] = None,
+            max_amount: Optional[str] = None,
+            player: Optional[str] = None,
+            older_than_minutes: Optional[app_commands.Range[int, 1]] = None,
+            limit: app_commands.Range[int, 1, 1000] = 100,
+            reason: str = "Rejected by administrator",
+        ) -> None:
+            filters = await self._bulk_filters(
+                interaction, currency, max_amount, player, older_than_minutes, limit
+            )
+            if filters is None:
+                return
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            results = await self.manager.reject_many(
+                filters,
+                admin_name=str(interaction.user),
+                admin_id=getattr(interaction.user, "id", 0),
+                reason=reason,
+            )
+            await interaction.followup.send(f"Rejected {len(results)} withdrawals.", ephemeral=True)
+            await self._refresh_messages(results)
+
     async def setup_hook(self) -> None:
-        await self._restore_pending_views()
+        self.add_dynamic_items(ApproveButton, RejectButton, DigestPageButton, DigestSelect)
+        self.outbound.start()
         await self._sync_commands()
 
+    async def close(self) -> None:
+        await self.outbound.stop()
+        await super().close()
+
     async def on_ready(self) -> None:  # pragma: no cover - runtime logging
         _LOGGER.info("Bot connected as %s (id=%s)", self.user, getattr(self.user, "id", "?"))
+        # The outbox is only drained once the withdrawal channel can be resolved.
+        await self.manager.start_notifications()
+        self.manager.notifications.wake()
+
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        if interaction.type is not discord.InteractionType.component or interaction.message is None:
+            return
+        custom_id = str((interaction.data or {}).get("custom_id", ""))
+        if custom_id.startswith("withdrawal:"):
+            return
+        await self._refresh_legacy_controls(interaction, interaction.message)
+
+    async def _refresh_legacy_controls(
+        self, interaction: discord.Interaction, message: discord.Message
+    ) -> None:
+        """Swap buttons posted by older releases for routable dynamic items."""
+
+        requests = await self.manager.list_by_message(message.id)
+        if len(requests) != 1:
+            return
+        request = requests[0]
+        disabled = request.status is not WithdrawalStatus.PENDING
+        await interaction.response.edit_message(
+            embed=build_request_embed(request),
+            view=WithdrawalRequestView(request_id=request.id, disabled=disabled),
+        )
+        if not disabled:
+            await interaction.followup.send(
+                "These controls were refreshed, please click again.", ephemeral=True
+            )
+
+    async def _bulk_filters(
+        self,
+        interaction: discord.Interaction,
+        currency: Optional[str],
+        max_amount: Optional[str],
+        player: Optional[str],
+        older_than_minutes: Optional[int],
+        limit: int,
+    ) -> Optional[WithdrawalFilter]:
+        """Validate bulk command input, replying to the user when it is rejected."""
+
+        if interaction.user is None or not _is_authorised(self.settings, interaction.user):
+            await interaction.response.send_message(
+                "You are not authorized to manage withdrawals.", ephemeral=True
+            )
+            return None
+        amount: Optional[Decimal] = None
+        if max_amount is not None:
+            try:
+                amount = Decimal(max_amount)
+            except InvalidOperation:
+                await interaction.response.send_message(
+                    f"{max_amount!r} is not a valid amount.", ephemeral=True
+                )
+                return None
+        return WithdrawalFilter(
+            currency=currency,
+            max_amount=amount,
+            player=player,
+            older_than=timedelta(minutes=older_than_minutes) if older_than_minutes else None,
+            limit=limit,
+        )
+
+    def _report(self, message: discord.WebhookMessage, content: str) -> None:
+        """Queue a progress edit; the dispatcher only sends the latest one."""
+
+        future = self.outbound.edit(message, content=content)
+        future.add_done_callback(_log_failed_edit)
+
+    async def _refresh_messages(self, requests: Sequence[WithdrawalRequest]) -> None:
+        """Re-render the Discord messages of requests decided outside their buttons."""
+
+        message_ids = {request.discord_message_id for request in requests if request.discord_message_id}
+        if not message_ids:
+            return
+        channel = await self._withdrawal_channel()
+        for message_id in message_ids:
+            attached = await self.manager.list_by_message(message_id)
+            message = channel.get_partial_message(message_id)
+            if len(attached) == 1:
+                request = attached[0]
+                view = WithdrawalRequestView(
+                    request_id=request.id,
+                    disabled=request.status is not WithdrawalStatus.PENDING,
+                )
+                self.outbound.edit(message, embed=build_request_embed(request), view=view).add_done_callback(
+                    _log_failed_edit
+                )
+            elif attached:
+                self.outbound.edit(
+                    message, embed=build_digest_embed(attached, 0), view=DigestView(attached)
+                ).add_done_callback(_log_failed_edit)
 
     async def _sync_commands(self) -> None:
         if self.settings.guild_id:
@@ -177,31 +892,72 @@ class WithdrawalBot(commands.Bot):
         else:
             await self.tree.sync()
 
-    async def _restore_pending_views(self) -> None:
-        pending = await self.manager.list_pending(limit=100)
-        for request in pending:
-            if request.discord_message_id is None:
-                continue
-            self.add_view(
-                WithdrawalRequestView(manager=self.manager, settings=self.settings, request_id=request.id),
-                message_id=request.discord_message_id,
-            )
+    async def _handle_new_requests(self, requests: List[WithdrawalRequest]) -> Set[int]:
+        """Post new requests and return the ids that could not be posted."""
 
-    async def _handle_new_request(self, request: WithdrawalRequest) -> None:
+        # Outbox delivery is at-least-once; never post the same request twice.
+        requests = [request for request in requests if request.discord_message_id is None]
+        if not requests:
+            return set()
+        channel = await self._withdrawal_channel()
+        if self._use_digest(requests):
+            await self._post_digest(channel, requests)
+            return set()
+        results = await asyncio.gather(
+            *(self._post_request(channel, request) for request in requests),
+            return_exceptions=True,
+        )
+        failed: Set[int] = set()
+        for request, result in zip(requests, results):
+            if isinstance(result, BaseException) and request.id is not None:
+                _LOGGER.warning("Failed to post withdrawal request %s", request.id, exc_info=result)
+                failed.add(request.id)
+        return failed
+
+    async def _withdrawal_channel(self) -> discord.TextChannel | discord.Thread:
+        await self.wait_until_ready()
         channel = self.get_channel(self.settings.withdrawal_channel_id)
         if channel is None:
-            try:
-                channel = await self.fetch_channel(self.settings.withdrawal_channel_id)
-            except discord.HTTPException:
-                _LOGGER.error("Unable to locate withdrawal channel %s", self.settings.withdrawal_channel_id)
-                return
+            channel = await self.fetch_channel(self.settings.withdrawal_channel_id)
         if not isinstance(channel, (discord.TextChannel, discord.Thread)):
-            _LOGGER.error("Configured withdrawal channel is not a text-compatible channel")
-            return
+            raise RuntimeError("Configured withdrawal channel is not a text-compatible channel")
+        return channel
+
+    def _use_digest(self, requests: Sequence[WithdrawalRequest]) -> bool:
+        return (
+            self.settings.digest_window_seconds > 0
+            and len(requests) >= self.settings.digest_threshold
+        )
+
+    async def _post_digest(
+        self, channel: discord.TextChannel | discord.Thread, requests: List[WithdrawalRequest]
+    ) -> None:
+        message = await self.outbound.send(
+            channel,
+            embed=build_digest_embed(requests, 0),
+            view=DigestView(requests),
+        )
+        await self.manager.attach_digest([request.id for request in requests if request.id is not None], message.id)
+
+    async def _post_request(
+        self, channel: discord.TextChannel | discord.Thread, request: WithdrawalRequest
+    ) -> None:
         embed = build_request_embed(request)
-        view = WithdrawalRequestView(manager=self.manager, settings=self.settings, request_id=request.id)
-        message = await channel.send(embed=embed, view=view)
+        view = WithdrawalRequestView(request_id=request.id)
+        message = await self.outbound.send(channel, embed=embed, view=view)
         await self.manager.attach_message(request.id, message.id)
 
 
-__all__ = ["WithdrawalBot", "WithdrawalRequestView", "build_request_embed"]
+__all__ = [
+    "ApproveButton",
+    "DigestPageButton",
+    "DigestSelect",
+    "DigestView",
+    "DispatcherStopped",
+    "MessageDispatcher",
+    "RejectButton",
+    "WithdrawalBot",
+    "WithdrawalRequestView",
+    "build_digest_embed",
+    "build_request_embed",
+]
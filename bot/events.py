@@ -0,0 +1,223 @@
+"""In-process fan-out of withdrawal status changes to waiting clients."""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set
+
+from .models import WithdrawalRequest, WithdrawalStatus
+
+FINAL_STATUSES = frozenset(
+    {WithdrawalStatus.APPROVED, WithdrawalStatus.REJECTED, WithdrawalStatus.FAILED}
+)
+
+TransitionListener = Callable[[Sequence[WithdrawalRequest]], None]
+
+
+class StatusSubscription:
+    """Queue of status changes for a fixed set of request ids.
+
+    Use as a context manager so the subscription is always removed from the
+    notifier, even when the waiting client disconnects.
+    """
+
+    def __init__(self, notifier: "StatusNotifier", request_ids: Iterable[int]) -> None:
+        self._notifier = notifier
+        self.request_ids = frozenset(request_ids)
+        self._queue: asyncio.Queue[WithdrawalRequest] = asyncio.Queue()
+
+    def __enter__(self) -> "StatusSubscription":
+        self._notifier._add(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._notifier._remove(self)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[WithdrawalRequest]:
+        """Return the next changed request, or ``None`` after ``timeout`` seconds."""
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _deliver(self, request: WithdrawalRequest) -> None:
+        self._queue.put_nowait(request)
+
+
+class StatusNotifier:
+    """Wake subscribers the moment a status transition has been committed.
+
+    :class:`~bot.storage.WithdrawalStore` publishes every request whose status
+    it changed; publishing and subscribing must happen on the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: Dict[int, Set[StatusSubscription]] = {}
+        self._listeners: List[TransitionListener] = []
+
+    def subscribe(self, request_ids: Iterable[int]) -> StatusSubscription:
+        return StatusSubscription(self, request_ids)
+
+    def add_listener(self, listener: TransitionListener) -> None:
+        """Call ``listener`` with every published batch, whatever the ids."""
+
+        self._listeners.append(listener)
+
+    def publish(self, requests: Sequence[WithdrawalRequest]) -> None:
+        for listener in self._listeners:
+            listener(requests)
+        for request in requests:
+            if request.id is None:
+                continue
+            for subscription in self._subscriptions.get(request.id, ()):
+                subscription._deliver(request)
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def _add(self, subscription: StatusSubscription) -> None:
+        for request_id in subscription.request_ids:
+            self._subscriptions.setdefault(request_id, set()).add(subscription)
+
+    def _remove(self, subscription: StatusSubscription) -> None:
+        for request_id in subscription.request_ids:
+            subscriptions = self._subscriptions.get(request_id)
+            if subscriptions is None:
+                continue
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[request_id]
+
+
+@dataclass(slots=True)
+class TransitionFrame:
+    """A numbered status transition as pushed to WebSocket subscribers."""
+
+    seq: int
+    request_id: int
+    player_uuid: Optional[str]
+    status: WithdrawalStatus
+    transaction_id: Optional[str]
+    failure_reason: Optional[str]
+    at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact wire form; empty fields are left out."""
+
+        frame: Dict[str, Any] = {
+            "type": "transition",
+            "seq": self.seq,
+            "id": self.request_id,
+            "status": self.status.value,
+            "at": round(self.at, 3),
+        }
+        if self.player_uuid is not None:
+            frame["player_uuid"] = self.player_uuid
+        if self.transaction_id is not None:
+            frame["transaction_id"] = self.transaction_id
+        if self.failure_reason is not None:
+            frame["failure_reason"] = self.failure_reason
+        return frame
+
+
+class FeedSubscription:
+    """Bounded queue of frames for one connection.
+
+    When a slow consumer lets the queue overflow, further frames are dropped
+    and :attr:`lagged` is set; the consumer catches up with
+    :meth:`TransitionFeed.since` from the last frame it handled.
+    """
+
+    def __init__(self, feed: "TransitionFeed", max_pending: int) -> None:
+        self._feed = feed
+        self._queue: asyncio.Queue[TransitionFrame] = asyncio.Queue(max_pending)
+        self.lagged = False
+
+    def __enter__(self) -> "FeedSubscription":
+        self._feed._subscriptions.add(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._feed._subscriptions.discard(self)
+
+    async def get(self) -> TransitionFrame:
+        return await self._queue.get()
+
+    def drain(self) -> None:
+        """Forget queued frames, e.g. after catching up from the feed buffer."""
+
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.lagged = False
+
+    def _deliver(self, frame: TransitionFrame) -> None:
+        if self.lagged:
+            return
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+class TransitionFeed:
+    """Sequence-numbered log of recent transitions for resumable subscribers.
+
+    The last ``buffer_size`` frames are kept so a client that reconnects with
+    the ``stream`` token and the last ``seq`` it saw receives what it missed.
+    The token changes on every restart, because sequence numbers start over.
+    """
+
+    def __init__(self, *, buffer_size: int = 10000, max_pending: int = 1000) -> None:
+        self.stream = secrets.token_hex(8)
+        self.seq = 0
+        self._buffer: Deque[TransitionFrame] = deque(maxlen=max(buffer_size, 1))
+        self._max_pending = max_pending
+        self._subscriptions: Set[FeedSubscription] = set()
+
+    def subscribe(self) -> FeedSubscription:
+        return FeedSubscription(self, self._max_pending)
+
+    def publish(self, requests: Sequence[WithdrawalRequest]) -> None:
+        now = time.time()
+        for request in requests:
+            if request.id is None:
+                continue
+            self.seq += 1
+            frame = TransitionFrame(
+                seq=self.seq,
+                request_id=request.id,
+                player_uuid=request.player_uuid,
+                status=request.status,
+                transaction_id=request.transaction_id,
+                failure_reason=request.failure_reason,
+                at=now,
+            )
+            self._buffer.append(frame)
+            for subscription in self._subscriptions:
+                subscription._deliver(frame)
+
+    def since(self, seq: int) -> Optional[List[TransitionFrame]]:
+        """Return buffered frames after ``seq``, or ``None`` if some were already dropped."""
+
+        if seq > self.seq:
+            return None
+        oldest = self._buffer[0].seq if self._buffer else self.seq + 1
+        if seq + 1 < oldest:
+            return None
+        return [frame for frame in self._buffer if frame.seq > seq]
+
+
+__all__ = [
+    "FINAL_STATUSES",
+    "FeedSubscription",
+    "StatusNotifier",
+    "StatusSubscription",
+    "TransitionFeed",
+    "TransitionFrame",
+]
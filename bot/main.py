@@ -13,14 +13,34 @@ from .discord_bot import WithdrawalBot
 from .manager import WithdrawalManager
 from .server import WithdrawalServer, create_app
 from .storage import WithdrawalStore
-from .wallet import DummyWalletClient, HTTPWalletClient, PiteasWalletClient
+from .wallet import (
+    ConnectionPoolOptions,
+    DummyWalletClient,
+    HTTPWalletClient,
+    PiteasWalletClient,
+)
 
 
 async def main() -> None:
     settings = Settings.from_env()
     logging.basicConfig(level=getattr(logging, settings.log_level.upper(), logging.INFO))
 
-    store = WithdrawalStore(settings.database_path)
+    store = WithdrawalStore(
+        settings.database_path,
+        reader_pool_size=settings.database_readers,
+        commit_window=settings.database_commit_window_ms / 1000,
+        commit_batch_size=settings.database_commit_batch,
+        idempotency_ttl=settings.idempotency_ttl_hours * 3600,
+        idempotency_cache_size=settings.idempotency_cache_size,
+        request_cache_size=settings.request_cache_size,
+        slow_query_threshold=settings.database_slow_query_ms / 1000,
+    )
+    pool = ConnectionPoolOptions(
+        limit=settings.wallet_pool_limit,
+        limit_per_host=settings.wallet_pool_limit_per_host,
+        keepalive_timeout=settings.wallet_keepalive_seconds,
+        dns_cache_ttl=settings.wallet_dns_cache_ttl,
+    )
     if settings.wallet_provider == "piteas":
         wallet = PiteasWalletClient(
             base_url=settings.piteas_api_url or "https://api.piteas.io",
@@ -30,19 +50,34 @@ async def main() -> None:
             asset_symbol=settings.piteas_asset_symbol,
             network=settings.piteas_network,
             priority=settings.piteas_priority,
+            pool=pool,
         )
     elif settings.wallet_endpoint:
         wallet = HTTPWalletClient(
             settings.wallet_endpoint,
             api_key=settings.wallet_api_key,
+            batch_endpoint=settings.wallet_batch_endpoint,
+            pool=pool,
         )
     else:
         wallet = DummyWalletClient()
-    manager = WithdrawalManager(store=store, wallet=wallet)
+    manager = WithdrawalManager(
+        store=store,
+        wallet=wallet,
+        payout_workers=settings.payout_workers,
+        payout_queue_size=settings.payout_queue_size,
+        payout_batch_size=settings.payout_batch_size,
+        transition_buffer_size=settings.transition_buffer_size,
+        notification_window=settings.digest_window_seconds,
+    )
     app = create_app(manager)
     server = WithdrawalServer(app, host=settings.api_host, port=settings.api_port)
     bot = WithdrawalBot(settings=settings, manager=manager)
 
+    await wallet.start()
+    # The bot starts notification delivery once it has logged in.
+    await manager.start(notifications=False)
+
     loop = asyncio.get_running_loop()
     stop_event = asyncio.Event()
 
@@ -69,15 +104,19 @@ async def main() -> None:
 
     await stop_event.wait()
 
-    bot_task.cancel()
     await server.shutdown()
     server_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await server_task
 
+    # Drain the payout workers while the bot can still edit their messages.
+    await manager.stop()
+
+    bot_task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
         await bot_task
-    with contextlib.suppress(asyncio.CancelledError):
-        await server_task
 
+    await wallet.close()
     await store.cleanup()
 
 
@@ -5,33 +5,141 @@ from __future__ import annotations
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Awaitable, Callable, Dict, List, Optional
+from typing import AbstractSet, Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set
 
-from .models import WithdrawalRequest, WithdrawalStatus
+from .events import StatusSubscription, TransitionFeed
+from .metrics import REGISTRY
+from .models import IdempotencyRecord, WithdrawalFilter, WithdrawalPage, WithdrawalRequest, WithdrawalStatus
+from .notifications import NotificationDispatcher
+from .payouts import PayoutJob, PayoutQueue, PayoutQueueFull, PayoutQueueStats
 from .storage import (
+    IdempotencyKeyExistsError,
+    RequestCacheStats,
     WithdrawalNotFoundError,
     WithdrawalStateError,
     WithdrawalStore,
 )
-from .wallet import WalletClient, WalletError
+from .wallet import PaymentResult, WalletClient, WalletError
 
 Logger = logging.Logger
 NewRequestListener = Callable[[WithdrawalRequest], Awaitable[None] | None]
+# Batch listeners may return the ids they could not deliver; those are retried.
+NewRequestsListener = Callable[
+    [List[WithdrawalRequest]], Awaitable[Optional[AbstractSet[int]]] | Optional[AbstractSet[int]]
+]
+PayoutCallback = Callable[[WithdrawalRequest], Awaitable[None] | None]
+ProgressCallback = Callable[[int, int], Awaitable[None] | None]
+
+_CREATED = REGISTRY.counter("withdrawal_requests_created_total", "Withdrawal requests created")
+_TRANSITIONS = REGISTRY.counter(
+    "withdrawal_transitions_total", "Committed status transitions by target status", ("status",)
+)
+_PAYOUT_QUEUE_DEPTH = REGISTRY.gauge("withdrawal_payout_queue_depth", "Payout jobs waiting for a worker")
+_PAYOUT_BUSY_WORKERS = REGISTRY.gauge("withdrawal_payout_busy_workers", "Payout workers running a job")
+
+_INTERRUPTED_PAYOUT = "Payout interrupted by a restart; check the wallet before paying again"
 
 
 class WithdrawalManager:
     """Coordinate storage, wallet calls, and Discord notifications."""
 
-    def __init__(self, store: WithdrawalStore, wallet: WalletClient, *, logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        store: WithdrawalStore,
+        wallet: WalletClient,
+        *,
+        payout_workers: int = 4,
+        payout_queue_size: int = 1000,
+        payout_batch_size: int = 50,
+        notification_window: float = 0.0,
+        transition_buffer_size: int = 10000,
+        logger: Optional[Logger] = None,
+    ) -> None:
         self.store = store
         self.wallet = wallet
+        self.payouts = PayoutQueue(
+            concurrency=payout_workers, max_size=payout_queue_size, logger=logger
+        )
+        self._payout_batch_size = max(payout_batch_size, 1)
+        # Claimed requests whose payout job is queued but not yet running.
+        self._unstarted: Set[int] = set()
         self._listeners: List[NewRequestListener] = []
+        self._batch_listeners: List[NewRequestsListener] = []
         self._logger = logger or logging.getLogger(__name__)
         self._listener_lock = asyncio.Lock()
+        self.notifications = NotificationDispatcher(
+            store,
+            self._notify_new_requests,
+            gather_window=notification_window,
+            logger=logger,
+        )
+        self.transitions = TransitionFeed(buffer_size=transition_buffer_size)
+        store.notifier.add_listener(self._push_transitions)
+        _PAYOUT_QUEUE_DEPTH.set_function(lambda: self.payouts.stats().depth)
+        _PAYOUT_BUSY_WORKERS.set_function(lambda: self.payouts.stats().busy_workers)
+
+    async def start(self, *, notifications: bool = True) -> None:
+        """Start the background payout workers and notification delivery.
+
+        Requests left in ``processing`` by a previous run are marked failed
+        first: their payout was interrupted and may or may not have been sent.
+        Pass ``notifications=False`` when the listeners are not ready yet and
+        call :meth:`start_notifications` once they are.
+        """
+
+        interrupted = await self.store.fail_processing(_INTERRUPTED_PAYOUT)
+        if interrupted:
+            self._logger.warning(
+                "Marked %s interrupted payouts as failed: %s",
+                len(interrupted),
+                ", ".join(str(request.id) for request in interrupted),
+            )
+        await self.payouts.start()
+        if notifications:
+            await self.start_notifications()
+
+    async def start_notifications(self) -> None:
+        """Start draining the notification outbox; does nothing if already running."""
+
+        await self.notifications.start()
+
+    async def stop(self, *, payout_timeout: float = 30.0) -> None:
+        """Stop notification delivery, then drain the payout workers.
+
+        Claimed requests whose payout had not started after ``payout_timeout``
+        seconds go back to ``pending``.
+        """
+
+        await self.notifications.stop()
+        await self.payouts.stop(timeout=payout_timeout)
+        unstarted, self._unstarted = sorted(self._unstarted), set()
+        if unstarted:
+            released = await self.store.release_processing(unstarted)
+            self._logger.info("Returned %s unstarted payouts to pending", len(released))
+
+    def _push_transitions(self, requests: Sequence[WithdrawalRequest]) -> None:
+        """Number committed transitions and push them to WebSocket subscribers."""
+
+        self.transitions.publish(requests)
+        for request in requests:
+            _TRANSITIONS.labels(request.status.value).inc()
+
+    def payout_stats(self) -> PayoutQueueStats:
+        return self.payouts.stats()
+
+    def cache_stats(self) -> RequestCacheStats:
+        return self.store.cache_stats()
 
     def add_listener(self, listener: NewRequestListener) -> None:
+        """Register a callback invoked once for every new request."""
+
         self._listeners.append(listener)
 
+    def add_batch_listener(self, listener: NewRequestsListener) -> None:
+        """Register a callback invoked with each batch of newly delivered requests."""
+
+        self._batch_listeners.append(listener)
+
     async def create_request(
         self,
         *,
@@ -41,6 +149,8 @@ class WithdrawalManager:
         currency: str,
         player_uuid: Optional[str] = None,
         metadata: Optional[Dict[str, object]] = None,
+        idempotency_key: Optional[str] = None,
+        fingerprint: str = "",
     ) -> WithdrawalRequest:
         request = await self.store.create_request(
             player_name=player_name,
@@ -49,13 +159,36 @@ class WithdrawalManager:
             currency=currency,
             player_uuid=player_uuid,
             metadata=metadata,
+            idempotency_key=idempotency_key,
+            fingerprint=fingerprint,
         )
-        await self._notify_new_request(request)
+        _CREATED.inc()
+        self.notifications.wake()
         return request
 
+    async def create_requests(
+        self, items: Sequence[Mapping[str, object]]
+    ) -> List[WithdrawalRequest]:
+        """Create many requests at once; listeners receive them in batches.
+
+        Each item accepts the keyword arguments of :meth:`create_request`.
+        """
+
+        requests = await self.store.create_requests_bulk(items)
+        if requests:
+            _CREATED.inc(len(requests))
+            self.notifications.wake()
+        return requests
+
     async def attach_message(self, request_id: int, message_id: int) -> WithdrawalRequest:
         return await self.store.set_discord_message(request_id, message_id)
 
+    async def attach_digest(self, request_ids: Sequence[int], message_id: int) -> List[WithdrawalRequest]:
+        return await self.store.set_discord_message_bulk(request_ids, message_id)
+
+    async def list_by_message(self, message_id: int) -> List[WithdrawalRequest]:
+        return await self.store.find_by_message(message_id)
+
     async def approve_request(self, request_id: int, *, admin_name: str, admin_id: int) -> WithdrawalRequest:
         processing = await self.store.mark_processing(request_id)
         try:
@@ -72,6 +205,68 @@ class WithdrawalManager:
         )
         return approved
 
+    async def enqueue_approval(
+        self,
+        request_id: int,
+        *,
+        admin_name: str,
+        admin_id: int,
+        on_complete: Optional[PayoutCallback] = None,
+    ) -> WithdrawalRequest:
+        """Claim a request and hand its payout to the worker pool.
+
+        Returns the request in ``processing`` state as soon as it is claimed.
+        A worker later sends the payment, records the approval or failure and
+        calls ``on_complete`` with the final request.
+        """
+
+        if self.payouts.full():
+            raise PayoutQueueFull("The payout queue is full, try again shortly")
+        processing = await self.store.mark_processing(request_id)
+
+        async def job() -> WithdrawalRequest:
+            final = await self._pay(processing, admin_name=admin_name, admin_id=admin_id)
+            if on_complete is not None:
+                try:
+                    result = on_complete(final)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception:  # pragma: no cover - log only
+                    self._logger.exception("Payout completion callback failed for request %s", request_id)
+            return final
+
+        await self._queue_payout((request_id,), job)
+        return processing
+
+    async def _queue_payout(self, request_ids: Sequence[int], job: PayoutJob) -> asyncio.Future[Any]:
+        """Queue ``job`` and track ``request_ids`` until a worker picks it up."""
+
+        self._unstarted.update(request_ids)
+
+        async def run() -> Any:
+            self._unstarted.difference_update(request_ids)
+            return await job()
+
+        return await self.payouts.put(run)
+
+    async def _pay(
+        self, processing: WithdrawalRequest, *, admin_name: str, admin_id: int
+    ) -> WithdrawalRequest:
+        """Send the payment for a claimed request and record the outcome."""
+
+        assert processing.id is not None
+        try:
+            transaction_id = await self.wallet.send_payment(processing)
+        except Exception as exc:
+            self._logger.exception("Wallet transfer failed for request %s", processing.id)
+            return await self.store.mark_failed(processing.id, str(exc))
+        return await self.store.mark_approved(
+            processing.id,
+            admin_name=admin_name,
+            admin_id=admin_id,
+            transaction_id=transaction_id,
+        )
+
     async def reject_request(
         self,
         request_id: int,
@@ -87,22 +282,196 @@ class WithdrawalManager:
             reason=reason,
         )
 
+    async def approve_many(
+        self,
+        filters: WithdrawalFilter,
+        *,
+        admin_name: str,
+        admin_id: int,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[WithdrawalRequest]:
+        """Claim every matching pending request and pay them out.
+
+        All matching rows move to ``processing`` in one transaction, then the
+        payouts are sent in batches of ``payout_batch_size`` through
+        :meth:`WalletClient.send_payments` on the bounded payout queue.
+        ``progress`` is called with ``(completed, total)`` as batches finish.
+        """
+
+        claimed = await self.store.claim_matching(filters)
+        total = len(claimed)
+        if progress is not None:
+            await self._report_progress(progress, 0, total)
+        futures = []
+        for start in range(0, total, self._payout_batch_size):
+            batch = claimed[start : start + self._payout_batch_size]
+            futures.append(
+                await self._queue_payout(
+                    [request.id for request in batch if request.id is not None],
+                    lambda batch=batch: self._pay_batch(
+                        batch, admin_name=admin_name, admin_id=admin_id
+                    ),
+                )
+            )
+        results: List[WithdrawalRequest] = []
+        for future in asyncio.as_completed(futures):
+            try:
+                results.extend(await future)
+            except Exception:  # pragma: no cover - logged by the payout queue
+                continue
+            if progress is not None:
+                await self._report_progress(progress, len(results), total)
+        results.sort(key=lambda request: request.id or 0)
+        return results
+
+    async def reject_many(
+        self,
+        filters: WithdrawalFilter,
+        *,
+        admin_name: str,
+        admin_id: int,
+        reason: Optional[str] = None,
+    ) -> List[WithdrawalRequest]:
+        """Reject every matching pending request in a single transaction."""
+
+        return await self.store.reject_matching(
+            filters,
+            admin_name=admin_name,
+            admin_id=admin_id,
+            reason=reason,
+        )
+
+    async def _pay_batch(
+        self, batch: Sequence[WithdrawalRequest], *, admin_name: str, admin_id: int
+    ) -> List[WithdrawalRequest]:
+        """Send payouts for claimed requests in one wallet call and record each outcome."""
+
+        try:
+            outcomes = await self.wallet.send_payments(batch)
+        except Exception as exc:
+            self._logger.exception("Wallet batch transfer failed for %s requests", len(batch))
+            outcomes = [PaymentResult(request.id or 0, error=str(exc)) for request in batch]
+        recorded = await asyncio.gather(
+            *(
+                self._record_payment(outcome, admin_name=admin_name, admin_id=admin_id)
+                for outcome in outcomes
+            ),
+            return_exceptions=True,
+        )
+        finals: List[WithdrawalRequest] = []
+        for outcome, final in zip(outcomes, recorded):
+            if isinstance(final, BaseException):
+                self._logger.error(
+                    "Failed to record payout result for request %s", outcome.request_id, exc_info=final
+                )
+                continue
+            finals.append(final)
+        return finals
+
+    async def _record_payment(
+        self, outcome: PaymentResult, *, admin_name: str, admin_id: int
+    ) -> WithdrawalRequest:
+        if not outcome.ok:
+            self._logger.warning("Wallet transfer failed for request %s: %s", outcome.request_id, outcome.error)
+            return await self.store.mark_failed(outcome.request_id, outcome.error or "Wallet transfer failed")
+        assert outcome.transaction_id is not None
+        return await self.store.mark_approved(
+            outcome.request_id,
+            admin_name=admin_name,
+            admin_id=admin_id,
+            transaction_id=outcome.transaction_id,
+        )
+
     async def list_pending(self, *, limit: int = 50) -> List[WithdrawalRequest]:
         return await self.store.list_requests(status=WithdrawalStatus.PENDING, limit=limit)
 
+    async def list_page(
+        self,
+        *,
+        status: Optional[WithdrawalStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> WithdrawalPage:
+        return await self.store.list_page(status=status, limit=limit, cursor=cursor)
+
+    async def list_versions(
+        self,
+        *,
+        status: Optional[WithdrawalStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[List[tuple[int, int]], bool]:
+        return await self.store.list_versions(status=status, limit=limit, cursor=cursor)
+
     async def get_request(self, request_id: int) -> WithdrawalRequest:
         return await self.store.get_request(request_id)
 
-    async def _notify_new_request(self, request: WithdrawalRequest) -> None:
+    async def get_version(self, request_id: int) -> Optional[int]:
+        return await self.store.get_version(request_id)
+
+    async def get_requests(self, request_ids: Sequence[int]) -> Dict[int, WithdrawalRequest]:
+        return await self.store.get_requests(request_ids)
+
+    async def get_idempotency_record(self, key: str) -> Optional[IdempotencyRecord]:
+        return await self.store.get_idempotency_record(key)
+
+    def subscribe(self, request_ids: Iterable[int]) -> StatusSubscription:
+        """Follow status changes of ``request_ids``; use the result as a context manager."""
+
+        return self.store.notifier.subscribe(request_ids)
+
+    async def _notify_new_requests(self, requests: List[WithdrawalRequest]) -> Set[int]:
+        """Hand new requests to every listener; return the ids some listener failed on."""
+
         async with self._listener_lock:
             listeners = list(self._listeners)
+            batch_listeners = list(self._batch_listeners)
+        failed: Set[int] = set()
+        for batch_listener in batch_listeners:
+            failed.update(await self._deliver_batch(batch_listener, requests))
         for listener in listeners:
-            try:
-                result = listener(request)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception:  # pragma: no cover - log only
-                self._logger.exception("Failed to deliver withdrawal notification")
+            for request in requests:
+                if not await self._deliver(listener, request) and request.id is not None:
+                    failed.add(request.id)
+        return failed
+
+    async def _report_progress(self, progress: ProgressCallback, completed: int, total: int) -> None:
+        try:
+            result = progress(completed, total)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:  # pragma: no cover - log only
+            self._logger.exception("Failed to report bulk approval progress")
+
+    async def _deliver_batch(
+        self, listener: NewRequestsListener, requests: Sequence[WithdrawalRequest]
+    ) -> AbstractSet[int]:
+        """Run a batch listener; return the ids it reported or, if it raised, every id."""
+
+        try:
+            result = listener(list(requests))
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception:  # pragma: no cover - log only
+            self._logger.exception("Failed to deliver withdrawal notifications")
+            return {request.id for request in requests if request.id is not None}
+        return result or set()
+
+    async def _deliver(self, listener: Callable[..., Awaitable[None] | None], payload: object) -> bool:
+        try:
+            result = listener(payload)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:  # pragma: no cover - log only
+            self._logger.exception("Failed to deliver withdrawal notification")
+            return False
+        return True
 
 
-__all__ = ["WithdrawalManager", "WithdrawalNotFoundError", "WithdrawalStateError"]
+__all__ = [
+    "WithdrawalManager",
+    "IdempotencyKeyExistsError",
+    "WithdrawalNotFoundError",
+    "WithdrawalStateError",
+    "PayoutQueueFull",
+]
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 class WithdrawalStatus(str, Enum):
@@ -38,6 +38,7 @@ class WithdrawalRequest:
     approved_by_id: Optional[int] = None
     transaction_id: Optional[str] = None
     failure_reason: Optional[str] = None
+    version: int = 1
 
     def to_api_dict(self) -> Dict[str, Any]:
         """Serialize the request to a JSON-friendly representation."""
@@ -61,4 +62,50 @@ class WithdrawalRequest:
         }
 
 
-__all__ = ["WithdrawalStatus", "WithdrawalRequest"]
+@dataclass(slots=True)
+class WithdrawalFilter:
+    """Criteria selecting pending requests for bulk decisions."""
+
+    currency: Optional[str] = None
+    max_amount: Optional[Decimal] = None
+    player: Optional[str] = None
+    older_than: Optional[timedelta] = None
+    limit: int = 100
+
+
+@dataclass(slots=True)
+class WithdrawalPage:
+    """One page of withdrawal requests plus the cursor for the next page."""
+
+    requests: List[WithdrawalRequest]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class PendingNotification:
+    """A new-request notification waiting in the persistent outbox."""
+
+    id: int
+    attempts: int
+    request: WithdrawalRequest
+
+
+@dataclass(slots=True)
+class IdempotencyRecord:
+    """Response stored for an ``Idempotency-Key`` until it expires."""
+
+    key: str
+    fingerprint: str
+    request_id: int
+    response: Dict[str, Any]
+    expires_at: datetime
+
+
+__all__ = [
+    "WithdrawalStatus",
+    "WithdrawalRequest",
+    "WithdrawalFilter",
+    "WithdrawalPage",
+    "PendingNotification",
+    "IdempotencyRecord",
+]
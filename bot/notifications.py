@@ -0,0 +1,115 @@
+"""Background delivery of new-request notifications from the persistent outbox."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import AbstractSet, Awaitable, Callable, Dict, List, Optional
+
+from .models import WithdrawalRequest
+from .storage import WithdrawalStore
+
+# Returns the ids of the requests that could not be delivered.
+NotificationHandler = Callable[[List[WithdrawalRequest]], Awaitable[AbstractSet[int]]]
+
+
+class NotificationDispatcher:
+    """Drain the notification outbox written alongside every new request.
+
+    ``deliver`` reports which requests of a batch failed. The other entries
+    are removed right away. Failed entries survive a restart and are retried
+    with exponential backoff, based on their own attempt count. With a
+    ``gather_window`` the dispatcher waits that long after being woken so
+    bursts are delivered as one batch.
+    """
+
+    def __init__(
+        self,
+        store: WithdrawalStore,
+        deliver: NotificationHandler,
+        *,
+        batch_size: int = 100,
+        poll_interval: float = 5.0,
+        gather_window: float = 0.0,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 300.0,
+        max_attempts: int = 20,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._store = store
+        self._deliver = deliver
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._gather_window = gather_window
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._max_attempts = max_attempts
+        self._logger = logger or logging.getLogger(__name__)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def wake(self) -> None:
+        """Ask the dispatcher to check the outbox now instead of at the next poll."""
+
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="notification-dispatcher")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                delivered = await self._drain_once()
+            except Exception:  # pragma: no cover - log only
+                self._logger.exception("Failed to process the notification outbox")
+                delivered = False
+            if delivered:
+                continue
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            if self._wakeup.is_set() and self._gather_window > 0:
+                await asyncio.sleep(self._gather_window)
+
+    async def _drain_once(self) -> bool:
+        """Deliver one batch of due notifications; return ``False`` when nothing was delivered."""
+
+        entries = await self._store.pending_notifications(limit=self._batch_size)
+        if not entries:
+            return False
+        failed = await self._deliver([entry.request for entry in entries])
+
+        delivered: List[int] = []
+        exhausted: List[int] = []
+        retry: Dict[int, List[int]] = {}
+        for entry in entries:
+            if entry.request.id not in failed:
+                delivered.append(entry.id)
+            elif entry.attempts + 1 >= self._max_attempts:
+                self._logger.error(
+                    "Giving up on notification for request %s after %s attempts",
+                    entry.request.id,
+                    entry.attempts + 1,
+                )
+                exhausted.append(entry.id)
+            else:
+                retry.setdefault(entry.attempts, []).append(entry.id)
+        await self._store.complete_notifications(delivered + exhausted)
+        for attempts, notification_ids in retry.items():
+            delay = min(self._retry_delay * (2 ** attempts), self._max_retry_delay)
+            await self._store.retry_notifications(notification_ids, delay=delay)
+        # Failed entries are postponed, so keep draining while anything got through.
+        return bool(delivered)
+
+
+__all__ = ["NotificationDispatcher"]
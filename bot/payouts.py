@@ -0,0 +1,126 @@
+"""Bounded worker pool that runs wallet payouts off the request path."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+
+PayoutJob = Callable[[], Awaitable[Any]]
+
+
+class PayoutQueueFull(RuntimeError):
+    """Raised when the payout queue cannot accept more work."""
+
+
+@dataclass(slots=True)
+class PayoutQueueStats:
+    """Snapshot of the payout queue for monitoring."""
+
+    depth: int
+    capacity: int
+    workers: int
+    busy_workers: int
+
+    @property
+    def utilisation(self) -> float:
+        return self.busy_workers / self.workers if self.workers else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "depth": self.depth,
+            "capacity": self.capacity,
+            "workers": self.workers,
+            "busy_workers": self.busy_workers,
+            "utilisation": self.utilisation,
+        }
+
+
+class PayoutQueue:
+    """Run queued payout jobs on a fixed number of worker tasks."""
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 4,
+        max_size: int = 1000,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("Payout concurrency must be at least 1")
+        self._concurrency = concurrency
+        self._max_size = max_size
+        self._queue: asyncio.Queue[tuple[PayoutJob, asyncio.Future[Any]]] = asyncio.Queue(max_size)
+        self._workers: List[asyncio.Task[None]] = []
+        self._busy = 0
+        self._logger = logger or logging.getLogger(__name__)
+
+    def full(self) -> bool:
+        return self._queue.full()
+
+    def stats(self) -> PayoutQueueStats:
+        return PayoutQueueStats(
+            depth=self._queue.qsize(),
+            capacity=self._max_size,
+            workers=self._concurrency,
+            busy_workers=self._busy,
+        )
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"payout-worker-{index}")
+            for index in range(self._concurrency)
+        ]
+
+    async def stop(self, *, timeout: float = 30.0) -> None:
+        """Let queued payouts finish for up to ``timeout`` seconds, then cancel.
+
+        Jobs still queued at that point are dropped and their futures cancelled.
+        """
+
+        if not self._workers:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._queue.join(), timeout)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+            self._queue.task_done()
+
+    async def put(self, job: PayoutJob) -> asyncio.Future[Any]:
+        """Queue ``job``, waiting for space if the queue is full."""
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, future))
+        return future
+
+    async def _work(self) -> None:
+        while True:
+            job, future = await self._queue.get()
+            self._busy += 1
+            try:
+                result = await job()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as exc:
+                self._logger.exception("Payout job failed")
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._busy -= 1
+                self._queue.task_done()
+
+
+__all__ = ["PayoutJob", "PayoutQueue", "PayoutQueueFull", "PayoutQueueStats"]
@@ -0,0 +1,73 @@
+"""Direct JSON encoding of withdrawal requests for the API hot paths."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+from starlette.responses import Response
+
+from .models import WithdrawalRequest
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def request_payload(request: WithdrawalRequest) -> Dict[str, Any]:
+    """Return the exact field set of ``WithdrawalResponse`` without pydantic."""
+
+    return {
+        "id": request.id,
+        "status": request.status.value,
+        "player_name": request.player_name,
+        "wallet_address": request.wallet_address,
+        "amount": str(request.amount),
+        "currency": request.currency,
+        "player_uuid": request.player_uuid,
+        "metadata": request.metadata,
+        "transaction_id": request.transaction_id,
+        "failure_reason": request.failure_reason,
+    }
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def dumps_request(request: WithdrawalRequest) -> bytes:
+    return dumps(request_payload(request))
+
+
+def dumps_request_list(requests: Iterable[WithdrawalRequest], next_cursor: Optional[str]) -> bytes:
+    """Encode a page in the shape of ``WithdrawalListResponse``."""
+
+    withdrawals: List[Dict[str, Any]] = [request_payload(request) for request in requests]
+    return dumps({"withdrawals": withdrawals, "next_cursor": next_cursor})
+
+
+class FastJSONResponse(Response):
+    """JSON response that accepts pre-encoded bytes or encodes with orjson.
+
+    Handlers return it directly, so FastAPI skips validating the body against
+    ``response_model``; the model still documents the schema in OpenAPI.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+__all__ = [
+    "FastJSONResponse",
+    "dumps",
+    "dumps_request",
+    "dumps_request_list",
+    "request_payload",
+]
@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set
 
-from fastapi import Depends, FastAPI, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from fastapi import (
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 import uvicorn
 
-from .manager import WithdrawalManager, WithdrawalNotFoundError
-from .models import WithdrawalRequest, WithdrawalStatus
+from .events import FINAL_STATUSES, FeedSubscription, TransitionFeed, TransitionFrame
+from .manager import IdempotencyKeyExistsError, WithdrawalManager, WithdrawalNotFoundError
+from .metrics import CONTENT_TYPE, REGISTRY, _HistogramChild
+from .models import IdempotencyRecord, WithdrawalRequest, WithdrawalStatus
+from .serialization import FastJSONResponse, dumps, dumps_request, dumps_request_list, request_payload
+from .storage import InvalidCursorError
 
 
 class WithdrawalCreate(BaseModel):
@@ -39,12 +60,256 @@ class WithdrawalResponse(BaseModel):
         return cls(**request.to_api_dict())
 
 
+class WithdrawalStatusEntry(BaseModel):
+    status: str
+    transaction_id: Optional[str]
+    withdrawal: Optional[WithdrawalResponse] = Field(None, description="Full request, only with `full=true`")
+
+
+class WithdrawalStatusResponse(BaseModel):
+    withdrawals: Dict[int, WithdrawalStatusEntry] = Field(..., description="Found requests keyed by id")
+    missing: List[int] = Field(..., description="Requested ids that do not exist")
+
+
 class WithdrawalListResponse(BaseModel):
     withdrawals: List[WithdrawalResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page; absent on the last page"
+    )
+
+
+MAX_BATCH_SIZE = 1000
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+MAX_WAIT_SECONDS = 60
+MAX_STREAM_IDS = 200
+MAX_STATUS_IDS = 500
+STREAM_HEARTBEAT_SECONDS = 15.0
+WS_HEARTBEAT_SECONDS = 20.0
+MAX_WS_SUBSCRIPTIONS = 10000
+
+
+class WithdrawalBatchCreate(BaseModel):
+    withdrawals: List[Dict[str, Any]] = Field(
+        ...,
+        max_items=MAX_BATCH_SIZE,
+        description="Withdrawal payloads shaped like POST /withdrawals; each one is validated separately",
+    )
+
+
+class WithdrawalBatchError(BaseModel):
+    index: int = Field(..., description="Position of the rejected item in the submitted batch")
+    errors: List[Dict[str, Any]]
+
+
+class WithdrawalBatchResponse(BaseModel):
+    created: List[WithdrawalResponse] = Field(..., description="Created requests in submission order")
+    errors: List[WithdrawalBatchError]
+
+
+def _fingerprint(payload: WithdrawalCreate) -> str:
+    """Hash a create payload so a reused idempotency key can be told apart."""
+
+    body = json.dumps(payload.dict(), sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def _replay(record: IdempotencyRecord, fingerprint: str, response: Response) -> WithdrawalResponse:
+    if record.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=422, detail="Idempotency-Key was already used with a different request body"
+        )
+    response.headers["Idempotent-Replayed"] = "true"
+    return WithdrawalResponse(**record.response)
+
+
+def _parse_ids(raw: str, *, limit: int) -> List[int]:
+    """Parse a comma separated list of request ids, keeping the first occurrence of each."""
+
+    try:
+        ids = [int(part) for part in raw.split(",") if part.strip()]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="ids must be comma separated integers") from exc
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        raise HTTPException(status_code=400, detail="At least one id is required")
+    if len(ids) > limit:
+        raise HTTPException(status_code=400, detail=f"At most {limit} ids are allowed")
+    return ids
+
+
+_HTTP_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Time spent handling API requests, by route template",
+    ("method", "route", "status"),
+)
+# Bound children by label values, so an observation skips ``labels()``.
+_HTTP_CHILDREN: Dict[tuple[str, str, int], _HistogramChild] = {}
+
+
+class _MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by its route template."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            key = (scope["method"], route, status_code)
+            child = _HTTP_CHILDREN.get(key)
+            if child is None:
+                child = _HTTP_CHILDREN[key] = _HTTP_SECONDS.labels(*key)
+            child.observe(time.perf_counter() - started)
+
+
+def _request_etag(request_id: int, version: int) -> str:
+    return f'"{request_id}-{version}"'
+
+
+def _page_etag(versions: Sequence[tuple[int, int]], has_more: bool) -> str:
+    """Derive a page ETag from the ``(id, version)`` pairs it contains."""
+
+    digest = hashlib.sha1(repr((versions, has_more)).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+class _TransitionSocket:
+    """Push transition frames from the manager's feed to one WebSocket client."""
+
+    def __init__(self, websocket: WebSocket, feed: TransitionFeed) -> None:
+        self._websocket = websocket
+        self._feed = feed
+        self._ids: Set[int] = set()
+        self._players: Set[str] = set()
+        # Highest sequence number already considered for this connection.
+        self._last_seq = feed.seq
+
+    async def serve(self) -> None:
+        with self._feed.subscribe() as subscription:
+            await self._websocket.send_json(
+                {
+                    "type": "hello",
+                    "stream": self._feed.stream,
+                    "seq": self._feed.seq,
+                    "heartbeat": WS_HEARTBEAT_SECONDS,
+                }
+            )
+            receive = asyncio.ensure_future(self._websocket.receive_text())
+            incoming = asyncio.ensure_future(subscription.get())
+            try:
+                while True:
+                    done, _ = await asyncio.wait(
+                        {receive, incoming},
+                        timeout=WS_HEARTBEAT_SECONDS,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        await self._websocket.send_json({"type": "heartbeat", "seq": self._feed.seq})
+                        continue
+                    if incoming in done:
+                        await self._push(subscription, incoming.result())
+                        incoming = asyncio.ensure_future(subscription.get())
+                    if receive in done:
+                        await self._handle(receive.result())
+                        receive = asyncio.ensure_future(self._websocket.receive_text())
+            except WebSocketDisconnect:
+                pass
+            finally:
+                for task in (receive, incoming):
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+                        await task
+
+    async def _push(self, subscription: FeedSubscription, frame: TransitionFrame) -> None:
+        if not subscription.lagged:
+            await self._send_frames([frame])
+            return
+        missed = self._feed.since(self._last_seq)
+        subscription.drain()
+        if missed is None:
+            self._last_seq = self._feed.seq
+            await self._websocket.send_json({"type": "reset", "stream": self._feed.stream, "seq": self._feed.seq})
+            return
+        await self._send_frames(missed)
+
+    async def _send_frames(self, frames: Iterable[TransitionFrame], *, replay: bool = False) -> None:
+        for frame in frames:
+            if frame.seq <= self._last_seq and not replay:
+                continue
+            self._last_seq = max(self._last_seq, frame.seq)
+            if frame.request_id in self._ids or (
+                frame.player_uuid is not None and frame.player_uuid in self._players
+            ):
+                await self._websocket.send_json(frame.to_dict())
+
+    async def _handle(self, text: str) -> None:
+        try:
+            message = json.loads(text)
+            op = message["op"]
+            ids = {int(value) for value in message.get("ids", ())}
+            players = {str(value) for value in message.get("players", ())}
+        except (ValueError, TypeError, KeyError):
+            await self._websocket.send_json({"type": "error", "detail": "Malformed message"})
+            return
+        if op == "ping":
+            await self._websocket.send_json({"type": "pong", "seq": self._feed.seq})
+        elif op == "subscribe":
+            if len(self._ids | ids) + len(self._players | players) > MAX_WS_SUBSCRIPTIONS:
+                await self._websocket.send_json(
+                    {"type": "error", "detail": f"At most {MAX_WS_SUBSCRIPTIONS} subscriptions are allowed"}
+                )
+                return
+            self._ids |= ids
+            self._players |= players
+            await self._websocket.send_json({"type": "subscribed", "seq": self._feed.seq})
+            if "since" in message:
+                await self._resume(message.get("stream"), message["since"])
+        elif op == "unsubscribe":
+            self._ids -= ids
+            self._players -= players
+            await self._websocket.send_json({"type": "unsubscribed", "seq": self._feed.seq})
+        else:
+            await self._websocket.send_json({"type": "error", "detail": f"Unknown op: {op}"})
+
+    async def _resume(self, stream: Optional[str], since: Any) -> None:
+        missed = None
+        if stream == self._feed.stream and isinstance(since, int):
+            missed = self._feed.since(since)
+        if missed is None:
+            await self._websocket.send_json({"type": "reset", "stream": self._feed.stream, "seq": self._feed.seq})
+            return
+        await self._send_frames(missed, replay=True)
 
 
 def create_app(manager: WithdrawalManager) -> FastAPI:
     app = FastAPI(title="Withdrawal Bridge", version="0.1.0")
+    app.add_middleware(_MetricsMiddleware)
 
     def get_manager() -> WithdrawalManager:
         return manager
@@ -53,37 +318,220 @@ def create_app(manager: WithdrawalManager) -> FastAPI:
     async def healthcheck() -> Dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/payouts/queue", status_code=status.HTTP_200_OK, summary="Payout worker queue statistics")
+    async def payout_queue(mgr: WithdrawalManager = Depends(get_manager)) -> Dict[str, Any]:
+        return mgr.payout_stats().to_dict()
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    @app.get("/store/cache", status_code=status.HTTP_200_OK, summary="Request cache statistics")
+    async def request_cache(mgr: WithdrawalManager = Depends(get_manager)) -> Dict[str, Any]:
+        return mgr.cache_stats().to_dict()
+
+    @app.websocket("/ws")
+    async def transitions_socket(websocket: WebSocket, mgr: WithdrawalManager = Depends(get_manager)) -> None:
+        await websocket.accept()
+        await _TransitionSocket(websocket, mgr.transitions).serve()
+
     @app.post(
         "/withdrawals",
         response_model=WithdrawalResponse,
         status_code=status.HTTP_201_CREATED,
         summary="Create a withdrawal request",
     )
-    async def create_withdrawal(payload: WithdrawalCreate, mgr: WithdrawalManager = Depends(get_manager)) -> WithdrawalResponse:
-        request = await mgr.create_request(
-            player_name=payload.player_name,
-            wallet_address=payload.wallet_address,
-            amount=payload.amount,
-            currency=payload.currency,
-            player_uuid=payload.player_uuid,
-            metadata=payload.metadata,
+    async def create_withdrawal(
+        payload: WithdrawalCreate,
+        response: Response,
+        idempotency_key: Optional[str] = Header(
+            None,
+            alias="Idempotency-Key",
+            description="Retries with the same key return the original response instead of creating a duplicate",
+        ),
+        mgr: WithdrawalManager = Depends(get_manager),
+    ) -> Any:
+        fingerprint = ""
+        if idempotency_key is not None:
+            if not idempotency_key or len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+                raise HTTPException(status_code=400, detail="Invalid Idempotency-Key")
+            fingerprint = _fingerprint(payload)
+            record = await mgr.get_idempotency_record(idempotency_key)
+            if record is not None:
+                return _replay(record, fingerprint, response)
+        try:
+            request = await mgr.create_request(
+                player_name=payload.player_name,
+                wallet_address=payload.wallet_address,
+                amount=payload.amount,
+                currency=payload.currency,
+                player_uuid=payload.player_uuid,
+                metadata=payload.metadata,
+                idempotency_key=idempotency_key,
+                fingerprint=fingerprint,
+            )
+        except IdempotencyKeyExistsError as exc:
+            # A concurrent retry with the same key committed first.
+            return _replay(exc.record, fingerprint, response)
+        return FastJSONResponse(dumps_request(request), status_code=status.HTTP_201_CREATED)
+
+    @app.post(
+        "/withdrawals/batch",
+        response_model=WithdrawalBatchResponse,
+        status_code=status.HTTP_201_CREATED,
+        summary="Create many withdrawal requests at once",
+    )
+    async def create_withdrawals(
+        payload: WithdrawalBatchCreate, mgr: WithdrawalManager = Depends(get_manager)
+    ) -> Any:
+        items: List[Dict[str, Any]] = []
+        errors: List[WithdrawalBatchError] = []
+        for index, raw in enumerate(payload.withdrawals):
+            try:
+                item = WithdrawalCreate.parse_obj(raw)
+            except ValidationError as exc:
+                errors.append(WithdrawalBatchError(index=index, errors=exc.errors()))
+                continue
+            items.append(item.dict())
+        requests = await mgr.create_requests(items)
+        return FastJSONResponse(
+            {
+                "created": [request_payload(req) for req in requests],
+                "errors": [error.dict() for error in errors],
+            },
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    @app.get(
+        "/withdrawals/status",
+        response_model=WithdrawalStatusResponse,
+        response_model_exclude_unset=True,
+        summary="Look up the status of many requests at once",
+    )
+    async def withdrawal_statuses(
+        ids: str = Query(..., description="Comma separated request ids"),
+        full: bool = Query(False, description="Include the full request for every id"),
+        mgr: WithdrawalManager = Depends(get_manager),
+    ) -> Any:
+        request_ids = _parse_ids(ids, limit=MAX_STATUS_IDS)
+        found = await mgr.get_requests(request_ids)
+        entries: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+        for request_id in request_ids:
+            request = found.get(request_id)
+            if request is None:
+                missing.append(request_id)
+                continue
+            entry: Dict[str, Any] = {"status": request.status.value, "transaction_id": request.transaction_id}
+            if full:
+                entry["withdrawal"] = request_payload(request)
+            entries[request_id] = entry
+        return FastJSONResponse({"withdrawals": entries, "missing": missing})
+
+    @app.get(
+        "/withdrawals/stream",
+        response_class=StreamingResponse,
+        summary="Stream status changes as Server-Sent Events",
+    )
+    async def stream_withdrawals(
+        http_request: Request,
+        ids: str = Query(..., description="Comma separated request ids to watch"),
+        mgr: WithdrawalManager = Depends(get_manager),
+    ) -> StreamingResponse:
+        request_ids = _parse_ids(ids, limit=MAX_STREAM_IDS)
+        subscription = mgr.subscribe(request_ids)
+
+        async def events() -> AsyncIterator[bytes]:
+            with subscription:
+                open_ids = set()
+                for request_id in request_ids:
+                    try:
+                        current = await mgr.get_request(request_id)
+                    except WithdrawalNotFoundError:
+                        yield _sse_event("missing", {"id": request_id})
+                        continue
+                    yield _sse_event("status", request_payload(current))
+                    if current.status not in FINAL_STATUSES:
+                        open_ids.add(request_id)
+                while open_ids:
+                    changed = await subscription.get(STREAM_HEARTBEAT_SECONDS)
+                    if changed is None:
+                        if await http_request.is_disconnected():
+                            return
+                        yield b": keepalive\n\n"
+                        continue
+                    yield _sse_event("status", request_payload(changed))
+                    if changed.status in FINAL_STATUSES:
+                        open_ids.discard(changed.id)
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
-        return WithdrawalResponse.from_request(request)
 
-    @app.get("/withdrawals/{request_id}", response_model=WithdrawalResponse)
-    async def get_withdrawal(request_id: int, mgr: WithdrawalManager = Depends(get_manager)) -> WithdrawalResponse:
+    @app.get(
+        "/withdrawals/{request_id}/wait",
+        response_model=WithdrawalResponse,
+        summary="Wait until a request changes status",
+    )
+    async def wait_withdrawal(
+        request_id: int,
+        timeout: float = Query(30.0, ge=0, le=MAX_WAIT_SECONDS, description="Seconds to wait for a change"),
+        known_status: Optional[WithdrawalStatus] = Query(
+            None, alias="status", description="Status the client already knows; a different status returns at once"
+        ),
+        mgr: WithdrawalManager = Depends(get_manager),
+    ) -> Any:
+        # Subscribe before reading so a transition between the two is not lost.
+        with mgr.subscribe([request_id]) as subscription:
+            try:
+                request = await mgr.get_request(request_id)
+            except WithdrawalNotFoundError as exc:
+                raise HTTPException(status_code=404, detail=str(exc)) from exc
+            expected = known_status or request.status
+            if request.status is expected and request.status not in FINAL_STATUSES:
+                changed = await subscription.get(timeout)
+                if changed is not None:
+                    request = changed
+        return FastJSONResponse(dumps_request(request))
+
+    @app.get(
+        "/withdrawals/{request_id}",
+        response_model=WithdrawalResponse,
+        responses={304: {"description": "The request has not changed since the given ETag"}},
+    )
+    async def get_withdrawal(
+        request_id: int,
+        if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+        mgr: WithdrawalManager = Depends(get_manager),
+    ) -> Any:
+        if if_none_match is not None:
+            version = await mgr.get_version(request_id)
+            if version is not None:
+                etag = _request_etag(request_id, version)
+                if _etag_matches(if_none_match, etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
         try:
             request = await mgr.get_request(request_id)
         except WithdrawalNotFoundError as exc:  # pragma: no cover - simple propagation
             raise HTTPException(status_code=404, detail=str(exc)) from exc
-        return WithdrawalResponse.from_request(request)
+        return FastJSONResponse(
+            dumps_request(request), headers={"ETag": _request_etag(request_id, request.version)}
+        )
 
-    @app.get("/withdrawals", response_model=WithdrawalListResponse)
+    @app.get(
+        "/withdrawals",
+        response_model=WithdrawalListResponse,
+        responses={304: {"description": "The page has not changed since the given ETag"}},
+    )
     async def list_withdrawals(
         status_filter: Optional[str] = Query(None, alias="status"),
         limit: int = Query(50, ge=1, le=200),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+        if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
         mgr: WithdrawalManager = Depends(get_manager),
-    ) -> WithdrawalListResponse:
+    ) -> Any:
         status_value: Optional[WithdrawalStatus]
         if status_filter is None:
             status_value = None
@@ -92,8 +540,21 @@ def create_app(manager: WithdrawalManager) -> FastAPI:
                 status_value = WithdrawalStatus(status_filter.lower())
             except ValueError as exc:
                 raise HTTPException(status_code=400, detail="Invalid status filter") from exc
-        requests = await mgr.store.list_requests(status=status_value, limit=limit)  # type: ignore[attr-defined]
-        return WithdrawalListResponse(withdrawals=[WithdrawalResponse.from_request(req) for req in requests])
+        try:
+            if if_none_match is not None:
+                versions, has_more = await mgr.list_versions(
+                    status=status_value, limit=limit, cursor=cursor
+                )
+                etag = _page_etag(versions, has_more)
+                if _etag_matches(if_none_match, etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            page = await mgr.list_page(status=status_value, limit=limit, cursor=cursor)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+        etag = _page_etag([(req.id or 0, req.version) for req in page.requests], page.next_cursor is not None)
+        return FastJSONResponse(
+            dumps_request_list(page.requests, page.next_cursor), headers={"ETag": etag}
+        )
 
     return app
 
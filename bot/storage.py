@@ -3,13 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
+import contextlib
 import json
+import logging
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Sequence
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, TypeVar
 
-from .models import WithdrawalRequest, WithdrawalStatus
+from .events import StatusNotifier
+from .metrics import REGISTRY, SIZE_BUCKETS
+from .models import (
+    IdempotencyRecord,
+    PendingNotification,
+    WithdrawalFilter,
+    WithdrawalPage,
+    WithdrawalRequest,
+    WithdrawalStatus,
+)
 
 
 class WithdrawalNotFoundError(LookupError):
@@ -20,39 +40,541 @@ class WithdrawalStateError(RuntimeError):
     """Raised when a withdrawal is in an unexpected state."""
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class IdempotencyKeyExistsError(RuntimeError):
+    """Raised when a create request reuses a live ``Idempotency-Key``."""
+
+    def __init__(self, record: IdempotencyRecord) -> None:
+        super().__init__(f"Idempotency key already used for request {record.request_id}")
+        self.record = record
+
+
+# Each entry upgrades the schema by one ``user_version``; append, never edit.
+_MIGRATIONS: Sequence[Sequence[str]] = (
+    (
+        """
+        CREATE TABLE IF NOT EXISTS withdrawals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            player_name TEXT NOT NULL,
+            player_uuid TEXT,
+            wallet_address TEXT NOT NULL,
+            amount TEXT NOT NULL,
+            currency TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            metadata TEXT,
+            discord_message_id INTEGER,
+            approved_by TEXT,
+            approved_by_id INTEGER,
+            transaction_id TEXT,
+            failure_reason TEXT
+        )
+        """,
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_withdrawals_created_at ON withdrawals (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_withdrawals_status_created_at ON withdrawals (status, created_at)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_withdrawals_open
+        ON withdrawals (created_at)
+        WHERE status IN ('pending', 'processing')
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_withdrawals_player_uuid ON withdrawals (player_uuid)",
+        "CREATE INDEX IF NOT EXISTS idx_withdrawals_wallet_address ON withdrawals (wallet_address)",
+    ),
+    (
+        """
+        CREATE TABLE IF NOT EXISTS notification_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            request_id INTEGER NOT NULL REFERENCES withdrawals (id),
+            attempts INTEGER NOT NULL DEFAULT 0,
+            available_at TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_notification_outbox_available_at ON notification_outbox (available_at)",
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_withdrawals_discord_message_id ON withdrawals (discord_message_id)",
+    ),
+    (
+        """
+        CREATE TABLE IF NOT EXISTS idempotency_keys (
+            key TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            request_id INTEGER NOT NULL REFERENCES withdrawals (id),
+            response TEXT NOT NULL,
+            expires_at TEXT NOT NULL
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires_at ON idempotency_keys (expires_at)",
+    ),
+    ("ALTER TABLE withdrawals ADD COLUMN version INTEGER NOT NULL DEFAULT 1",),
+    # Every status query binds the status as a parameter, which the planner
+    # cannot match against the partial index; (status, created_at) covers them.
+    ("DROP INDEX IF EXISTS idx_withdrawals_open",),
+)
+
+# Expired idempotency keys removed per keyed insert, keeping the purge cheap.
+_IDEMPOTENCY_PURGE_BATCH = 64
+
+T = TypeVar("T")
+R = TypeVar("R")
+Job = Callable[[sqlite3.Connection], T]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statement kinds worth an EXPLAIN QUERY PLAN in the slow-query log.
+_PLANNABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+
+_OPERATION_SECONDS = REGISTRY.histogram(
+    "withdrawal_store_operation_seconds",
+    "Time from submitting a store job until its result is back on the event loop",
+    ("kind",),
+)
+_READ_SECONDS = _OPERATION_SECONDS.labels("read")
+_WRITE_SECONDS = _OPERATION_SECONDS.labels("write")
+_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "withdrawal_store_queue_wait_seconds",
+    "Time a store job waited for the writer thread or a reader connection",
+    ("kind",),
+)
+_SQL_SECONDS = REGISTRY.histogram(
+    "withdrawal_store_sql_seconds", "Time spent executing a store job's SQL", ("kind",)
+)
+_THREAD_HOP_SECONDS = REGISTRY.histogram(
+    "withdrawal_store_thread_hop_seconds",
+    "Time from a job's result being ready in its thread until the event loop resumed",
+    ("kind",),
+)
+_SLOW_QUERIES = REGISTRY.counter(
+    "withdrawal_store_slow_queries_total", "Store jobs slower than the slow-query threshold", ("kind",)
+)
+# Children bound per job kind, so recording a job's phases skips ``labels()``.
+_PHASE_SECONDS = {
+    kind: (_QUEUE_WAIT_SECONDS.labels(kind), _SQL_SECONDS.labels(kind), _THREAD_HOP_SECONDS.labels(kind))
+    for kind in ("read", "write")
+}
+_COMMIT_SECONDS = REGISTRY.histogram(
+    "withdrawal_store_commit_seconds", "Duration of one group-committed write transaction"
+)
+_COMMIT_BATCH_SIZE = REGISTRY.histogram(
+    "withdrawal_store_commit_batch_size", "Write jobs sharing one commit", buckets=SIZE_BUCKETS
+)
+_CACHE_HITS = REGISTRY.counter("withdrawal_store_cache_hits_total", "Request cache hits")
+_CACHE_MISSES = REGISTRY.counter("withdrawal_store_cache_misses_total", "Request cache misses")
+_CACHE_EVICTIONS = REGISTRY.counter("withdrawal_store_cache_evictions_total", "Request cache evictions")
+_CACHE_SIZE = REGISTRY.gauge("withdrawal_store_cache_size", "Requests currently cached")
+_STATUS_WATCHES = REGISTRY.gauge(
+    "withdrawal_status_watches", "Long-poll and stream subscriptions waiting for a change, per watched request"
+)
+
+
+@dataclass(slots=True)
+class RequestCacheStats:
+    """Counters of the decoded-request cache for monitoring."""
+
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "size": self.size,
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class _RequestCache:
+    """Bounded LRU of decoded requests keyed by id.
+
+    Only touched from the event loop. Every write bumps ``epoch`` so a read
+    that started before the write cannot put its older row back afterwards.
+    Cached requests are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(capacity, 0)
+        self.epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[int, WithdrawalRequest]" = OrderedDict()
+
+    def get(self, request_id: int) -> Optional[WithdrawalRequest]:
+        request = self._entries.get(request_id)
+        if request is None:
+            self.misses += 1
+            _CACHE_MISSES.inc()
+            return None
+        self._entries.move_to_end(request_id)
+        self.hits += 1
+        _CACHE_HITS.inc()
+        return request
+
+    def peek(self, request_id: int) -> Optional[WithdrawalRequest]:
+        """Return a cached request without counting a lookup or refreshing it."""
+
+        return self._entries.get(request_id)
+
+    def fill(self, request: WithdrawalRequest, epoch: int) -> None:
+        """Cache a request read at ``epoch`` unless a write happened since."""
+
+        if epoch == self.epoch:
+            self._put(request)
+
+    def update(self, requests: Sequence[WithdrawalRequest]) -> None:
+        """Replace entries with freshly written rows."""
+
+        self.epoch += 1
+        for request in requests:
+            self._put(request)
+
+    def _put(self, request: WithdrawalRequest) -> None:
+        if self.capacity == 0 or request.id is None:
+            return
+        self._entries[request.id] = request
+        self._entries.move_to_end(request.id)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            _CACHE_EVICTIONS.inc()
+
+    def stats(self) -> RequestCacheStats:
+        return RequestCacheStats(
+            size=len(self._entries),
+            capacity=self.capacity,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+
+@dataclass(slots=True)
+class _JobTiming:
+    """Timestamps of one store job, filled in by the thread that runs it."""
+
+    queued_at: float = field(default_factory=time.perf_counter)
+    started_at: float = 0.0
+    executed_at: float = 0.0
+    finished_at: float = 0.0
+
+    def record(self, kind: str) -> None:
+        """Observe the phases that completed; called back on the event loop."""
+
+        if not self.started_at:
+            return
+        queue_wait, sql, thread_hop = _PHASE_SECONDS[kind]
+        queue_wait.observe(self.started_at - self.queued_at)
+        if self.executed_at:
+            sql.observe(self.executed_at - self.started_at)
+        if self.finished_at:
+            thread_hop.observe(time.perf_counter() - self.finished_at)
+
+
+class _StatementTracer:
+    """Slow-query log for one connection.
+
+    While enabled, SQLite reports the start of every statement with its bound
+    values expanded. A statement's duration is the gap until the next one
+    starts, or until the job ends. This duration includes fetching its rows.
+    When a job exceeds the threshold, its slowest statement is logged together
+    with its ``EXPLAIN QUERY PLAN``.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, kind: str, threshold: float) -> None:
+        self._conn = conn
+        self._kind = kind
+        self._slow_queries = _SLOW_QUERIES.labels(kind)
+        self._threshold = threshold
+        self._events: List[tuple[float, str]] = []
+        if threshold > 0:
+            conn.set_trace_callback(self._trace)
+
+    def _trace(self, statement: str) -> None:
+        self._events.append((time.perf_counter(), statement))
+
+    def begin(self) -> None:
+        self._events.clear()
+
+    def check(self, started: float, finished: float) -> None:
+        if self._threshold <= 0 or finished - started < self._threshold:
+            return
+        self._slow_queries.inc()
+        events, self._events = self._events, []
+        slowest: Optional[tuple[float, str]] = None
+        for index, (at, statement) in enumerate(events):
+            if not statement.lstrip().upper().startswith(_PLANNABLE):
+                continue
+            ends = events[index + 1][0] if index + 1 < len(events) else finished
+            if slowest is None or ends - at > slowest[0]:
+                slowest = (ends - at, statement)
+        if slowest is None:
+            _LOGGER.warning("Slow %s job took %.1f ms", self._kind, (finished - started) * 1000)
+            return
+        _LOGGER.warning(
+            "Slow %s job took %.1f ms; slowest statement (%.1f ms):\n%s\nQuery plan:\n%s",
+            self._kind,
+            (finished - started) * 1000,
+            slowest[0] * 1000,
+            slowest[1].strip(),
+            self._explain(slowest[1]),
+        )
+
+    def _explain(self, statement: str) -> str:
+        try:
+            rows = self._conn.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+        except sqlite3.Error as exc:
+            return f"  (unavailable: {exc})"
+        finally:
+            self._events.clear()
+        if not rows:
+            return "  (no table access)"
+        return "\n".join(f"  {row[3]}" for row in rows)
+
+
+class _WriterThread(threading.Thread):
+    """Dedicated thread that owns the only writable connection.
+
+    Jobs that arrive within ``commit_window`` seconds of each other (up to
+    ``max_batch`` of them) share one transaction and one commit. Each job runs
+    inside its own savepoint so a failing job only rolls back its own changes
+    and only its caller sees the error.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        commit_window: float = 0.002,
+        max_batch: int = 64,
+        slow_query_threshold: float = 0.0,
+    ) -> None:
+        super().__init__(name="withdrawal-writer", daemon=True)
+        self._conn = conn
+        self._commit_window = max(commit_window, 0.0)
+        self._max_batch = max(max_batch, 1)
+        self._tracer = _StatementTracer(conn, "write", slow_query_threshold)
+        self._jobs: "queue.SimpleQueue[Optional[tuple[Job, Future, _JobTiming]]]" = queue.SimpleQueue()
+
+    def submit(self, job: Job[T], timing: _JobTiming) -> "Future[T]":
+        future: Future[T] = Future()
+        self._jobs.put((job, future, timing))
+        return future
+
+    def stop(self) -> None:
+        self._jobs.put(None)
+
+    def run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                batch = [item]
+                stopping = self._collect(batch)
+                self._run_batch(batch)
+        finally:
+            self._conn.close()
+
+    def _collect(self, batch: List[tuple[Job, Future, _JobTiming]]) -> bool:
+        """Extend ``batch`` with jobs arriving inside the commit window.
+
+        Returns ``True`` when the stop sentinel was received.
+        """
+
+        deadline = time.monotonic() + self._commit_window
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = self._jobs.get(timeout=remaining)
+                else:
+                    item = self._jobs.get_nowait()
+            except queue.Empty:
+                return False
+            if item is None:
+                return True
+            batch.append(item)
+        return False
+
+    def _run_batch(self, batch: List[tuple[Job, Future, _JobTiming]]) -> None:
+        """Run ``batch`` in one transaction, one savepoint per job.
+
+        A job that raises only rolls back its own savepoint. If the
+        transaction itself fails, e.g. with ``database is locked``, every
+        job of the batch fails with that error and the thread carries on.
+        """
+
+        outcomes: List[tuple[Future, bool, object]] = []
+        started = time.perf_counter()
+        _COMMIT_BATCH_SIZE.observe(len(batch))
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            for job, future, timing in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._conn.execute("SAVEPOINT job")
+                timing.started_at = time.perf_counter()
+                self._tracer.begin()
+                try:
+                    result = job(self._conn)
+                except Exception as exc:
+                    self._conn.execute("ROLLBACK TO job")
+                    self._conn.execute("RELEASE job")
+                    outcomes.append((future, False, exc))
+                else:
+                    self._conn.execute("RELEASE job")
+                    outcomes.append((future, True, result))
+                finally:
+                    timing.executed_at = time.perf_counter()
+                    self._tracer.check(timing.started_at, timing.executed_at)
+            self._conn.execute("COMMIT")
+        except Exception as exc:
+            if self._conn.in_transaction:
+                with contextlib.suppress(sqlite3.Error):
+                    self._conn.execute("ROLLBACK")
+            for _, future, _ in batch:
+                # Cancelled futures refuse a result; everything else fails.
+                with contextlib.suppress(InvalidStateError):
+                    future.set_exception(exc)
+            return
+        finally:
+            finished = time.perf_counter()
+            _COMMIT_SECONDS.observe(finished - started)
+            for _, _, timing in batch:
+                timing.finished_at = finished
+        for future, ok, value in outcomes:
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)  # type: ignore[arg-type]
+
+
+class _ReaderPool:
+    """Pool of read-only connections used from a bounded set of threads."""
+
+    def __init__(self, database_path: str, size: int, *, slow_query_threshold: float = 0.0) -> None:
+        self._uri = f"{Path(database_path).resolve().as_uri()}?mode=ro"
+        self._slow_query_threshold = slow_query_threshold
+        self._idle: "queue.SimpleQueue[tuple[sqlite3.Connection, _StatementTracer]]" = queue.SimpleQueue()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="withdrawal-reader")
+
+    def submit(self, job: Job[T], timing: _JobTiming) -> "Future[T]":
+        return self._executor.submit(self._run, job, timing)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+    def _run(self, job: Job[T], timing: _JobTiming) -> T:
+        conn, tracer = self._acquire()
+        timing.started_at = time.perf_counter()
+        tracer.begin()
+        try:
+            return job(conn)
+        finally:
+            timing.executed_at = timing.finished_at = time.perf_counter()
+            tracer.check(timing.started_at, timing.executed_at)
+            self._idle.put((conn, tracer))
+
+    def _acquire(self) -> tuple[sqlite3.Connection, _StatementTracer]:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn, _StatementTracer(conn, "read", self._slow_query_threshold)
+
+
 class WithdrawalStore:
-    """Lightweight SQLite-backed persistence layer."""
+    """Lightweight SQLite-backed persistence layer.
 
-    def __init__(self, database_path: str) -> None:
-        self._database_path = database_path
-        self._conn = sqlite3.connect(self._database_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        self._lock = asyncio.Lock()
-        self._ensure_schema()
+    The database runs in WAL mode: a single writer thread owns every mutation
+    while reads are served from a pool of read-only connections, so lookups
+    never queue up behind writes. Concurrent writes are group-committed.
+    Lookups by id are served from an LRU of decoded requests that every
+    write through this store keeps up to date, and every committed status
+    transition is published on :attr:`notifier`.
+    """
 
-    def _ensure_schema(self) -> None:
-        self._conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS withdrawals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player_name TEXT NOT NULL,
-                player_uuid TEXT,
-                wallet_address TEXT NOT NULL,
-                amount TEXT NOT NULL,
-                currency TEXT NOT NULL,
-                status TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                metadata TEXT,
-                discord_message_id INTEGER,
-                approved_by TEXT,
-                approved_by_id INTEGER,
-                transaction_id TEXT,
-                failure_reason TEXT
-            )
-            """
+    def __init__(
+        self,
+        database_path: str,
+        *,
+        reader_pool_size: int = 4,
+        commit_window: float = 0.002,
+        commit_batch_size: int = 64,
+        idempotency_ttl: float = 86400.0,
+        idempotency_cache_size: int = 1024,
+        request_cache_size: int = 10000,
+        slow_query_threshold: float = 0.1,
+    ) -> None:
+        self._database_path = database_path
+        self._cache = _RequestCache(request_cache_size)
+        _CACHE_SIZE.set_function(lambda: len(self._cache._entries))
+        self.notifier = StatusNotifier()
+        _STATUS_WATCHES.set_function(lambda: self.notifier.subscriber_count)
+        self._idempotency_ttl = timedelta(seconds=idempotency_ttl)
+        self._idempotency_cache_size = idempotency_cache_size
+        self._idempotency_cache: "OrderedDict[str, IdempotencyRecord]" = OrderedDict()
+        conn = sqlite3.connect(
+            self._database_path, check_same_thread=False, isolation_level=None
         )
-        self._conn.commit()
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        self._ensure_schema(conn)
+        self._writer = _WriterThread(
+            conn,
+            commit_window=commit_window,
+            max_batch=commit_batch_size,
+            slow_query_threshold=slow_query_threshold,
+        )
+        self._writer.start()
+        self._readers: Optional[_ReaderPool] = None
+        if reader_pool_size > 0 and not _is_private_database(database_path):
+            self._readers = _ReaderPool(
+                database_path, reader_pool_size, slow_query_threshold=slow_query_threshold
+            )
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Apply pending migrations, tracked through ``PRAGMA user_version``."""
+
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        for target in range(version + 1, len(_MIGRATIONS) + 1):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _MIGRATIONS[target - 1]:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {target}")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     async def create_request(
         self,
@@ -63,66 +585,241 @@ class WithdrawalStore:
         currency: str,
         player_uuid: Optional[str] = None,
         metadata: Optional[Dict[str, object]] = None,
+        idempotency_key: Optional[str] = None,
+        fingerprint: str = "",
     ) -> WithdrawalRequest:
-        """Persist a new withdrawal request."""
+        """Persist a new withdrawal request.
 
-        payload = {
-            "player_name": player_name,
-            "player_uuid": player_uuid,
-            "wallet_address": wallet_address,
-            "amount": str(amount),
-            "currency": currency,
-            "status": WithdrawalStatus.PENDING.value,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
-            "metadata": json.dumps(metadata or {}),
-        }
+        With an ``idempotency_key`` the key and the created request's API
+        representation are stored in the same transaction. If the key is
+        still live, nothing is inserted and :class:`IdempotencyKeyExistsError`
+        carries the stored record instead.
+        """
+
+        payload = self._new_row_payload(
+            player_name=player_name,
+            wallet_address=wallet_address,
+            amount=amount,
+            currency=currency,
+            player_uuid=player_uuid,
+            metadata=metadata,
+        )
+        if idempotency_key is None:
+            return await self._write_then(lambda conn: self._insert_row(conn, payload), self._cached)
+
+        def job(conn: sqlite3.Connection) -> tuple[Optional[sqlite3.Row], IdempotencyRecord]:
+            now = datetime.utcnow()
+            existing = self._select_idempotency(conn, idempotency_key, now)
+            if existing is not None:
+                return None, existing
+            row = self._insert_row(conn, payload)
+            record = IdempotencyRecord(
+                key=idempotency_key,
+                fingerprint=fingerprint,
+                request_id=row["id"],
+                response=self._row_to_request(row).to_api_dict(),
+                expires_at=now + self._idempotency_ttl,
+            )
+            self._insert_idempotency(conn, record, now)
+            return row, record
+
+        def apply(result: tuple[Optional[sqlite3.Row], IdempotencyRecord]) -> WithdrawalRequest:
+            row, record = result
+            self._remember_idempotency(record)
+            if row is None:
+                raise IdempotencyKeyExistsError(record)
+            return self._cached(row)
+
+        return await self._write_then(job, apply)
+
+    async def get_idempotency_record(self, key: str) -> Optional[IdempotencyRecord]:
+        """Return the live record stored for ``key``, checking memory before SQLite."""
 
-        async with self._lock:
-            row = await asyncio.to_thread(self._insert_row, payload)
-        return self._row_to_request(row)
+        now = datetime.utcnow()
+        record = self._idempotency_cache.get(key)
+        if record is not None:
+            if record.expires_at > now:
+                self._idempotency_cache.move_to_end(key)
+                return record
+            del self._idempotency_cache[key]
+        record = await self._read(lambda conn: self._select_idempotency(conn, key, now))
+        if record is not None:
+            self._remember_idempotency(record)
+        return record
+
+    async def create_requests_bulk(
+        self, items: Sequence[Mapping[str, object]]
+    ) -> List[WithdrawalRequest]:
+        """Persist many withdrawal requests in a single transaction.
+
+        Each item accepts the keyword arguments of :meth:`create_request`. The
+        created requests are returned in the same order as ``items``.
+        """
+
+        if not items:
+            return []
+        payloads = [self._new_row_payload(**item) for item in items]  # type: ignore[arg-type]
+        return await self._write_then(lambda conn: self._insert_rows(conn, payloads), self._cached_many)
 
     async def set_discord_message(self, request_id: int, message_id: int) -> WithdrawalRequest:
         """Store the Discord message identifier for the request."""
 
-        async with self._lock:
-            row = await asyncio.to_thread(
-                self._update_row,
-                request_id,
-                {"discord_message_id": message_id},
-            )
-        return self._row_to_request(row)
+        return await self._write_then(
+            lambda conn: self._update_row(conn, request_id, {"discord_message_id": message_id}),
+            self._cached,
+        )
+
+    async def set_discord_message_bulk(
+        self, request_ids: Sequence[int], message_id: int
+    ) -> List[WithdrawalRequest]:
+        """Attach one Discord message (e.g. a digest) to several requests."""
+
+        if not request_ids:
+            return []
+        placeholders = ", ".join(["?"] * len(request_ids))
+        return await self._write_then(
+            lambda conn: conn.execute(
+                f"""
+                UPDATE withdrawals SET discord_message_id = ?, updated_at = ?, version = version + 1
+                WHERE id IN ({placeholders})
+                RETURNING *
+                """,
+                [message_id, datetime.utcnow().isoformat(), *request_ids],
+            ).fetchall(),
+            lambda rows: sorted(self._cached_many(rows), key=lambda request: request.id or 0),
+        )
 
     async def get_request(self, request_id: int) -> WithdrawalRequest:
-        async with self._lock:
-            row = await asyncio.to_thread(self._get_row, request_id)
+        cached = self._cache.get(request_id)
+        if cached is not None:
+            return cached
+        epoch = self._cache.epoch
+        row = await self._read(lambda conn: self._get_row(conn, request_id))
         if row is None:
             raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
-        return self._row_to_request(row)
+        request = self._row_to_request(row)
+        self._cache.fill(request, epoch)
+        return request
+
+    async def get_version(self, request_id: int) -> Optional[int]:
+        """Return the row version of a request without decoding it, or ``None`` if unknown."""
+
+        cached = self._cache.peek(request_id)
+        if cached is not None:
+            return cached.version
+        row = await self._read(
+            lambda conn: conn.execute(
+                "SELECT version FROM withdrawals WHERE id = ?", (request_id,)
+            ).fetchone()
+        )
+        return None if row is None else row["version"]
+
+    async def list_versions(
+        self,
+        *,
+        status: Optional[WithdrawalStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[List[tuple[int, int]], bool]:
+        """Return ``(id, version)`` pairs of the page :meth:`list_page` would return.
+
+        The second item tells whether a further page exists.
+        """
+
+        after = _decode_cursor(cursor) if cursor else None
+        rows = await self._read(
+            lambda conn: self._select_rows(conn, status, limit + 1, after, columns="id, version")
+        )
+        return [(row["id"], row["version"]) for row in rows[:limit]], len(rows) > limit
+
+    async def get_requests(self, request_ids: Sequence[int]) -> Dict[int, WithdrawalRequest]:
+        """Look up many requests at once; unknown ids are left out of the result.
+
+        Cached requests are served from memory and the rest are fetched with
+        a single ``WHERE id IN (...)`` query.
+        """
+
+        found: Dict[int, WithdrawalRequest] = {}
+        misses: List[int] = []
+        for request_id in dict.fromkeys(request_ids):
+            cached = self._cache.get(request_id)
+            if cached is not None:
+                found[request_id] = cached
+            else:
+                misses.append(request_id)
+        if not misses:
+            return found
+        epoch = self._cache.epoch
+        placeholders = ", ".join(["?"] * len(misses))
+        rows = await self._read(
+            lambda conn: conn.execute(
+                f"SELECT * FROM withdrawals WHERE id IN ({placeholders})", misses
+            ).fetchall()
+        )
+        for row in rows:
+            request = self._row_to_request(row)
+            self._cache.fill(request, epoch)
+            found[row["id"]] = request
+        return found
+
+    def cache_stats(self) -> RequestCacheStats:
+        """Return hit, miss and eviction counters of the request cache."""
+
+        return self._cache.stats()
+
+    async def find_by_message(self, message_id: int) -> List[WithdrawalRequest]:
+        """Return the requests attached to a Discord message."""
+
+        rows = await self._read(
+            lambda conn: conn.execute(
+                "SELECT * FROM withdrawals WHERE discord_message_id = ? ORDER BY id",
+                (message_id,),
+            ).fetchall()
+        )
+        return [self._row_to_request(row) for row in rows]
 
     async def list_requests(
-        self, *, status: Optional[WithdrawalStatus] = None, limit: int = 50
+        self,
+        *,
+        status: Optional[WithdrawalStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> List[WithdrawalRequest]:
-        async with self._lock:
-            rows = await asyncio.to_thread(self._select_rows, status, limit)
-        return [self._row_to_request(row) for row in rows]
+        page = await self.list_page(status=status, limit=limit, cursor=cursor)
+        return page.requests
+
+    async def list_page(
+        self,
+        *,
+        status: Optional[WithdrawalStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> WithdrawalPage:
+        """Return requests newest first, continuing after ``cursor`` if given.
+
+        Pages are located with a keyset seek on ``(created_at, id)``, so deep
+        pages cost the same as the first one.
+        """
+
+        after = _decode_cursor(cursor) if cursor else None
+        rows = await self._read(lambda conn: self._select_rows(conn, status, limit + 1, after))
+        requests = [self._row_to_request(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit and requests:
+            next_cursor = encode_cursor(requests[-1])
+        return WithdrawalPage(requests=requests, next_cursor=next_cursor)
 
     async def mark_processing(self, request_id: int) -> WithdrawalRequest:
-        async with self._lock:
-            request = await asyncio.to_thread(self._get_row, request_id)
-            if request is None:
-                raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
-            model = self._row_to_request(request)
-            if model.status is not WithdrawalStatus.PENDING:
-                raise WithdrawalStateError(
-                    f"Cannot move request {request_id} to processing from {model.status.value}"
-                )
-            updated = await asyncio.to_thread(
-                self._update_row,
+        return await self._write_then(
+            lambda conn: self._transition_row(
+                conn,
                 request_id,
                 {"status": WithdrawalStatus.PROCESSING.value},
-            )
-        return self._row_to_request(updated)
+                allowed=(WithdrawalStatus.PENDING,),
+                action="move request {id} to processing",
+            ),
+            self._transitioned,
+        )
 
     async def mark_approved(
         self,
@@ -132,17 +829,9 @@ class WithdrawalStore:
         admin_id: int,
         transaction_id: str,
     ) -> WithdrawalRequest:
-        async with self._lock:
-            request = await asyncio.to_thread(self._get_row, request_id)
-            if request is None:
-                raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
-            model = self._row_to_request(request)
-            if model.status not in {WithdrawalStatus.PENDING, WithdrawalStatus.PROCESSING}:
-                raise WithdrawalStateError(
-                    f"Cannot approve request {request_id} from {model.status.value}"
-                )
-            updated = await asyncio.to_thread(
-                self._update_row,
+        return await self._write_then(
+            lambda conn: self._transition_row(
+                conn,
                 request_id,
                 {
                     "status": WithdrawalStatus.APPROVED.value,
@@ -151,8 +840,11 @@ class WithdrawalStore:
                     "transaction_id": transaction_id,
                     "failure_reason": None,
                 },
-            )
-        return self._row_to_request(updated)
+                allowed=(WithdrawalStatus.PENDING, WithdrawalStatus.PROCESSING),
+                action="approve request {id}",
+            ),
+            self._transitioned,
+        )
 
     async def mark_rejected(
         self,
@@ -162,17 +854,9 @@ class WithdrawalStore:
         admin_id: int,
         reason: Optional[str],
     ) -> WithdrawalRequest:
-        async with self._lock:
-            request = await asyncio.to_thread(self._get_row, request_id)
-            if request is None:
-                raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
-            model = self._row_to_request(request)
-            if model.status not in {WithdrawalStatus.PENDING, WithdrawalStatus.PROCESSING}:
-                raise WithdrawalStateError(
-                    f"Cannot reject request {request_id} from {model.status.value}"
-                )
-            updated = await asyncio.to_thread(
-                self._update_row,
+        return await self._write_then(
+            lambda conn: self._transition_row(
+                conn,
                 request_id,
                 {
                     "status": WithdrawalStatus.REJECTED.value,
@@ -180,70 +864,477 @@ class WithdrawalStore:
                     "approved_by_id": admin_id,
                     "failure_reason": reason,
                 },
-            )
-        return self._row_to_request(updated)
+                # A processing request is already queued for payout and may be
+                # paid at any moment, so only pending requests can be rejected.
+                allowed=(WithdrawalStatus.PENDING,),
+                action="reject request {id}",
+            ),
+            self._transitioned,
+        )
+
+    async def claim_matching(self, filters: WithdrawalFilter) -> List[WithdrawalRequest]:
+        """Atomically move every pending request matching ``filters`` to processing."""
+
+        return await self._write_then(
+            lambda conn: self._transition_matching(
+                conn, filters, {"status": WithdrawalStatus.PROCESSING.value}
+            ),
+            self._transitioned_many,
+        )
+
+    async def reject_matching(
+        self,
+        filters: WithdrawalFilter,
+        *,
+        admin_name: str,
+        admin_id: int,
+        reason: Optional[str],
+    ) -> List[WithdrawalRequest]:
+        """Atomically reject every pending request matching ``filters``."""
+
+        return await self._write_then(
+            lambda conn: self._transition_matching(
+                conn,
+                filters,
+                {
+                    "status": WithdrawalStatus.REJECTED.value,
+                    "approved_by": admin_name,
+                    "approved_by_id": admin_id,
+                    "failure_reason": reason,
+                },
+            ),
+            self._transitioned_many,
+        )
 
     async def mark_failed(self, request_id: int, reason: str) -> WithdrawalRequest:
-        async with self._lock:
-            request = await asyncio.to_thread(self._get_row, request_id)
-            if request is None:
-                raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
-            updated = await asyncio.to_thread(
-                self._update_row,
+        return await self._write_then(
+            lambda conn: self._update_row(
+                conn,
                 request_id,
                 {
                     "status": WithdrawalStatus.FAILED.value,
                     "failure_reason": reason,
                 },
+            ),
+            self._transitioned,
+        )
+
+    async def release_processing(self, request_ids: Sequence[int]) -> List[WithdrawalRequest]:
+        """Put claimed requests whose payout never started back to pending."""
+
+        if not request_ids:
+            return []
+        placeholders = ", ".join(["?"] * len(request_ids))
+        return await self._write_then(
+            lambda conn: conn.execute(
+                f"""
+                UPDATE withdrawals SET status = ?, updated_at = ?, version = version + 1
+                WHERE id IN ({placeholders}) AND status = ?
+                RETURNING *
+                """,
+                [
+                    WithdrawalStatus.PENDING.value,
+                    datetime.utcnow().isoformat(),
+                    *request_ids,
+                    WithdrawalStatus.PROCESSING.value,
+                ],
+            ).fetchall(),
+            lambda rows: self._transitioned_many(sorted(rows, key=lambda row: row["id"])),
+        )
+
+    async def fail_processing(self, reason: str) -> List[WithdrawalRequest]:
+        """Mark every request still in processing as failed with ``reason``.
+
+        Called at startup: no payout is running yet, so any processing row was
+        left behind by a payout that was interrupted.
+        """
+
+        return await self._write_then(
+            lambda conn: conn.execute(
+                """
+                UPDATE withdrawals
+                SET status = ?, failure_reason = ?, updated_at = ?, version = version + 1
+                WHERE status = ?
+                RETURNING *
+                """,
+                (
+                    WithdrawalStatus.FAILED.value,
+                    reason,
+                    datetime.utcnow().isoformat(),
+                    WithdrawalStatus.PROCESSING.value,
+                ),
+            ).fetchall(),
+            lambda rows: self._transitioned_many(sorted(rows, key=lambda row: row["id"])),
+        )
+
+    async def pending_notifications(self, *, limit: int = 100) -> List[PendingNotification]:
+        """Return outbox entries that are due for delivery, oldest first."""
+
+        now = datetime.utcnow().isoformat()
+
+        def job(conn: sqlite3.Connection) -> Sequence[sqlite3.Row]:
+            return conn.execute(
+                """
+                SELECT notification_outbox.id AS outbox_id,
+                       notification_outbox.attempts AS outbox_attempts,
+                       withdrawals.*
+                FROM notification_outbox
+                JOIN withdrawals ON withdrawals.id = notification_outbox.request_id
+                WHERE notification_outbox.available_at <= ?
+                ORDER BY notification_outbox.id
+                LIMIT ?
+                """,
+                (now, limit),
+            ).fetchall()
+
+        rows = await self._read(job)
+        return [
+            PendingNotification(
+                id=row["outbox_id"],
+                attempts=row["outbox_attempts"],
+                request=self._row_to_request(row),
+            )
+            for row in rows
+        ]
+
+    async def complete_notifications(self, notification_ids: Sequence[int]) -> None:
+        """Remove delivered entries from the outbox."""
+
+        if not notification_ids:
+            return
+        placeholders = ", ".join(["?"] * len(notification_ids))
+        await self._write(
+            lambda conn: conn.execute(
+                f"DELETE FROM notification_outbox WHERE id IN ({placeholders})",
+                list(notification_ids),
+            )
+        )
+
+    async def retry_notifications(self, notification_ids: Sequence[int], *, delay: float) -> None:
+        """Count a failed delivery attempt and postpone the entries by ``delay`` seconds."""
+
+        if not notification_ids:
+            return
+        available_at = (datetime.utcnow() + timedelta(seconds=delay)).isoformat()
+        placeholders = ", ".join(["?"] * len(notification_ids))
+        await self._write(
+            lambda conn: conn.execute(
+                f"""
+                UPDATE notification_outbox
+                SET attempts = attempts + 1, available_at = ?
+                WHERE id IN ({placeholders})
+                """,
+                [available_at, *notification_ids],
             )
-        return self._row_to_request(updated)
+        )
 
     async def cleanup(self) -> None:
-        """Close the underlying database connection."""
+        """Stop the writer thread and close every database connection."""
 
-        async with self._lock:
-            await asyncio.to_thread(self._conn.close)
+        self._writer.stop()
+        await asyncio.to_thread(self._writer.join)
+        if self._readers is not None:
+            await asyncio.to_thread(self._readers.close)
 
     # Internal helpers -------------------------------------------------
 
-    def _insert_row(self, payload: Dict[str, object]) -> sqlite3.Row:
+    def _cached(self, row: sqlite3.Row) -> WithdrawalRequest:
+        request = self._row_to_request(row)
+        self._cache.update((request,))
+        return request
+
+    def _cached_many(self, rows: Sequence[sqlite3.Row]) -> List[WithdrawalRequest]:
+        requests = [self._row_to_request(row) for row in rows]
+        self._cache.update(requests)
+        return requests
+
+    def _transitioned(self, row: sqlite3.Row) -> WithdrawalRequest:
+        request = self._cached(row)
+        self.notifier.publish((request,))
+        return request
+
+    def _transitioned_many(self, rows: Sequence[sqlite3.Row]) -> List[WithdrawalRequest]:
+        requests = self._cached_many(rows)
+        self.notifier.publish(requests)
+        return requests
+
+    async def _write(self, job: Job[T]) -> T:
+        return await self._write_then(job, lambda result: result)
+
+    async def _write_then(self, job: Job[T], apply: Callable[[T], R]) -> R:
+        """Run ``job`` on the writer, then ``apply`` its result on the event loop.
+
+        ``apply`` is scheduled from a done-callback of the writer future, so the
+        cache and the notifier see every committed job, even when the caller
+        is cancelled while the job is running.
+        """
+
+        loop = asyncio.get_running_loop()
+        applied: asyncio.Future[R] = loop.create_future()
+
+        def settle(done: "Future[T]") -> None:
+            if done.cancelled():
+                applied.cancel()
+                return
+            try:
+                value = apply(done.result())
+            except Exception as exc:
+                if not applied.done():
+                    applied.set_exception(exc)
+            else:
+                if not applied.done():
+                    applied.set_result(value)
+
+        def wake(done: "Future[T]") -> None:
+            with contextlib.suppress(RuntimeError):  # the loop is already closed
+                loop.call_soon_threadsafe(settle, done)
+
+        timing = _JobTiming()
+        try:
+            with _WRITE_SECONDS.time():
+                future = self._writer.submit(job, timing)
+                future.add_done_callback(wake)
+                try:
+                    return await applied
+                except asyncio.CancelledError:
+                    # Only a job the writer has not started yet can still be dropped.
+                    future.cancel()
+                    raise
+        finally:
+            timing.record("write")
+
+    async def _read(self, job: Job[T]) -> T:
+        if self._readers is None:
+            return await self._write(job)
+        timing = _JobTiming()
+        try:
+            with _READ_SECONDS.time():
+                return await asyncio.wrap_future(self._readers.submit(job, timing))
+        finally:
+            timing.record("read")
+
+    def _insert_row(self, conn: sqlite3.Connection, payload: Dict[str, object]) -> sqlite3.Row:
         placeholders = ", ".join(payload.keys())
         values_placeholders = ", ".join(["?"] * len(payload))
         values = list(payload.values())
-        cursor = self._conn.execute(
-            f"INSERT INTO withdrawals ({placeholders}) VALUES ({values_placeholders})",
+        cursor = conn.execute(
+            f"INSERT INTO withdrawals ({placeholders}) VALUES ({values_placeholders}) RETURNING *",
             values,
         )
-        self._conn.commit()
-        return self._get_row(cursor.lastrowid)
+        row = cursor.fetchone()
+        conn.execute(
+            """
+            INSERT INTO notification_outbox (request_id, available_at, created_at)
+            VALUES (?, ?, ?)
+            """,
+            (row["id"], row["created_at"], row["created_at"]),
+        )
+        return row
+
+    def _select_idempotency(
+        self, conn: sqlite3.Connection, key: str, now: datetime
+    ) -> Optional[IdempotencyRecord]:
+        row = conn.execute(
+            """
+            SELECT key, fingerprint, request_id, response, expires_at
+            FROM idempotency_keys WHERE key = ? AND expires_at > ?
+            """,
+            (key, now.isoformat()),
+        ).fetchone()
+        if row is None:
+            return None
+        return IdempotencyRecord(
+            key=row["key"],
+            fingerprint=row["fingerprint"],
+            request_id=row["request_id"],
+            response=json.loads(row["response"]),
+            expires_at=datetime.fromisoformat(row["expires_at"]),
+        )
 
-    def _get_row(self, request_id: int) -> Optional[sqlite3.Row]:
-        cursor = self._conn.execute(
+    def _insert_idempotency(
+        self, conn: sqlite3.Connection, record: IdempotencyRecord, now: datetime
+    ) -> None:
+        conn.execute(
+            """
+            DELETE FROM idempotency_keys WHERE key IN (
+                SELECT key FROM idempotency_keys WHERE expires_at <= ? LIMIT ?
+            )
+            """,
+            (now.isoformat(), _IDEMPOTENCY_PURGE_BATCH),
+        )
+        # An expired entry for the same key may not have been purged yet.
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO idempotency_keys (key, fingerprint, request_id, response, expires_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                record.key,
+                record.fingerprint,
+                record.request_id,
+                json.dumps(record.response),
+                record.expires_at.isoformat(),
+            ),
+        )
+
+    def _remember_idempotency(self, record: IdempotencyRecord) -> None:
+        if self._idempotency_cache_size <= 0:
+            return
+        self._idempotency_cache[record.key] = record
+        self._idempotency_cache.move_to_end(record.key)
+        while len(self._idempotency_cache) > self._idempotency_cache_size:
+            self._idempotency_cache.popitem(last=False)
+
+    def _insert_rows(
+        self, conn: sqlite3.Connection, payloads: Sequence[Dict[str, object]]
+    ) -> Sequence[sqlite3.Row]:
+        columns = list(payloads[0].keys())
+        placeholders = ", ".join(columns)
+        values_placeholders = ", ".join(["?"] * len(columns))
+        # Only the writer thread inserts, so every id above the current maximum
+        # belongs to this batch.
+        (last_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM withdrawals").fetchone()
+        conn.executemany(
+            f"INSERT INTO withdrawals ({placeholders}) VALUES ({values_placeholders})",
+            [[payload[column] for column in columns] for payload in payloads],
+        )
+        conn.execute(
+            """
+            INSERT INTO notification_outbox (request_id, available_at, created_at)
+            SELECT id, created_at, created_at FROM withdrawals WHERE id > ? ORDER BY id
+            """,
+            (last_id,),
+        )
+        cursor = conn.execute(
+            "SELECT * FROM withdrawals WHERE id > ? ORDER BY id", (last_id,)
+        )
+        return cursor.fetchall()
+
+    def _get_row(self, conn: sqlite3.Connection, request_id: int) -> Optional[sqlite3.Row]:
+        cursor = conn.execute(
             "SELECT * FROM withdrawals WHERE id = ?", (request_id,)
         )
         return cursor.fetchone()
 
     def _select_rows(
-        self, status: Optional[WithdrawalStatus], limit: int
+        self,
+        conn: sqlite3.Connection,
+        status: Optional[WithdrawalStatus],
+        limit: int,
+        after: Optional[tuple[str, int]] = None,
+        *,
+        columns: str = "*",
     ) -> Sequence[sqlite3.Row]:
-        if status is None:
-            cursor = self._conn.execute(
-                "SELECT * FROM withdrawals ORDER BY created_at DESC LIMIT ?",
-                (limit,),
-            )
-        else:
-            cursor = self._conn.execute(
-                """
-                SELECT * FROM withdrawals
-                WHERE status = ?
-                ORDER BY created_at DESC
-                LIMIT ?
-                """,
-                (status.value, limit),
-            )
+        clauses: List[str] = []
+        values: List[object] = []
+        if status is not None:
+            clauses.append("status = ?")
+            values.append(status.value)
+        if after is not None:
+            clauses.append("(created_at, id) < (?, ?)")
+            values.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        values.append(limit)
+        cursor = conn.execute(
+            f"""
+            SELECT {columns} FROM withdrawals
+            {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+            """,
+            values,
+        )
         return cursor.fetchall()
 
-    def _update_row(self, request_id: int, fields: Dict[str, object]) -> sqlite3.Row:
+    def _update_row(
+        self, conn: sqlite3.Connection, request_id: int, fields: Dict[str, object]
+    ) -> sqlite3.Row:
+        row = self._execute_update(conn, request_id, fields)
+        if row is None:
+            raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
+        return row
+
+    def _transition_row(
+        self,
+        conn: sqlite3.Connection,
+        request_id: int,
+        fields: Dict[str, object],
+        *,
+        allowed: Sequence[WithdrawalStatus],
+        action: str,
+    ) -> sqlite3.Row:
+        """Apply ``fields`` only if the row is currently in one of ``allowed``.
+
+        The status check and the update happen in a single statement; the row
+        is only read back separately to explain why nothing was updated.
+        """
+
+        row = self._execute_update(conn, request_id, fields, allowed=allowed)
+        if row is not None:
+            return row
+        current = conn.execute(
+            "SELECT status FROM withdrawals WHERE id = ?", (request_id,)
+        ).fetchone()
+        if current is None:
+            raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
+        raise WithdrawalStateError(
+            f"Cannot {action.format(id=request_id)} from {current['status']}"
+        )
+
+    def _transition_matching(
+        self, conn: sqlite3.Connection, filters: WithdrawalFilter, fields: Dict[str, object]
+    ) -> List[sqlite3.Row]:
+        """Select pending rows matching ``filters`` and update them in one transaction."""
+
+        clauses = ["status = ?"]
+        values: List[object] = [WithdrawalStatus.PENDING.value]
+        if filters.currency:
+            clauses.append("currency = ?")
+            values.append(filters.currency)
+        if filters.player:
+            clauses.append("(player_name = ? OR player_uuid = ?)")
+            values.extend([filters.player, filters.player])
+        if filters.older_than is not None:
+            clauses.append("created_at <= ?")
+            values.append((datetime.utcnow() - filters.older_than).isoformat())
+        candidates = conn.execute(
+            f"""
+            SELECT id, amount FROM withdrawals
+            WHERE {' AND '.join(clauses)}
+            ORDER BY created_at, id
+            """,
+            values,
+        )
+        request_ids: List[int] = []
+        for row in candidates:
+            if filters.max_amount is not None and Decimal(row["amount"]) > filters.max_amount:
+                continue
+            request_ids.append(row["id"])
+            if len(request_ids) >= filters.limit:
+                break
+        candidates.close()
+        if not request_ids:
+            return []
+        assignments = [f"{key} = ?" for key in fields]
+        placeholders = ", ".join(["?"] * len(request_ids))
+        cursor = conn.execute(
+            f"""
+            UPDATE withdrawals SET {', '.join(assignments)}, updated_at = ?, version = version + 1
+            WHERE id IN ({placeholders}) AND status = ?
+            RETURNING *
+            """,
+            [*fields.values(), datetime.utcnow().isoformat(), *request_ids, WithdrawalStatus.PENDING.value],
+        )
+        return sorted(cursor.fetchall(), key=lambda row: row["id"])
+
+    def _execute_update(
+        self,
+        conn: sqlite3.Connection,
+        request_id: int,
+        fields: Dict[str, object],
+        *,
+        allowed: Optional[Sequence[WithdrawalStatus]] = None,
+    ) -> Optional[sqlite3.Row]:
         if not fields:
             raise ValueError("No fields provided for update")
         assignments = []
@@ -252,14 +1343,38 @@ class WithdrawalStore:
             assignments.append(f"{key} = ?")
             values.append(value)
         assignments.append("updated_at = ?")
+        assignments.append("version = version + 1")
         values.append(datetime.utcnow().isoformat())
         values.append(request_id)
         sql = f"UPDATE withdrawals SET {', '.join(assignments)} WHERE id = ?"
-        cursor = self._conn.execute(sql, values)
-        if cursor.rowcount == 0:
-            raise WithdrawalNotFoundError(f"Unknown request: {request_id}")
-        self._conn.commit()
-        return self._get_row(request_id)
+        if allowed is not None:
+            sql += f" AND status IN ({', '.join(['?'] * len(allowed))})"
+            values.extend(status.value for status in allowed)
+        cursor = conn.execute(sql + " RETURNING *", values)
+        return cursor.fetchone()
+
+    @staticmethod
+    def _new_row_payload(
+        *,
+        player_name: str,
+        wallet_address: str,
+        amount: Decimal,
+        currency: str,
+        player_uuid: Optional[str] = None,
+        metadata: Optional[Dict[str, object]] = None,
+    ) -> Dict[str, object]:
+        now = datetime.utcnow().isoformat()
+        return {
+            "player_name": player_name,
+            "player_uuid": player_uuid,
+            "wallet_address": wallet_address,
+            "amount": str(amount),
+            "currency": currency,
+            "status": WithdrawalStatus.PENDING.value,
+            "created_at": now,
+            "updated_at": now,
+            "metadata": json.dumps(metadata or {}),
+        }
 
     def _row_to_request(self, row: sqlite3.Row) -> WithdrawalRequest:
         metadata = json.loads(row["metadata"]) if row["metadata"] else {}
@@ -279,11 +1394,39 @@ class WithdrawalStore:
             approved_by_id=row["approved_by_id"],
             transaction_id=row["transaction_id"],
             failure_reason=row["failure_reason"],
+            version=row["version"],
         )
 
 
+def encode_cursor(request: WithdrawalRequest) -> str:
+    """Return an opaque cursor pointing just after ``request`` in list order."""
+
+    raw = json.dumps([request.created_at.isoformat(), request.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, request_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        datetime.fromisoformat(created_at)
+        return str(created_at), int(request_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def _is_private_database(database_path: str) -> bool:
+    """Return ``True`` for databases that other connections cannot open."""
+
+    return database_path in {"", ":memory:"} or database_path.startswith("file:")
+
+
 __all__ = [
     "WithdrawalStore",
     "WithdrawalNotFoundError",
     "WithdrawalStateError",
+    "InvalidCursorError",
+    "IdempotencyKeyExistsError",
+    "RequestCacheStats",
+    "encode_cursor",
 ]
@@ -4,36 +4,118 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import contextlib
 import logging
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 from uuid import uuid4
 
 import aiohttp
 from yarl import URL
 
+from .metrics import REGISTRY, _HistogramChild
 from .models import WithdrawalRequest
 
+_WALLET_SECONDS = REGISTRY.histogram(
+    "wallet_request_seconds",
+    "Latency of calls to the wallet backend",
+    ("client", "operation", "outcome"),
+)
+# Bound children by label values, so an observation skips ``labels()``.
+_WALLET_CHILDREN: Dict[tuple[str, str, str], _HistogramChild] = {}
+
+
+@contextlib.contextmanager
+def _observe(client: str, operation: str) -> Iterator[None]:
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        key = (client, operation, outcome)
+        child = _WALLET_CHILDREN.get(key)
+        if child is None:
+            child = _WALLET_CHILDREN[key] = _WALLET_SECONDS.labels(*key)
+        child.observe(time.perf_counter() - started)
+
 
 class WalletError(RuntimeError):
     """Raised when the wallet client fails to complete a withdrawal."""
 
 
+@dataclass(slots=True)
+class ConnectionPoolOptions:
+    """Tuning for the connection pool shared by HTTP-based wallet clients."""
+
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+
+
+@dataclass(slots=True)
+class PaymentResult:
+    """Outcome of one payout within a batch."""
+
+    request_id: int
+    transaction_id: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.transaction_id is not None and self.error is None
+
+
 class WalletClient(abc.ABC):
     """Abstract base class for cryptocurrency wallet integrations."""
 
+    async def start(self) -> None:
+        """Acquire long-lived resources before the first payout."""
+
+    async def close(self) -> None:
+        """Release resources acquired by :meth:`start`."""
+
     @abc.abstractmethod
     async def send_payment(self, request: WithdrawalRequest) -> str:
         """Send a payment for the given request and return the transaction identifier."""
 
+    async def send_payments(self, requests: Sequence[WithdrawalRequest]) -> List[PaymentResult]:
+        """Send several payments, returning one result per request in order.
+
+        The default implementation calls :meth:`send_payment` concurrently;
+        clients whose backend accepts batches should override it.
+        """
+
+        outcomes = await asyncio.gather(
+            *(self.send_payment(request) for request in requests),
+            return_exceptions=True,
+        )
+        results: List[PaymentResult] = []
+        for request, outcome in zip(requests, outcomes):
+            assert request.id is not None
+            if isinstance(outcome, BaseException):
+                results.append(PaymentResult(request.id, error=str(outcome) or type(outcome).__name__))
+            else:
+                results.append(PaymentResult(request.id, transaction_id=outcome))
+        return results
+
 
 class DummyWalletClient(WalletClient):
-    """A stand-in wallet implementation that simulates transfers."""
+    """A stand-in wallet implementation that simulates transfers.
 
-    def __init__(self, *, logger: Optional[logging.Logger] = None) -> None:
+    Each transfer takes ``latency`` seconds; benchmarks pass ``0`` to measure
+    the bridge without a simulated wallet.
+    """
+
+    def __init__(self, *, latency: float = 0.25, logger: Optional[logging.Logger] = None) -> None:
+        self._latency = max(latency, 0.0)
         self._logger = logger or logging.getLogger(__name__)
 
     async def send_payment(self, request: WithdrawalRequest) -> str:
-        await asyncio.sleep(0.25)
+        with _observe("dummy", "send_payment"):
+            await asyncio.sleep(self._latency)
         transaction_id = f"dummy-{uuid4()}"
         self._logger.info(
             "Simulated payout for request %s (%s %s) -> %s",
@@ -45,7 +127,38 @@ class DummyWalletClient(WalletClient):
         return transaction_id
 
 
-class HTTPWalletClient(WalletClient):
+class _PooledSessionWalletClient(WalletClient):
+    """Base for wallet clients that reuse one pooled :class:`aiohttp.ClientSession`."""
+
+    def __init__(self, *, timeout: float, pool: Optional[ConnectionPoolOptions]) -> None:
+        self._timeout = timeout
+        self._pool = pool or ConnectionPoolOptions()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        self._get_session()
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool.limit,
+                limit_per_host=self._pool.limit_per_host,
+                keepalive_timeout=self._pool.keepalive_timeout,
+                ttl_dns_cache=self._pool.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+
+class HTTPWalletClient(_PooledSessionWalletClient):
     """HTTP-based wallet client that calls an external payout endpoint."""
 
     def __init__(
@@ -53,22 +166,28 @@ class HTTPWalletClient(WalletClient):
         endpoint: str,
         *,
         api_key: Optional[str] = None,
+        batch_endpoint: Optional[str] = None,
         timeout: float = 30.0,
+        pool: Optional[ConnectionPoolOptions] = None,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         if not endpoint:
             raise ValueError("Wallet endpoint must be provided")
+        super().__init__(timeout=timeout, pool=pool)
         self._endpoint = endpoint
+        self._batch_endpoint = batch_endpoint
         self._api_key = api_key
-        self._timeout = timeout
         self._logger = logger or logging.getLogger(__name__)
 
-    async def send_payment(self, request: WithdrawalRequest) -> str:
+    def _headers(self) -> Dict[str, str]:
         headers = {"Content-Type": "application/json"}
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
+        return headers
 
-        payload = {
+    @staticmethod
+    def _payload(request: WithdrawalRequest) -> Dict[str, Any]:
+        return {
             "request_id": request.id,
             "player_name": request.player_name,
             "wallet_address": request.wallet_address,
@@ -77,10 +196,71 @@ class HTTPWalletClient(WalletClient):
             "metadata": request.metadata,
         }
 
-        timeout = aiohttp.ClientTimeout(total=self._timeout)
+    async def send_payments(self, requests: Sequence[WithdrawalRequest]) -> List[PaymentResult]:
+        """Pay out ``requests`` with one call to the batch endpoint, if configured.
+
+        The endpoint receives ``{"withdrawals": [...]}`` and must answer with
+        ``{"results": [{"request_id": ..., "transaction_id": ...}]}``; entries
+        may carry an ``error`` instead of a transaction identifier.
+        """
 
+        if not self._batch_endpoint:
+            return await super().send_payments(requests)
+
+        session = self._get_session()
+        body = {"withdrawals": [self._payload(request) for request in requests]}
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            with _observe("http", "send_payments"):
+                async with session.post(self._batch_endpoint, json=body, headers=self._headers()) as response:
+                    if response.status >= 400:
+                        text = await response.text()
+                        raise WalletError(
+                            f"Wallet batch request failed with status {response.status}: {text.strip()}"
+                        )
+                    data = await response.json(content_type=None)
+        except aiohttp.ClientError as exc:  # pragma: no cover - network failures
+            raise WalletError("Failed to contact wallet batch endpoint") from exc
+        except ValueError as exc:
+            raise WalletError("Wallet batch response is not valid JSON") from exc
+
+        if not isinstance(data, dict):
+            raise WalletError(f"Wallet batch response must be a JSON object, got {type(data).__name__}")
+        if not isinstance(data.get("results"), list):
+            raise WalletError("Wallet batch response is missing the results list")
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for item in data["results"]:
+            if isinstance(item, dict) and item.get("request_id") is not None:
+                by_id[str(item["request_id"])] = item
+
+        results: List[PaymentResult] = []
+        for request in requests:
+            assert request.id is not None
+            item = by_id.get(str(request.id))
+            if item is None:
+                results.append(PaymentResult(request.id, error="Missing from wallet batch response"))
+                continue
+            transaction_id = item.get("transaction_id") or item.get("txid") or item.get("id")
+            if item.get("error") or not transaction_id:
+                results.append(
+                    PaymentResult(request.id, error=str(item.get("error") or "Missing transaction identifier"))
+                )
+                continue
+            results.append(PaymentResult(request.id, transaction_id=str(transaction_id)))
+        self._logger.info(
+            "Wallet batch payout completed: %s succeeded, %s failed",
+            sum(result.ok for result in results),
+            sum(not result.ok for result in results),
+        )
+        return results
+
+    async def send_payment(self, request: WithdrawalRequest) -> str:
+        headers = self._headers()
+        payload = self._payload(request)
+
+        session = self._get_session()
+
+        try:
+            with _observe("http", "send_payment"):
                 async with session.post(self._endpoint, json=payload, headers=headers) as response:
                     if response.status >= 400:
                         body = await response.text()
@@ -90,7 +270,11 @@ class HTTPWalletClient(WalletClient):
                     data = await response.json(content_type=None)
         except aiohttp.ClientError as exc:  # pragma: no cover - network failures
             raise WalletError("Failed to contact wallet endpoint") from exc
+        except ValueError as exc:
+            raise WalletError("Wallet response is not valid JSON") from exc
 
+        if not isinstance(data, dict):
+            raise WalletError(f"Wallet response must be a JSON object, got {type(data).__name__}")
         transaction_id = (
             data.get("transaction_id")
             or data.get("txid")
@@ -108,7 +292,7 @@ class HTTPWalletClient(WalletClient):
         return transaction_id
 
 
-class PiteasWalletClient(WalletClient):
+class PiteasWalletClient(_PooledSessionWalletClient):
     """Wallet client that talks to a self-hosted Piteas API instance."""
 
     def __init__(
@@ -122,6 +306,7 @@ class PiteasWalletClient(WalletClient):
         network: str,
         priority: Optional[str] = None,
         timeout: float = 30.0,
+        pool: Optional[ConnectionPoolOptions] = None,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         if not base_url:
@@ -141,12 +326,12 @@ class PiteasWalletClient(WalletClient):
         if not base.scheme:
             raise ValueError("Piteas base URL must include a scheme (e.g. https://)")
 
+        super().__init__(timeout=timeout, pool=pool)
         self._endpoint = base / "api" / "projects" / project_id / "wallets" / wallet_id / "withdrawals"
         self._api_key = api_key
         self._asset_symbol = asset_symbol
         self._network = network
         self._priority = priority
-        self._timeout = timeout
         self._logger = logger or logging.getLogger(__name__)
 
     async def send_payment(self, request: WithdrawalRequest) -> str:
@@ -173,10 +358,10 @@ class PiteasWalletClient(WalletClient):
         if self._priority:
             payload["priority"] = self._priority
 
-        timeout = aiohttp.ClientTimeout(total=self._timeout)
+        session = self._get_session()
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            with _observe("piteas", "send_payment"):
                 async with session.post(str(self._endpoint), json=payload, headers=headers) as response:
                     if response.status >= 400:
                         body = await response.text()
@@ -206,6 +391,8 @@ class PiteasWalletClient(WalletClient):
 
 
 __all__ = [
+    "ConnectionPoolOptions",
+    "PaymentResult",
     "WalletClient",
     "WalletError",
     "DummyWalletClient",
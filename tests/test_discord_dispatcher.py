@@ -0,0 +1,103 @@
+"""Queueing, merging and shutdown of the outbound Discord dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from bot.discord_bot import DispatcherStopped, MessageDispatcher
+
+
+class _FakeMessage:
+    """Stands in for a Discord message; records every edit it receives."""
+
+    def __init__(self, message_id: int = 1, *, latency: float = 0.0) -> None:
+        self.id = message_id
+        self.channel = SimpleNamespace(id=9)
+        self.edits: List[Dict[str, Any]] = []
+        self._latency = latency
+
+    async def edit(self, **kwargs: Any) -> None:
+        await asyncio.sleep(self._latency)
+        self.edits.append(kwargs)
+
+
+def _count_dispatches(dispatcher: MessageDispatcher) -> List[Optional[float]]:
+    calls: List[Optional[float]] = []
+    dispatch_next = dispatcher._dispatch_next
+
+    def counted() -> Optional[float]:
+        result = dispatch_next()
+        calls.append(result)
+        return result
+
+    dispatcher._dispatch_next = counted  # type: ignore[method-assign]
+    return calls
+
+
+def test_queued_edits_to_one_message_are_merged() -> None:
+    async def run() -> None:
+        dispatcher = MessageDispatcher(rate_limit=100, rate_window=1)
+        dispatcher.start()
+        message = _FakeMessage(latency=0.05)
+        try:
+            first = dispatcher.edit(message, content="a")
+            await asyncio.sleep(0.01)
+            # The first edit is in flight; these two wait and are sent as one.
+            second = dispatcher.edit(message, content="b", embed="x")
+            third = dispatcher.edit(message, content="c")
+            await asyncio.wait_for(asyncio.gather(first, second, third), 2)
+        finally:
+            await dispatcher.stop()
+
+        assert message.edits == [{"content": "a"}, {"content": "c", "embed": "x"}]
+
+    asyncio.run(run())
+
+
+def test_stop_fails_queued_and_in_flight_operations() -> None:
+    async def run() -> None:
+        # One request per 100 seconds: the first edit starts, the rest queue.
+        dispatcher = MessageDispatcher(rate_limit=1, rate_window=100)
+        dispatcher.start()
+        edits = [dispatcher.edit(_FakeMessage(index, latency=10), content="a") for index in range(3)]
+        send = dispatcher.send(SimpleNamespace(id=9), content="new")
+        await asyncio.sleep(0.05)
+        await dispatcher.stop()
+
+        for future in [*edits, send]:
+            with pytest.raises(DispatcherStopped):
+                await asyncio.wait_for(future, 1)
+        with pytest.raises(DispatcherStopped):
+            await dispatcher.edit(_FakeMessage(5), content="late")
+        assert dispatcher.backlog == 0
+
+    asyncio.run(run())
+
+
+def test_idle_dispatcher_does_not_spin() -> None:
+    async def run() -> None:
+        dispatcher = MessageDispatcher(rate_limit=100, rate_window=1)
+        calls = _count_dispatches(dispatcher)
+        dispatcher.start()
+        message = _FakeMessage(latency=0.2)
+        try:
+            await asyncio.sleep(0.05)
+            assert calls == []
+
+            # While the first edit is in flight the merged follow-up cannot
+            # start; the loop must wait for it rather than poll.
+            first = dispatcher.edit(message, content="a")
+            await asyncio.sleep(0.01)
+            second = dispatcher.edit(message, content="b")
+            await asyncio.wait_for(asyncio.gather(first, second), 2)
+        finally:
+            await dispatcher.stop()
+
+        assert len(calls) < 10, calls
+        assert message.edits == [{"content": "a"}, {"content": "b"}]
+
+    asyncio.run(run())
@@ -0,0 +1,55 @@
+"""Shutdown and restart behaviour of queued payouts."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from pathlib import Path
+
+from bot.manager import WithdrawalManager
+from bot.models import WithdrawalStatus
+from bot.storage import WithdrawalStore
+from bot.wallet import DummyWalletClient
+
+
+async def _create(store: WithdrawalStore, index: int) -> int:
+    request = await store.create_request(
+        player_name=f"player{index}",
+        wallet_address=f"0x{index:040x}",
+        amount=Decimal("1.5"),
+        currency="PLS",
+    )
+    assert request.id is not None
+    return request.id
+
+
+def test_stop_returns_unstarted_payouts_and_start_fails_interrupted_ones(tmp_path: Path) -> None:
+    async def run() -> None:
+        store = WithdrawalStore(str(tmp_path / "payouts.db"), reader_pool_size=0)
+        try:
+            # One worker and a wallet that never answers in time: the first
+            # payout is cut off mid-transfer, the second never starts.
+            manager = WithdrawalManager(store, DummyWalletClient(latency=60), payout_workers=1)
+            await manager.start()
+            running, queued = await _create(store, 1), await _create(store, 2)
+            await manager.enqueue_approval(running, admin_name="admin", admin_id=1)
+            await manager.enqueue_approval(queued, admin_name="admin", admin_id=1)
+            await asyncio.sleep(0.05)
+            await manager.stop(payout_timeout=0.05)
+
+            assert (await store.get_request(running)).status is WithdrawalStatus.PROCESSING
+            assert (await store.get_request(queued)).status is WithdrawalStatus.PENDING
+
+            restarted = WithdrawalManager(store, DummyWalletClient(latency=0), payout_workers=1)
+            await restarted.start()
+            try:
+                interrupted = await store.get_request(running)
+                assert interrupted.status is WithdrawalStatus.FAILED
+                assert interrupted.failure_reason and "interrupted" in interrupted.failure_reason
+                assert (await store.get_request(queued)).status is WithdrawalStatus.PENDING
+            finally:
+                await restarted.stop()
+        finally:
+            await store.cleanup()
+
+    asyncio.run(run())
@@ -0,0 +1,112 @@
+"""EXPLAIN QUERY PLAN checks that keep the hot store queries on their indexes."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+import pytest
+
+from bot.models import WithdrawalFilter, WithdrawalStatus
+from bot.storage import WithdrawalStore
+
+StoreCall = Callable[[WithdrawalStore], Awaitable[object]]
+
+
+def _traced_plans(tmp_path: Path, call: StoreCall) -> List[str]:
+    """Run ``call`` and return the query plan of every data statement it issued."""
+
+    async def run() -> List[str]:
+        # Without readers every statement goes through the writer connection.
+        store = WithdrawalStore(
+            str(tmp_path / "plans.db"), reader_pool_size=0, request_cache_size=0, slow_query_threshold=0
+        )
+        conn: sqlite3.Connection = store._writer._conn
+        try:
+            await store.create_requests_bulk(
+                [
+                    {
+                        "player_name": f"player{index}",
+                        "wallet_address": f"0x{index:040x}",
+                        "amount": Decimal("1.5"),
+                        "currency": "PLS",
+                        "player_uuid": f"{index:032x}",
+                    }
+                    for index in range(20)
+                ]
+            )
+            statements: List[str] = []
+            conn.set_trace_callback(statements.append)
+            await call(store)
+            conn.set_trace_callback(None)
+            plans = []
+            for statement in statements:
+                if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                    rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+                    plans.append(" | ".join(row[3] for row in rows))
+            return plans
+        finally:
+            await store.cleanup()
+
+    return asyncio.run(run())
+
+
+async def _second_page(store: WithdrawalStore) -> None:
+    page = await store.list_page(status=WithdrawalStatus.PENDING, limit=5)
+    await store.list_page(status=WithdrawalStatus.PENDING, limit=5, cursor=page.next_cursor)
+
+
+@pytest.mark.parametrize(
+    ("call", "expected"),
+    [
+        pytest.param(lambda store: store.get_request(3), "USING INTEGER PRIMARY KEY", id="get_request"),
+        pytest.param(lambda store: store.get_requests([1, 2, 3]), "USING INTEGER PRIMARY KEY", id="get_requests"),
+        pytest.param(
+            lambda store: store.list_page(limit=10), "USING INDEX idx_withdrawals_created_at", id="list_all"
+        ),
+        pytest.param(
+            lambda store: store.list_page(status=WithdrawalStatus.PENDING, limit=10),
+            "USING INDEX idx_withdrawals_status_created_at",
+            id="list_by_status",
+        ),
+        pytest.param(_second_page, "USING INDEX idx_withdrawals_status_created_at", id="list_by_status_cursor"),
+        pytest.param(
+            lambda store: store.find_by_message(42),
+            "USING INDEX idx_withdrawals_discord_message_id",
+            id="find_by_message",
+        ),
+        pytest.param(
+            lambda store: store.claim_matching(WithdrawalFilter(older_than=timedelta(0), limit=5)),
+            "USING INDEX idx_withdrawals_status_created_at",
+            id="claim_matching",
+        ),
+        pytest.param(
+            lambda store: store.mark_processing(4), "USING INTEGER PRIMARY KEY", id="mark_processing"
+        ),
+    ],
+)
+def test_hot_queries_use_an_index(tmp_path: Path, call: StoreCall, expected: str) -> None:
+    plans = _traced_plans(tmp_path, call)
+
+    assert plans, "the call issued no queries"
+    for plan in plans:
+        steps = plan.split(" | ")
+        # An index-ordered scan stopped by LIMIT is fine; a bare table scan or a sort is not.
+        assert "SCAN withdrawals" not in steps, plan
+        assert not any("TEMP B-TREE" in step for step in steps), plan
+    assert any(expected in plan for plan in plans), plans
+
+
+def test_open_requests_partial_index_is_dropped(tmp_path: Path) -> None:
+    store = WithdrawalStore(str(tmp_path / "schema.db"), reader_pool_size=0)
+    asyncio.run(store.cleanup())
+
+    with sqlite3.connect(tmp_path / "schema.db") as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    assert "idx_withdrawals_open" not in indexes
+    assert "idx_withdrawals_status_created_at" in indexes
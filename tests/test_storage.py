@@ -0,0 +1,123 @@
+"""Behaviour of the store's single writer thread."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+from bot.models import WithdrawalRequest, WithdrawalStatus
+from bot.storage import WithdrawalStore, _JobTiming
+
+
+async def _create(store: WithdrawalStore, index: int = 0) -> WithdrawalRequest:
+    return await store.create_request(
+        player_name=f"player{index}",
+        wallet_address=f"0x{index:040x}",
+        amount=Decimal("1.5"),
+        currency="PLS",
+    )
+
+
+def test_failing_job_only_rolls_back_its_own_changes(tmp_path: Path) -> None:
+    async def run() -> None:
+        # A wide commit window puts all three jobs in one transaction.
+        store = WithdrawalStore(str(tmp_path / "batch.db"), reader_pool_size=0, commit_window=0.2)
+
+        def delete_then_fail(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM withdrawals")
+            raise ValueError("job failed")
+
+        try:
+            before, failed, after = await asyncio.gather(
+                _create(store, 1), store._write(delete_then_fail), _create(store, 2), return_exceptions=True
+            )
+            assert isinstance(failed, ValueError)
+            assert isinstance(before, WithdrawalRequest) and isinstance(after, WithdrawalRequest)
+            page = await store.list_page(limit=10)
+            assert sorted(request.id for request in page.requests) == sorted([before.id, after.id])
+        finally:
+            await store.cleanup()
+
+    asyncio.run(run())
+
+
+def test_concurrent_creates_get_unique_ids(tmp_path: Path) -> None:
+    async def run() -> None:
+        store = WithdrawalStore(str(tmp_path / "ids.db"))
+        try:
+            created = await asyncio.gather(*(_create(store, index) for index in range(200)))
+            ids = [request.id for request in created]
+            assert len(set(ids)) == len(ids)
+            stored = await store.get_requests([request_id for request_id in ids if request_id is not None])
+            assert sorted(stored) == sorted(ids)
+        finally:
+            await store.cleanup()
+
+    asyncio.run(run())
+
+
+def test_writer_survives_a_failed_begin(tmp_path: Path) -> None:
+    path = tmp_path / "locked.db"
+
+    async def run() -> None:
+        store = WithdrawalStore(str(path), reader_pool_size=0)
+        store._writer._conn.execute("PRAGMA busy_timeout = 50")
+        other = sqlite3.connect(path, isolation_level=None)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                await asyncio.wait_for(_create(store, 1), 5)
+            other.execute("ROLLBACK")
+
+            request = await asyncio.wait_for(_create(store, 2), 5)
+            assert store._writer.is_alive()
+            assert (await store.get_request(request.id or 0)).player_name == "player2"
+        finally:
+            other.close()
+            await store.cleanup()
+
+    asyncio.run(run())
+
+
+def test_cancelled_caller_still_updates_cache_and_subscribers(tmp_path: Path) -> None:
+    async def run() -> None:
+        # A wide commit window puts the transition and the gate job in one batch.
+        store = WithdrawalStore(str(tmp_path / "cancel.db"), reader_pool_size=0, commit_window=0.2)
+        published: List[Sequence[WithdrawalRequest]] = []
+        store.notifier.add_listener(published.append)
+        try:
+            request = await _create(store)
+            assert request.id is not None
+            entered, gate = threading.Event(), threading.Event()
+
+            def hold(conn: sqlite3.Connection) -> None:
+                entered.set()
+                gate.wait(5)
+
+            task = asyncio.create_task(store.mark_processing(request.id))
+            await asyncio.sleep(0)
+            store._writer.submit(hold, _JobTiming())
+            # The transition has run; its batch commits once the gate opens.
+            assert await asyncio.to_thread(entered.wait, 5)
+            task.cancel()
+            await asyncio.sleep(0)
+            gate.set()
+            for _ in range(100):
+                if published:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert task.cancelled()
+            assert [[item.status for item in batch] for batch in published] == [[WithdrawalStatus.PROCESSING]]
+            assert (await store.get_request(request.id)).status is WithdrawalStatus.PROCESSING
+            assert store.cache_stats().misses == 0
+        finally:
+            await store.cleanup()
+
+    asyncio.run(run())